@@ -1,45 +1,677 @@
-import mysql.connector
+from mysql.connector import pooling
+from mysql.connector.errors import PoolError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+from itertools import groupby, takewhile
+from operator import itemgetter
+import functools
+import heapq
 import logging
+import re
+import threading
+import time
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Default connection pool size. Checks are independent I/O-bound round trips and run
+# concurrently, one worker per pooled connection (connections are not thread-safe)
+MAX_CHECK_WORKERS = 8
+
+# Variable reads and mysql schema probes are shared by the checks of one run, and across runs in
+# one process per (endpoint, port, user, sql) when --metadata-cache-ttl enables reuse
+QUERY_CACHE_MAX_ENTRIES = 256
+_query_cache = OrderedDict()  # key -> (expires_at, rows), least recently used first
+_query_cache_guard = threading.Lock()  # held for _query_cache and _metadata_cache
+
+# The information_schema snapshot can be reused per (endpoint, port, user) for this long across
+# runs in one process. Off by default, since the CLI assesses each database once per process.
+METADATA_CACHE_TTL_SECONDS = 0
+# Snapshots kept at once; storing another drops expired ones, then the least recently used
+METADATA_CACHE_MAX_ENTRIES = 64
+_metadata_cache = OrderedDict()  # target -> (expires_at, snapshot), held under _query_cache_guard
+
+# Check statuses by severity. Checks that escalate per row keep an int index into this and
+# store the status name once after the loop.
+STATUS_LEVELS = ('GREEN', 'AMBER', 'RED')
+
+# System schemas skipped by every check
+EXCLUDED_SCHEMAS = ('mysql', 'sys', 'information_schema', 'performance_schema')
+# Interpolated into queries directly; safe because the names are constants, never input
+EXCLUDED_SCHEMAS_SQL = "(" + ", ".join(f"'{schema}'" for schema in EXCLUDED_SCHEMAS) + ")"
+
+# Built-in and RDS-managed accounts left out of user-level findings
+SYSTEM_USERS = frozenset({'mysql.sys', 'mysql.session', 'mysql.infoschema', 'rdsadmin'})
+
+# Column types the deprecated-features check reviews, fetched together in one columns scan
+TEMPORAL_DATA_TYPES = ('TIMESTAMP', 'DATETIME', 'TIME')
+SPATIAL_DATA_TYPES = ('GEOMETRY', 'POINT', 'LINESTRING', 'POLYGON', 'MULTIPOINT',
+                      'MULTILINESTRING', 'MULTIPOLYGON', 'GEOMETRYCOLLECTION')
+
+# Column types the functional-index check suggests expression indexes for
+FUNCTIONAL_INDEX_STRING_TYPES = ('varchar', 'char', 'text')
+FUNCTIONAL_INDEX_DATETIME_TYPES = ('datetime', 'timestamp', 'date')
+FUNCTIONAL_INDEX_COLUMNS_REPORTED = 20
+
+# System variables deprecated for 8.0, reported when the server still defines them
+DEPRECATED_VARIABLES = (
+    ('query_cache_size', 'Remove - query cache is deprecated'),
+    ('query_cache_type', 'Remove - query cache is deprecated'),
+    ('innodb_file_format', 'Remove - only Barracuda format supported'),
+    ('innodb_file_format_check', 'Remove - only Barracuda format supported'),
+    ('innodb_file_format_max', 'Remove - only Barracuda format supported'),
+    ('tx_isolation', 'Use transaction_isolation instead'),
+    ('tx_read_only', 'Use transaction_read_only instead'),
+    ('secure_auth', 'Remove - secure auth is mandatory'),
+    ('multi_range_count', 'Remove - no longer used')
+)
+
+# Variables removed in 8.0; a parameter group that sets them must change before upgrading
+REMOVED_PARAMETERS = (
+    ('innodb_file_format', 'Removed - Only Barracuda format supported'),
+    ('innodb_file_format_check', 'Removed - Only Barracuda format supported'),
+    ('innodb_file_format_max', 'Removed - Only Barracuda format supported'),
+    ('innodb_large_prefix', 'Removed - Large prefix is always enabled'),
+    ('sync_frm', 'Removed - .frm files no longer used'),
+    ('secure_auth', 'Removed - Secure authentication is mandatory'),
+    ('multi_range_count', 'Removed - No longer used'),
+    ('log_warnings', 'Use log_error_verbosity instead'),
+    ('ignore_builtin_innodb', 'Removed - InnoDB cannot be disabled'),
+    ('innodb_support_xa', 'Removed - XA support is always enabled'),
+    ('query_cache_size', 'Removed - Query cache is removed'),
+    ('query_cache_type', 'Removed - Query cache is removed'),
+    ('innodb_undo_tablespaces', 'Removed in 8.0.4 - See innodb_undo_tablespaces_implicit'),
+    ('max_tmp_tables', 'Removed - No longer used')
+)
+
+# Variables whose default changes in 8.0; the new default is compared as a string
+PARAMETER_DEFAULT_CHANGES = (
+    {
+        'param': 'explicit_defaults_for_timestamp',
+        'old_default': 'OFF',
+        'new_default': 'ON',
+        'note': 'Affects timestamp column behavior'
+    },
+    {
+        'param': 'binlog_expire_logs_seconds',
+        'old_default': None,
+        'new_default': '2592000',
+        'note': 'Replaces expire_logs_days'
+    },
+    {
+        'param': 'completion_type',
+        'old_default': '0',
+        'new_default': 'NO_CHAIN',
+        'note': 'Affects transaction completion behavior'
+    },
+    {
+        'param': 'transaction_isolation',
+        'old_default': 'REPEATABLE-READ',
+        'new_default': 'REPEATABLE-READ',
+        'note': 'Replaces tx_isolation'
+    },
+    {
+        'param': 'innodb_autoinc_lock_mode',
+        'old_default': '1',
+        'new_default': '2',
+        'note': 'Affects auto-increment locking behavior'
+    }
+)
+
+# Variables whose semantics change in 8.0; check() is True when the current value is safe
+PARAMETER_BEHAVIOR_CHANGES = (
+    {
+        'param': 'sql_mode',
+        'check': lambda x: x is None or 'NO_AUTO_CREATE_USER' not in x.split(','),
+        'note': 'NO_AUTO_CREATE_USER removed, use CREATE USER statement'
+    },
+    {
+        'param': 'innodb_flush_method',
+        'check': lambda x: x is None or x != 'ALL_O_DIRECT',
+        'note': 'ALL_O_DIRECT replaced by O_DIRECT_NO_FSYNC'
+    },
+    {
+        'param': 'max_length_for_sort_data',
+        'check': lambda x: x is None or int(x) <= 4096,
+        'note': 'Default reduced to 4096 to avoid memory issues'
+    }
+)
+
+# Variables that must hold a specific value
+_CRITICAL_PARAMETER_SPECS = (
+    {
+        'param': 'log_bin_trust_function_creators',
+        'expected': 'ON',
+        'note': 'Required for stored function creation with binary logging'
+    },
+    {
+        'param': 'enforce_gtid_consistency',
+        'expected': 'ON',
+        'note': 'Required for GTID-based replication'
+    },
+    {
+        'param': 'innodb_strict_mode',
+        'expected': 'ON',
+        'note': 'Recommended for data integrity'
+    },
+    {
+        'param': 'binlog_format',
+        'expected': 'ROW',
+        'note': 'Required for safe replication'
+    }
+)
+# The specs plus expected_upper, precomputed for the case-insensitive comparison
+CRITICAL_PARAMETERS = tuple({**param, 'expected_upper': str(param['expected']).upper()}
+                            for param in _CRITICAL_PARAMETER_SPECS)
+
+# sql_mode flags deprecated or removed in 8.0
+DEPRECATED_SQL_MODES = frozenset({'NO_AUTO_CREATE_USER', 'NO_ZERO_DATE', 'ERROR_FOR_DIVISION_BY_ZERO'})
+
+# One issue entry per foreign key, filled from the foreign-key query row
+FOREIGN_KEY_ISSUE_TEMPLATE = (
+    "  FK: {constraint_name}\n"
+    "    Table: {table_name}.{column_name}\n"
+    "    References: {referenced_table_schema}.{referenced_table_name}.{referenced_column_name}\n"
+    "    Update Rule: {update_rule}, Delete Rule: {delete_rule}\n"
+    "    Supporting Index: {supporting_index}"
+)
+
+# One issue line per duplicate_indexes entry in the index statistics check
+DUPLICATE_INDEX_ISSUE_TEMPLATE = "Duplicate indexes on {table}: '{index1}' and '{index2}' (both on {columns})"
+
+# Functions removed in MySQL 8.0 and what to use instead
+DEPRECATED_FUNCTIONS = (
+    ('PASSWORD', 'Use SHA2() instead'),
+    ('OLD_PASSWORD', 'Remove usage'),
+    ('ENCODE', 'Use AES_ENCRYPT()'),
+    ('DECODE', 'Use AES_DECRYPT()'),
+    ('ENCRYPT', 'Use SHA2() or AES_ENCRYPT()'),
+    ('DES_ENCRYPT', 'Use AES_ENCRYPT()'),
+    ('DES_DECRYPT', 'Use AES_DECRYPT()')
+)
+# Word-bounded match attributing each deprecated function call in a routine body
+DEPRECATED_FUNC_RE = re.compile(
+    r"\b(" + "|".join(f for f, _ in DEPRECATED_FUNCTIONS) + r")\s*\(", re.IGNORECASE)
+
+# Trigger and view bodies are scanned once each, case-insensitively, for these patterns
+OBJECT_DEPRECATED_FUNCTIONS = ('PASSWORD', 'OLD_PASSWORD', 'ENCRYPT')
+OBJECT_DEPRECATED_FUNC_RE = re.compile(
+    r"\b(" + "|".join(OBJECT_DEPRECATED_FUNCTIONS) + r")\s*\(", re.IGNORECASE)
+GROUP_BY_RE = re.compile(r"\bGROUP\s+BY\b", re.IGNORECASE)
+ANY_VALUE_RE = re.compile(r"\bANY_VALUE\s*\(", re.IGNORECASE)
+# Routine bodies the JSON check lists: what LIKE '%JSON_%' (JSON plus any character) or '%->%' matches
+JSON_ROUTINE_RE = re.compile(r"JSON.|->", re.IGNORECASE | re.DOTALL)
+
+# Words that became reserved in MySQL 8.0; passed to the keyword queries as parameters
+RESERVED_KEYWORDS_80 = (
+    'CUME_DIST', 'DENSE_RANK', 'EMPTY', 'EXCEPT', 'FIRST_VALUE',
+    'GROUPING', 'GROUPS', 'LAG', 'LAST_VALUE', 'LEAD', 'NTH_VALUE',
+    'NTILE', 'OVER', 'PERCENT_RANK', 'RANK', 'RECURSIVE', 'ROW_NUMBER',
+    'SYSTEM', 'WINDOW', 'JSON_TABLE', 'LATERAL', 'MEMBER', 'OF'
+)
+RESERVED_KEYWORD_SET = frozenset(RESERVED_KEYWORDS_80)
+
+# Fixed advice appended after the per-run counts in the foreign key check
+FOREIGN_KEY_RECOMMENDATIONS = (
+    "\nRecommended Actions:",
+    "1. Verify all foreign key constraints before upgrade",
+    "2. Check for missing indexes on foreign key columns",
+    "3. Consider temporarily disabling foreign keys during upgrade",
+    "4. Take backup before modifying any constraints",
+    "5. Review update and delete rules for each constraint",
+    "6. Test referential integrity after upgrade",
+    "\nSQL Commands:",
+    "-- To disable foreign key checks during upgrade:",
+    "SET foreign_key_checks = 0;",
+    "-- Don't forget to re-enable after upgrade:",
+    "SET foreign_key_checks = 1;"
+)
+
+# General 8.0 feature advice added by the new-features check on pre-8.0 servers
+NEW_FEATURE_RECOMMENDATIONS = (
+    "\nNew Feature Opportunities in 8.0:",
+    "1. Hash Joins for better join performance",
+    "2. Invisible Indexes for safe index management",
+    "3. Descending Indexes for mixed-order queries",
+    "4. Window Functions for analytical queries",
+    "5. Instant DDL for faster schema changes",
+    "6. SQL Roles for better security management",
+    "7. Check Constraints for data integrity",
+    "\nPerformance Improvements:",
+    "- Enhanced optimizer features",
+    "- Improved deadlock detection",
+    "- Better temporary table handling",
+    "- Instant DDL operations",
+    "\nSecurity Enhancements:",
+    "- New authentication plugin (caching_sha2_password)",
+    "- Role-based access control",
+    "- Enhanced password management"
+)
+
+# Fixed advice appended after the per-run counts in the triggers and views check
+TRIGGER_VIEW_RECOMMENDATIONS = (
+    "\nRecommended Actions:",
+    "1. Review all triggers and views for 8.0 compatibility",
+    "2. Test triggers and views in upgrade simulation",
+    "3. Consider temporarily disabling triggers during upgrade",
+    "4. Take backup of all view and trigger definitions",
+    "5. Check for deprecated syntax in view definitions",
+    "6. Verify trigger privileges and security settings",
+    "7. Review view dependencies and updatability",
+    "\nBackup Commands:",
+    "-- To get trigger definitions:",
+    "SHOW TRIGGERS;",
+    "-- To get view definitions:",
+    "SHOW CREATE VIEW view_name;",
+    "\nDisabling/Enabling Triggers:",
+    "-- To disable triggers on a table:",
+    "ALTER TABLE table_name DISABLE TRIGGERS;",
+    "-- To enable triggers on a table:",
+    "ALTER TABLE table_name ENABLE TRIGGERS;"
+)
+
+# Fixed advice added by the partition check when it finds an issue
+PARTITION_RECOMMENDATIONS = (
+    "Review partitioning strategy before upgrade:",
+    "- Test partition pruning effectiveness",
+    "- Consider partition consolidation for tables with >100 partitions",
+    "- Verify partition maintenance operations in non-production first",
+    "- Monitor partition-related performance post-upgrade"
+)
+
+# Fixed advice added by the user privileges check for deprecated authentication plugins
+DEPRECATED_AUTH_RECOMMENDATIONS = (
+    "Migrate users to caching_sha2_password authentication:",
+    "  ALTER USER 'user'@'host' IDENTIFIED WITH caching_sha2_password BY 'password';"
+)
+
+# Fixed advice added by the user privileges check for accounts holding SUPER
+SUPER_PRIVILEGE_RECOMMENDATIONS = (
+    "Map SUPER privilege to dynamic privileges in MySQL 8.0:",
+    "  Common mappings:",
+    "  - SUPER -> SYSTEM_VARIABLES_ADMIN (for SET GLOBAL)",
+    "  - SUPER -> REPLICATION_SLAVE_ADMIN (for replication)",
+    "  - SUPER -> BINLOG_ADMIN (for binary logs)",
+    "  Example: GRANT SYSTEM_VARIABLES_ADMIN ON *.* TO 'user'@'host';"
+)
+
+# Fixed advice added by the JSON usage check when JSON columns exist
+JSON_RECOMMENDATIONS = (
+    "JSON Optimization Opportunities in MySQL 8.0:",
+    "- Consider multi-valued indexes for JSON array fields:",
+    "  CREATE INDEX idx ON table ((CAST(json_col->'$.array[*]' AS UNSIGNED ARRAY)));",
+    "- Use JSON_TABLE() for better query performance:",
+    "  SELECT * FROM table, JSON_TABLE(json_col, '$.path[*]' COLUMNS(...)) AS jt;",
+    "- Consider functional indexes for frequently queried JSON paths:",
+    "  CREATE INDEX idx ON table ((json_col->'$.field'));",
+    "- Test new JSON functions: JSON_OVERLAPS(), JSON_VALUE(), etc."
+)
+
+# Fixed advice added by the stored routine complexity check when it finds an issue
+ROUTINE_COMPLEXITY_RECOMMENDATIONS = (
+    "Complex Stored Routine Recommendations:",
+    "- Test all stored procedures/functions thoroughly in MySQL 8.0 environment",
+    "- Consider refactoring large routines (>10KB) into smaller, manageable units",
+    "- Review dynamic SQL execution with new 8.0 parser",
+    "- Document routine dependencies before upgrade",
+    "- Test error handling and exception scenarios"
+)
+
+# Fixed advice added by the spatial SRID check, followed by its column count
+SPATIAL_SRID_RECOMMENDATIONS = (
+    "CRITICAL: All spatial columns require explicit SRID in MySQL 8.0:",
+    "1. Add SRID to spatial columns:",
+    "   ALTER TABLE schema.table MODIFY COLUMN location POINT SRID 4326;",
+    "   (Common SRIDs: 4326 for WGS84 GPS coordinates, 0 for Cartesian)",
+    "",
+    "2. Rebuild all spatial indexes after adding SRID:",
+    "   ALTER TABLE schema.table DROP INDEX spatial_idx;",
+    "   ALTER TABLE schema.table ADD SPATIAL INDEX spatial_idx(location);",
+    "",
+    "3. Update application code to specify SRID:",
+    "   ST_GeomFromText('POINT(1 1)', 4326)",
+    "   ST_GeomFromWKB(wkb_data, 4326)",
+    ""
+)
+
+# Fixed advice added by the functional index check when it finds candidate columns
+FUNCTIONAL_INDEX_RECOMMENDATIONS = (
+    "Functional Index Opportunities in MySQL 8.0:",
+    "",
+    "1. For case-insensitive string searches:",
+    "   CREATE INDEX idx_name_lower ON table ((LOWER(name)));",
+    "   Then use: SELECT * FROM table WHERE LOWER(name) = 'value';",
+    "",
+    "2. For date-based queries:",
+    "   CREATE INDEX idx_created_date ON table ((DATE(created_at)));",
+    "   CREATE INDEX idx_created_year ON table ((YEAR(created_at)));",
+    "",
+    "3. For JSON path expressions:",
+    "   CREATE INDEX idx_json_field ON table ((json_col->'$.field'));",
+    "   CREATE INDEX idx_json_array ON table ((CAST(json_col->'$.array[*]' AS UNSIGNED ARRAY)));",
+    "",
+    "Note: Test performance before deploying to production",
+    "Functional indexes work best for frequently executed queries"
+)
+
+# MySQL 8.0 feature catalogue reported by the new-features check
+NEW_FEATURES_DETAILS = {
+    'new_features': {
+        'hash_joins': {
+            'available': False,
+            'benefits': [
+                "Improved performance for large table joins without indexes",
+                "Better memory utilization for specific join types",
+                "Automatic optimization for suitable queries"
+            ],
+            'usage_examples': [
+                "SELECT /*+ HASH_JOIN(t1, t2) */ * FROM t1 JOIN t2 ON t1.id = t2.id",
+                "Optimizer automatically chooses hash joins when beneficial"
+            ]
+        },
+        'invisible_indexes': {
+            'available': False,
+            'benefits': [
+                "Test index impact before removal",
+                "Maintain indexes while preventing optimizer usage",
+                "Safe index management in production"
+            ],
+            'usage_examples': [
+                "ALTER TABLE tbl ALTER INDEX idx INVISIBLE;",
+                "CREATE INDEX idx ON tbl (col) INVISIBLE;"
+            ]
+        },
+        'descending_indexes': {
+            'available': False,
+            'benefits': [
+                "Improved performance for mixed ASC/DESC ordering",
+                "Better optimization for ORDER BY clauses",
+                "Reduced need for temporary tables"
+            ],
+            'usage_examples': [
+                "CREATE INDEX idx ON tbl (col1 ASC, col2 DESC);",
+                "Supports efficient mixed-order range scans"
+            ]
+        },
+        'window_functions': {
+            'available': False,
+            'benefits': [
+                "Advanced analytical queries",
+                "Row-based calculations within result sets",
+                "Complex reporting capabilities"
+            ],
+            'usage_examples': [
+                "ROW_NUMBER() OVER (PARTITION BY col ORDER BY col2)",
+                "LAG(), LEAD(), FIRST_VALUE(), LAST_VALUE()"
+            ]
+        },
+        'instant_ddl': {
+            'available': False,
+            'benefits': [
+                "Add/drop columns instantly",
+                "Reduced downtime for schema changes",
+                "No table copy for supported operations"
+            ],
+            'usage_examples': [
+                "ALTER TABLE tbl ADD COLUMN col1 INT DEFAULT 0, ALGORITHM=INSTANT;",
+                "Supports adding columns with defaults"
+            ]
+        },
+        'check_constraints': {
+            'available': False,
+            'benefits': [
+                "Enhanced data integrity",
+                "Better constraint management",
+                "Improved data validation"
+            ],
+            'usage_examples': [
+                "CREATE TABLE t1 (c1 INT CHECK (c1 > 10));",
+                "ALTER TABLE t1 ADD CONSTRAINT CHECK (c1 < 100);"
+            ]
+        },
+        'roles': {
+            'available': False,
+            'benefits': [
+                "Simplified user privilege management",
+                "Role-based access control",
+                "Better security management"
+            ],
+            'usage_examples': [
+                "CREATE ROLE 'app_read', 'app_write';",
+                "GRANT SELECT ON db.* TO 'app_read';"
+            ]
+        }
+    },
+    'performance_improvements': [
+        {
+            'feature': 'Instant DDL',
+            'description': "Many ALTER TABLE operations complete instantly",
+            'benefit': "Reduced downtime for schema changes",
+            'recommendation': "Use ALGORITHM=INSTANT for supported operations"
+        },
+        {
+            'feature': 'Improved InnoDB deadlock detection',
+            'description': "Better handling of deadlock scenarios",
+            'benefit': "Reduced transaction conflicts",
+            'recommendation': "Monitor deadlock patterns after upgrade"
+        },
+        {
+            'feature': 'Enhanced optimizer hints',
+            'description': "More control over query execution",
+            'benefit': "Better query optimization options",
+            'recommendation': "Review slow queries for hint opportunities"
+        },
+        {
+            'feature': 'Multi-valued indexes',
+            'description': "Index generation for JSON arrays",
+            'benefit': "Improved JSON array search performance",
+            'recommendation': "Consider for JSON array fields"
+        }
+    ],
+    'security_enhancements': [
+        {
+            'feature': 'caching_sha2_password',
+            'description': "New default authentication plugin",
+            'benefit': "Improved security with good performance",
+            'recommendation': "Plan user authentication updates"
+        },
+        {
+            'feature': 'SQL Roles',
+            'description': "Role-based privilege management",
+            'benefit': "Simplified access control",
+            'recommendation': "Design role hierarchy for applications"
+        }
+    ]
+}
+
+# Schema report keeps only the largest tables and the largest of those over the size threshold
+TOP_TABLES_REPORTED = 100
+LARGE_TABLES_REPORTED = 500
+LARGE_TABLE_BYTES = 10 * 1024 * 1024 * 1024  # 10GB
+
+# information_schema.columns fields kept in the per-run snapshot, stored column-wise
+COLUMN_SNAPSHOT_FIELDS = (
+    'table_schema', 'table_name', 'column_name', 'character_set_name',
+    'collation_name', 'column_type', 'data_type', 'character_maximum_length'
+)
+# Charset-less column types kept in the snapshot for the JSON, spatial, functional-index and
+# deprecated-features checks
+TYPED_COLUMN_DATA_TYPES = (('json',) + tuple(t.lower() for t in SPATIAL_DATA_TYPES)
+                           + FUNCTIONAL_INDEX_DATETIME_TYPES + ('time',))
+STREAM_BATCH_SIZE = 2000
+# Stage-1 scans and the snapshot keys each one fills. A scan that fails leaves its keys
+# unavailable, which fails only the checks that read them.
+METADATA_SCANS = (
+    ('_load_tables', ('schemata', 'user_schemas', 'tables', 'tables_by_key')),
+    ('_load_columns', ('columns', 'columns_by_table', 'typed_columns', 'autoinc_columns')),
+    ('_load_routines', ('routines',)),
+    ('_load_statistics', ('index_counts', 'indexed_tables', 'spatial_index_counts', 'secondary_indexes')),
+    ('_load_partitions', ('partitioned_tables',)),
+)
+# Seconds information_schema may serve cached table statistics for (the 8.0 default)
+INFORMATION_SCHEMA_STATS_EXPIRY = 86400
+
+# Largest auto-increment value per (integer type, is UNSIGNED)
+AUTOINC_MAX_VALUES = {
+    ('tinyint', False): 127,
+    ('tinyint', True): 255,
+    ('smallint', False): 32767,
+    ('smallint', True): 65535,
+    ('mediumint', False): 8388607,
+    ('mediumint', True): 16777215,
+    ('int', False): 2147483647,
+    ('int', True): 4294967295,
+    ('bigint', False): 9223372036854775807,
+    ('bigint', True): 18446744073709551615
+}
+# (max, critical above, warning above) per AUTOINC_MAX_VALUES key: integer cut-offs for the
+# >90% and >70% capacity checks, exact even where floats lose precision near BIGINT limits
+AUTOINC_THRESHOLDS = {key: (max_value, max_value * 9 // 10, max_value * 7 // 10)
+                      for key, max_value in AUTOINC_MAX_VALUES.items()}
+
+# Charset -> report list for column rows; None means not listed (utf8mb4 is the target)
+REPORTED_CHARSET_LISTS = {
+    'utf8': 'utf8mb3_columns',
+    'utf8mb3': 'utf8mb3_columns',
+    'latin1': 'latin1_columns',
+    'utf8mb4': None
+}
+
+# Per-category cap on column rows copied into a report; summary counts always cover every column
+MAX_REPORTED_COLUMNS = 1000
+# Per-list cap on object rows in the partition, user, routine and spatial details; the rows left
+# out are counted under details['truncated'], and issues and summaries still cover every object
+MAX_REPORTED_OBJECTS = 1000
+# Longest-running sessions listed by the replication check
+LONG_TRANSACTIONS_REPORTED = 50
+# Busiest user@host groups listed by the connection configuration check
+CONNECTION_GROUPS_REPORTED = 10
+# First release with SHOW REPLICA STATUS and its Replica_*/Source column names
+REPLICA_STATUS_MIN_VERSION = (8, 0, 22)
+
+
+class MetadataUnavailableError(Exception):
+    """Raised when a check reads snapshot metadata whose stage-1 scan failed."""
+    pass
+
+
+class _MetadataSnapshot(dict):
+    """
+    The stage-1 information_schema snapshot. Keys of a scan that failed are absent and
+    recorded in failures, so reading one raises that scan's error in the reading check only.
+    """
 
-class AuroraUpgradeChecker:
     def __init__(self):
+        super().__init__()
+        self.failures = {}  # key -> exception from the scan that should have filled it
+
+    def __missing__(self, key):
+        if key in self.failures:
+            raise MetadataUnavailableError(f"Could not read {key} metadata: {self.failures[key]}")
+        raise KeyError(key)
+
+
+def _lru_get(cache, key):
+    """Return the live value cached under key, marking it recently used; drop it if expired."""
+    cached = cache.get(key)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return cached[1]
+
+
+def _lru_put(cache, key, value, ttl, max_entries):
+    """Cache value under key for ttl seconds, evicting expired entries and then the oldest."""
+    now = time.monotonic()
+    for stale in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+        del cache[stale]
+    cache[key] = (now + ttl, value)
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+
+
+def _safe_check(name, subject, description):
+    """
+    Decorate a check so an unexpected exception becomes its ERROR result
+    ("Error checking <subject>: ...") instead of every check repeating the same except block.
+    """
+    def decorate(check):
+        @functools.wraps(check)
+        def run(self, cursor):
+            try:
+                return check(self, cursor)
+            except Exception as e:
+                return {
+                    'name': name,
+                    'description': description,
+                    'status': 'ERROR',
+                    'issues': [f"Error checking {subject}: {str(e)}"],
+                    'recommendations': ["Verify database permissions"]
+                }
+        return run
+    return decorate
+
+
+class AuroraUpgradeChecker:
+    def __init__(self, pool_size=MAX_CHECK_WORKERS, metadata_cache_ttl=METADATA_CACHE_TTL_SECONDS):
+        # (check, applies_to) pairs. applies_to(version, engine) returning False skips the
+        # check before it runs any SQL; None means the check always applies
+        pre_80 = self._applies_before_80
         self.checks = [
-            self._check_schema_info,
-            self._check_version_compatibility,
-            self._check_character_sets,
-            self._check_binlog_settings,
-            self._check_deprecated_features,
-            self._check_parameters,
-            self._check_foreign_keys,
-            self._check_triggers_views,
-            self._check_new_features_compatibility,
+            (self._check_schema_info, None),
+            (self._check_version_compatibility, None),
+            (self._check_character_sets, None),
+            (self._check_binlog_settings, None),
+            (self._check_deprecated_features, pre_80),
+            (self._check_parameters, pre_80),
+            (self._check_foreign_keys, None),
+            (self._check_triggers_views, None),
+            (self._check_new_features_compatibility, None),
             # New checks for comprehensive upgrade assessment
-            self._check_reserved_keywords,
-            self._check_partition_compatibility,
-            self._check_user_privileges,
-            self._check_json_usage,
-            self._check_stored_routine_complexity,
-            self._check_spatial_srid,
-            self._check_functional_index_opportunities,
-            self._check_index_statistics,
-            self._check_autoinc_exhaustion,
-            self._check_replication_topology,
-            self._check_connection_configuration
+            (self._check_reserved_keywords, pre_80),
+            (self._check_partition_compatibility, pre_80),
+            (self._check_user_privileges, None),
+            (self._check_json_usage, None),
+            (self._check_stored_routine_complexity, None),
+            (self._check_spatial_srid, None),
+            (self._check_functional_index_opportunities, None),
+            (self._check_index_statistics, None),
+            (self._check_autoinc_exhaustion, None),
+            (self._check_replication_topology, None),
+            (self._check_connection_configuration, None)
         ]
         self.db_info = None  # Store db_info for checks to access
+        self._meta_cache = None  # information_schema snapshot shared by checks, see _scan_metadata
+        self._server_vars = {}  # every global variable, snapshotted per run by _prefetch_server_vars
+        self._is_80 = None  # whether the server is already on 8.0+, set per run
+        self.metadata_cache_ttl = metadata_cache_ttl
+        # Rows from _cached_query for the current run, and the queries a worker is fetching now
+        self._run_queries = {}
+        self._queries_in_flight = set()
+        self._queries_ready = threading.Condition()
+        # mysql-connector caps a pool at CNX_POOL_MAXSIZE connections
+        self.pool_size = max(1, min(pool_size, pooling.CNX_POOL_MAXSIZE))
+        # Built lazily on the first run and reused while the target is unchanged
+        self._pool = None
+        self._pool_target = None
+        self._prepped_sessions = set()  # connection_ids of pooled sessions _prep_session has set up
+        # Each check worker keeps one connection and cursor for the whole run, see _worker_cursor
+        self._worker_state = threading.local()
+        self._worker_handles = []
+        self._worker_lock = threading.Lock()
 
     def run_checks(self, db_info, credentials):
-        conn = None
         try:
             # Store db_info for access by individual checks
             self.db_info = db_info
+            self._run_queries = {}
 
-            conn = self._get_connection(db_info, credentials)
+            self._ensure_pool(db_info, credentials)
             results = {
                 'cluster_id': db_info['identifier'],
                 'version': db_info['version'],
@@ -54,28 +686,61 @@ class AuroraUpgradeChecker:
                 }
             }
 
-            for check in self.checks:
+            outcomes = {}
+            with ThreadPoolExecutor(max_workers=self._pool.pool_size) as executor:
+                # Stage 1: the shared inputs every check reads, fetched concurrently on separate
+                # connections. They are complete before any check starts, so checks only read them.
+                server_vars_future = executor.submit(self._prefetch_server_vars)
+                self._meta_cache = self._cached_metadata()
+                if self._meta_cache is None:
+                    self._meta_cache = self._scan_metadata(executor)
                 try:
-                    check_result = check(conn)
-                    results['checks'].append(check_result)
-                    
-                    if check_result['status'] == 'RED':
-                        results['summary']['status'] = 'RED'
-                        results['summary']['blocking_issues'] += len(check_result.get('issues', []))
-                    elif check_result['status'] == 'AMBER' and results['summary']['status'] != 'RED':
-                        results['summary']['status'] = 'AMBER'
-                        results['summary']['warnings'] += len(check_result.get('issues', []))
-
-                    if check_result['status'] != 'GREEN':
-                        results['summary']['total_issues'] += len(check_result.get('issues', []))
-                except Exception as check_error:
-                    print(f"Error in check {check.__name__}: {str(check_error)}")
+                    self._server_vars = server_vars_future.result()
+                except Exception as e:
+                    # Checks read the variables themselves instead, see _all_server_vars
+                    logger.warning("Could not prefetch server variables: %s", e)
+                    self._server_vars = {}
+
+                # Stage 2: the checks themselves are independent of each other
+                version = self._server_vars.get('version') or db_info['version']
+                self._is_80 = not self._applies_before_80(version, db_info['engine'])
+                futures = {}
+                for check, applies_to in self.checks:
+                    if applies_to and not applies_to(version, db_info['engine']):
+                        outcomes[check] = self._skipped_result(check, version)
+                    else:
+                        futures[executor.submit(self._run_check, check)] = check
+                for future in as_completed(futures):
+                    check = futures[future]
+                    try:
+                        outcomes[check] = future.result()
+                    except Exception as check_error:
+                        outcomes[check] = check_error
+
+            # Fold results in declaration order so reports stay stable between runs
+            for check, _ in self.checks:
+                check_result = outcomes[check]
+                if isinstance(check_result, Exception):
+                    logger.error("Error in check %s: %s", check.__name__, check_result)
                     results['checks'].append({
                         'name': check.__name__.replace('_check_', '').replace('_', ' ').title(),
                         'status': 'ERROR',
-                        'issues': [str(check_error)],
+                        'issues': [str(check_result)],
                         'recommendations': ['Check database permissions and connectivity']
                     })
+                    continue
+
+                results['checks'].append(check_result)
+
+                if check_result['status'] == 'RED':
+                    results['summary']['status'] = 'RED'
+                    results['summary']['blocking_issues'] += len(check_result.get('issues', []))
+                elif check_result['status'] == 'AMBER' and results['summary']['status'] != 'RED':
+                    results['summary']['status'] = 'AMBER'
+                    results['summary']['warnings'] += len(check_result.get('issues', []))
+
+                if check_result['status'] != 'GREEN':
+                    results['summary']['total_issues'] += len(check_result.get('issues', []))
 
             return results
         except Exception as e:
@@ -84,57 +749,525 @@ class AuroraUpgradeChecker:
                 'message': str(e)
             }
         finally:
-            if conn:
+            self._release_worker_cursors()
+
+    @staticmethod
+    def _applies_before_80(version, engine):
+        # Upgrade-blocker checks have nothing to find on a server already at 8.0 or later
+        try:
+            return int(version.split('.')[0]) < 8
+        except (AttributeError, ValueError):
+            return True
+
+    def _server_is_80(self, cursor):
+        """Return True when the server is already on 8.0 or later, worked out once per run."""
+        if self._is_80 is None:
+            version = self._get_server_vars(cursor, ['version'])['version']
+            self._is_80 = not self._applies_before_80(version, None)
+        return self._is_80
+
+    def _supports_replica_status(self, cursor):
+        """Return True when the server has SHOW REPLICA STATUS (8.0.22+), from the variable snapshot."""
+        version = self._get_server_vars(cursor, ['version'])['version']
+        match = re.match(r"(\d+)\.(\d+)\.(\d+)", str(version or ''))
+        return match is not None and tuple(map(int, match.groups())) >= REPLICA_STATUS_MIN_VERSION
+
+    @staticmethod
+    def _cap_reported(details, *keys):
+        """Trim each details[key] list to MAX_REPORTED_OBJECTS, recording how many were dropped."""
+        for key in keys:
+            rows = details[key]
+            if len(rows) > MAX_REPORTED_OBJECTS:
+                details.setdefault('truncated', {})[key] = len(rows) - MAX_REPORTED_OBJECTS
+                details[key] = rows[:MAX_REPORTED_OBJECTS]
+
+    @staticmethod
+    def _skipped_result(check, version):
+        return {
+            'name': check.__name__.replace('_check_', '').replace('_', ' ').title(),
+            'status': 'SKIPPED',
+            'issues': [],
+            'recommendations': [],
+            'details': {'reason': f"Not applicable to MySQL {version}"}
+        }
+
+    def close(self):
+        """Disconnect the pooled connections; the next run builds a fresh pool."""
+        if self._pool is not None:
+            # Runs have released every connection by now, so checking them all out empties the
+            # pool. disconnect() is passed through to the underlying connection, whereas close()
+            # on a pooled connection would only hand it back.
+            for _ in range(self._pool.pool_size):
                 try:
-                    conn.close()
+                    conn = self._pool.get_connection()
+                except PoolError:
+                    break
                 except Exception as e:
-                    logger.exception("Error closing connection: %s", e)
-
-    def _get_connection(self, db_info, credentials):
-        return mysql.connector.connect(
+                    # A dropped connection that failed to reconnect; nothing left to close
+                    logger.debug("Skipping unusable pooled connection: %s", e)
+                    continue
+                try:
+                    conn.disconnect()
+                except Exception as e:
+                    logger.exception("Error closing pooled connection: %s", e)
+        self._pool = None
+        self._pool_target = None
+
+    def _ensure_pool(self, db_info, credentials):
+        target = (db_info['endpoint'], credentials['port'], credentials['user'])
+        if self._pool is not None and self._pool_target == target:
+            return
+        self.close()
+        self._pool = pooling.MySQLConnectionPool(
+            pool_name='aurora_chk',
+            pool_size=min(self.pool_size, len(self.checks)),
             host=db_info['endpoint'],
             user=credentials['user'],
             password=credentials['password'],
             port=credentials['port'],
-            connection_timeout=10
+            connection_timeout=10,
+            # Sessions keep their settings between checkouts so _prep_session runs once per
+            # connection; the checks only read, so there is no other session state to clear
+            pool_reset_session=False
         )
-
-    def _check_schema_info(self, conn):
-        cursor = None
+        self._pool_target = target
+        self._prepped_sessions = set()
+
+    def _get_connection(self):
+        # close() on a pooled connection hands it back to the pool rather than disconnecting
+        conn = self._pool.get_connection()
+        # 5.7 has no information_schema_stats_expiry; there innodb_stats_on_metadata (global only) decides
+        if self._caches_table_stats():
+            self._prep_session(conn)
+        return conn
+
+    def _caches_table_stats(self):
+        """Return True when the target, by its discovered version, is 8.0+ and caches table statistics."""
+        return not self._applies_before_80(self.db_info['version'], self.db_info['engine'])
+
+    def _prep_session(self, conn):
+        """
+        Let information_schema serve cached table statistics (MySQL 8.0) instead of refreshing
+        them from the storage engine per table, which parameter groups sometimes force with
+        information_schema_stats_expiry = 0. Session-scoped, so the server's setting is
+        untouched; done once per pooled connection.
+        """
+        connection_id = conn.connection_id
+        if connection_id in self._prepped_sessions:
+            return
+        cursor = conn.cursor()
         try:
+            cursor.execute(f"SET SESSION information_schema_stats_expiry = {INFORMATION_SCHEMA_STATS_EXPIRY}")
+        except Exception as e:
+            logger.debug("Could not set information_schema_stats_expiry: %s", e)
+        finally:
+            cursor.close()
+        self._prepped_sessions.add(connection_id)
+
+    def _run_check(self, check):
+        return check(self._worker_cursor())
+
+    def _worker_cursor(self):
+        """
+        Return this worker thread's cursor, opening it on the thread's first check. Checks on
+        the same worker reuse it instead of creating and closing a cursor each. Buffered so a
+        check that leaves rows unread can't break the next check's execute.
+        """
+        cursor = getattr(self._worker_state, 'cursor', None)
+        if cursor is None:
+            conn = self._get_connection()
+            cursor = conn.cursor(dictionary=True, buffered=True)
+            self._worker_state.cursor = cursor
+            with self._worker_lock:
+                self._worker_handles.append((conn, cursor))
+        return cursor
+
+    def _release_worker_cursors(self):
+        with self._worker_lock:
+            handles, self._worker_handles = self._worker_handles, []
+        for conn, cursor in handles:
+            try:
+                cursor.close()
+                conn.close()  # back to the pool
+            except Exception as e:
+                logger.exception("Error releasing worker connection: %s", e)
+        # Executor threads are per run, but don't let a stale cursor outlive its connection
+        self._worker_state = threading.local()
+
+    def _prefetch_server_vars(self):
+        """Snapshot every global variable in one SHOW GLOBAL VARIABLES round trip."""
+        with self._get_connection() as conn:
             cursor = conn.cursor(dictionary=True)
-            
-            # Get schema sizes and table counts
-            cursor.execute("""
-                SELECT 
-                    table_schema,
-                    COUNT(DISTINCT table_name) as table_count,
-                    SUM(data_length + index_length) / 1024 / 1024 as size_mb,
-                    GROUP_CONCAT(DISTINCT engine) as engines,
-                    GROUP_CONCAT(DISTINCT table_collation) as collations
-                FROM information_schema.tables
-                WHERE table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-                GROUP BY table_schema
-            """)
-            schemas = cursor.fetchall()
+            try:
+                return self._show_global_variables(cursor)
+            finally:
+                cursor.close()
 
-            # Get detailed table information
-            cursor.execute("""
-                SELECT 
+    def _show_global_variables(self, cursor):
+        """Return {name: value} for every global variable on the server."""
+        rows = self._cached_query(cursor, "SHOW GLOBAL VARIABLES")
+        return {row['Variable_name']: self._variable_value(row['Value']) for row in rows}
+
+    @staticmethod
+    def _variable_value(value):
+        """
+        Normalize a SHOW VARIABLES value. Values arrive as strings (bytes from some connector
+        builds, NULL for unset ones); numeric settings are compared as ints, everything else,
+        including ON/OFF flags, is kept as the server reports it.
+        """
+        if isinstance(value, (bytes, bytearray)):
+            value = value.decode('utf-8', 'replace')
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        return value
+
+    def _all_server_vars(self, cursor):
+        """Return the per-run variable snapshot, reading it here if the run didn't prefetch it."""
+        if not self._server_vars:
+            self._server_vars = self._show_global_variables(cursor)
+        return self._server_vars
+
+    def _get_server_vars(self, cursor, names):
+        """Return {name: value} for names, None for variables this server doesn't have."""
+        server_vars = self._all_server_vars(cursor)
+        return {name: server_vars.get(name) for name in names}
+
+    def _cached_query(self, cursor, sql, params=()):
+        """
+        Run a read-only server query once per run. Concurrent callers for the same query wait
+        on the first caller's fetch instead of all querying. With metadata_cache_ttl set, the
+        rows are also reused by later runs against the same target for that long. Returned
+        rows are shared; don't mutate them.
+        """
+        key = (self._pool_target, sql, tuple(params))
+        with self._queries_ready:
+            while key in self._queries_in_flight:
+                self._queries_ready.wait()
+            rows = self._run_queries.get(key)
+            if rows is None and self.metadata_cache_ttl > 0:
+                with _query_cache_guard:
+                    rows = _lru_get(_query_cache, key)
+            if rows is not None:
+                self._run_queries[key] = rows
+                return rows
+            self._queries_in_flight.add(key)
+
+        try:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        finally:
+            with self._queries_ready:
+                if rows is not None:
+                    self._run_queries[key] = rows
+                self._queries_in_flight.discard(key)
+                self._queries_ready.notify_all()
+
+        if self.metadata_cache_ttl > 0:
+            with _query_cache_guard:
+                _lru_put(_query_cache, key, rows, self.metadata_cache_ttl, QUERY_CACHE_MAX_ENTRIES)
+        return rows
+
+    @staticmethod
+    def _iter_rows(cursor, batch_size=STREAM_BATCH_SIZE):
+        """Yield the current result's rows in fetchmany batches. On the buffered worker cursor
+        this still avoids building every row dict at once, as fetchall would."""
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+
+    def _stream_query(self, conn, sql, params=(), dictionary=True, batch_size=STREAM_BATCH_SIZE):
+        """Yield rows from an unbuffered cursor in fetchmany batches, so callers can aggregate
+        as rows arrive instead of holding the connector's buffer and a full row list at once."""
+        cursor = conn.cursor(dictionary=dictionary, buffered=False)
+        try:
+            cursor.execute(sql, params)
+            yield from self._iter_rows(cursor, batch_size)
+        finally:
+            cursor.close()
+
+    def _cached_metadata(self):
+        """Return a snapshot an earlier run took of this target within the TTL, else None."""
+        if self.metadata_cache_ttl <= 0:
+            return None
+        with _query_cache_guard:
+            return _lru_get(_metadata_cache, self._pool_target)
+
+    def _store_metadata(self, snapshot):
+        if self.metadata_cache_ttl > 0:
+            with _query_cache_guard:
+                _lru_put(_metadata_cache, self._pool_target, snapshot,
+                         self.metadata_cache_ttl, METADATA_CACHE_MAX_ENTRIES)
+
+    def _scan_metadata(self, executor):
+        """Run the METADATA_SCANS concurrently and assemble the snapshot from what succeeded."""
+        futures = [(executor.submit(getattr(self, loader)), keys) for loader, keys in METADATA_SCANS]
+        snapshot = _MetadataSnapshot()
+        for future, keys in futures:
+            try:
+                snapshot.update(future.result())
+            except Exception as e:
+                logger.warning("Metadata scan for %s failed: %s", ', '.join(keys), e)
+                snapshot.failures.update(dict.fromkeys(keys, e))
+        # A partial snapshot is not reused; the next run scans again
+        if not snapshot.failures:
+            self._store_metadata(snapshot)
+        return snapshot
+
+    def _load_tables(self):
+        """Scan information_schema schemata and tables for the per-run metadata snapshot."""
+        with self._get_connection() as conn:
+            schemata = list(self._stream_query(conn, f"""
+                SELECT
+                    schema_name,
+                    default_character_set_name,
+                    default_collation_name
+                FROM information_schema.schemata
+                WHERE schema_name NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """))
+
+            tables = list(self._stream_query(conn, f"""
+                SELECT
                     table_schema,
                     table_name,
                     engine,
                     table_rows,
-                    data_length + index_length as size_bytes,
+                    data_length,
+                    index_length,
                     table_collation,
                     create_time,
-                    update_time
+                    update_time,
+                    table_type,
+                    auto_increment
                 FROM information_schema.tables
-                WHERE table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-                AND table_type = 'BASE TABLE'
-                ORDER BY (data_length + index_length) DESC
-            """)
-            tables = cursor.fetchall()
+                WHERE table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """))
+        return {
+            'schemata': schemata,
+            # Explicit schema lists let later information_schema queries prune by schema
+            'user_schemas': tuple(s['schema_name'] for s in schemata),
+            'tables': tables,
+            'tables_by_key': {(t['table_schema'], t['table_name']): t for t in tables}
+        }
+
+    def _load_columns(self):
+        """Scan information_schema.columns for the per-run metadata snapshot."""
+        with self._get_connection() as conn:
+            # JSON, spatial and date columns carry no character set; they are few, so plain rows
+            typed_columns = list(self._stream_query(conn, f"""
+                SELECT table_schema, table_name, column_name, column_type, data_type, is_nullable
+                FROM information_schema.columns
+                WHERE data_type IN ({', '.join(['%s'] * len(TYPED_COLUMN_DATA_TYPES))})
+                AND table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """, TYPED_COLUMN_DATA_TYPES))
+
+            # At most one per table, joined to tables.auto_increment by the exhaustion check
+            autoinc_columns = list(self._stream_query(conn, f"""
+                SELECT table_schema, table_name, column_name, data_type, column_type
+                FROM information_schema.columns
+                WHERE extra LIKE '%auto_increment%'
+                AND table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """))
+
+            # Columns can run to hundreds of thousands of rows: stream plain tuples straight
+            # into one list per field rather than keeping a dict (or tuple) per row
+            columns = {field: [] for field in COLUMN_SNAPSHOT_FIELDS}
+            field_lists = [columns[field] for field in COLUMN_SNAPSHOT_FIELDS]
+            for row in self._stream_query(conn, f"""
+                SELECT {', '.join(COLUMN_SNAPSHOT_FIELDS)}
+                FROM information_schema.columns
+                WHERE character_set_name IS NOT NULL
+                AND table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """, dictionary=False):
+                for values, value in zip(field_lists, row):
+                    values.append(value)
+
+        # Per-table indexes so checks join tables and columns with O(1) lookups
+        column_indexes_by_table = defaultdict(list)
+        for i, key in enumerate(zip(columns['table_schema'], columns['table_name'])):
+            column_indexes_by_table[key].append(i)
+
+        return {
+            'columns': columns,
+            # Plain dict: a defaultdict would insert on lookup from concurrent checks
+            'columns_by_table': dict(column_indexes_by_table),
+            'typed_columns': sorted(typed_columns, key=itemgetter('table_schema', 'table_name', 'column_name')),
+            'autoinc_columns': sorted(autoinc_columns, key=itemgetter('table_schema', 'table_name', 'column_name'))
+        }
+
+    def _load_routines(self):
+        """Scan information_schema.routines for the per-run metadata snapshot."""
+        with self._get_connection() as conn:
+            routines = list(self._stream_query(conn, f"""
+                SELECT
+                    routine_schema,
+                    routine_name,
+                    routine_type,
+                    routine_definition,
+                    created,
+                    last_altered,
+                    definer,
+                    security_type,
+                    sql_data_access,
+                    is_deterministic
+                FROM information_schema.routines
+                WHERE routine_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """))
+        return {
+            'routines': sorted((self._classify_routine(r) for r in routines),
+                               key=itemgetter('routine_schema', 'routine_name'))
+        }
+
+    def _load_statistics(self):
+        """Scan information_schema.statistics for the per-run metadata snapshot."""
+        with self._get_connection() as conn:
+            statistics = list(self._stream_query(conn, f"""
+                SELECT
+                    table_schema,
+                    table_name,
+                    index_name,
+                    seq_in_index,
+                    column_name,
+                    index_type,
+                    non_unique,
+                    cardinality
+                FROM information_schema.statistics
+                WHERE table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """))
+        return self._index_statistics(statistics)
+
+    def _load_partitions(self):
+        """Scan information_schema.partitions for the per-run metadata snapshot."""
+        with self._get_connection() as conn:
+            # Only per-table totals are used, so the server folds partitions to one row per
+            # table; every partition of a table shares its partitioning method
+            partitioned_tables = list(self._stream_query(conn, f"""
+                SELECT
+                    table_schema,
+                    table_name,
+                    MIN(partition_method) as partition_method,
+                    COUNT(*) as partition_count
+                FROM information_schema.partitions
+                WHERE table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+                AND partition_name IS NOT NULL
+                GROUP BY table_schema, table_name
+            """))
+        return {'partitioned_tables': sorted(partitioned_tables, key=itemgetter('table_schema', 'table_name'))}
+
+    @staticmethod
+    def _index_statistics(statistics):
+        """Build the snapshot's per-column index counts and secondary index list."""
+        # Counters stand in for the per-column COUNT(*) subqueries on statistics; a Counter
+        # lookup of a missing key returns 0 without inserting, so concurrent reads are safe
+        index_counts = Counter()
+        spatial_index_counts = Counter()
+        secondary_indexes = {}
+        for s in sorted(statistics, key=itemgetter('table_schema', 'table_name', 'index_name', 'seq_in_index')):
+            column_key = (s['table_schema'], s['table_name'], s['column_name'])
+            index_counts[column_key] += 1
+            if s['index_type'] == 'SPATIAL':
+                spatial_index_counts[column_key] += 1
+            if s['index_name'] == 'PRIMARY':
+                continue
+            # One entry per secondary index, as GROUP BY index with GROUP_CONCAT(column_name)
+            index = secondary_indexes.get((s['table_schema'], s['table_name'], s['index_name']))
+            if index is None:
+                index = secondary_indexes[(s['table_schema'], s['table_name'], s['index_name'])] = {
+                    'table_schema': s['table_schema'],
+                    'table_name': s['table_name'],
+                    'index_name': s['index_name'],
+                    'columns': [],
+                    'index_type': s['index_type'],
+                    'non_unique': s['non_unique'],
+                    'max_cardinality': None
+                }
+            index['columns'].append(s['column_name'])
+            if s['cardinality'] is not None and (index['max_cardinality'] is None
+                                                 or s['cardinality'] > index['max_cardinality']):
+                index['max_cardinality'] = s['cardinality']
+        for index in secondary_indexes.values():
+            index['columns'] = ','.join(index['columns'])
+
+        return {
+            'index_counts': index_counts,
+            'indexed_tables': frozenset((schema, table) for schema, table, _ in index_counts),
+            'spatial_index_counts': spatial_index_counts,
+            'secondary_indexes': list(secondary_indexes.values())
+        }
+
+    @staticmethod
+    def _classify_routine(routine):
+        """Return the routine row plus what the routine checks look for, from one pass over
+        its body. definition_length counts bytes, as LENGTH(routine_definition) would."""
+        definition = routine['routine_definition']
+        if definition is None:
+            # Hidden from accounts without privileges on the routine
+            return {**routine, 'definition_length': None, 'uses_json': False,
+                    'uses_dynamic_sql': False, 'deprecated_functions': frozenset()}
+        upper = definition.upper()
+        return {
+            **routine,
+            'definition_length': len(definition.encode('utf-8')),
+            'uses_json': JSON_ROUTINE_RE.search(definition) is not None,
+            # As LIKE '%PREPARE%' AND LIKE '%EXECUTE%', in either order
+            'uses_dynamic_sql': 'PREPARE' in upper and 'EXECUTE' in upper,
+            'deprecated_functions': frozenset(m.upper() for m in DEPRECATED_FUNC_RE.findall(definition))
+        }
+
+    def _check_schema_info(self, cursor):
+        try:
+            # One pass over the snapshot: per-schema rollup (as GROUP BY table_schema WITH ROLLUP
+            # would give) and grand totals in exact bytes, plus the >10GB tables and a bounded
+            # top-N by size instead of copying every table into the result
+            per_schema = defaultdict(lambda: {'table_count': 0, 'size_bytes': None,
+                                              'engines': set(), 'collations': set()})
+            total_size_bytes = 0
+            total_tables = 0
+            total_rows = 0
+            large_tables = []
+            top_heap = []
+            for position, t in enumerate(self._meta_cache['tables']):
+                size_bytes = None
+                if t['data_length'] is not None and t['index_length'] is not None:
+                    size_bytes = t['data_length'] + t['index_length']
+
+                schema_agg = per_schema[t['table_schema']]
+                schema_agg['table_count'] += 1
+                if size_bytes is not None:
+                    schema_agg['size_bytes'] = (schema_agg['size_bytes'] or 0) + size_bytes
+                    total_size_bytes += size_bytes
+                if t['engine']:
+                    schema_agg['engines'].add(t['engine'])
+                if t['table_collation']:
+                    schema_agg['collations'].add(t['table_collation'])
+
+                if t['table_type'] != 'BASE TABLE':
+                    continue
+                total_tables += 1
+                total_rows += t['table_rows'] or 0
+                if size_bytes and size_bytes > LARGE_TABLE_BYTES:
+                    large_tables.append((size_bytes, -position, t))
+                # position breaks ties so the heap never compares rows
+                entry = (size_bytes if size_bytes is not None else -1, -position, t, size_bytes)
+                if len(top_heap) < TOP_TABLES_REPORTED:
+                    heapq.heappush(top_heap, entry)
+                elif entry[:2] > top_heap[0][:2]:
+                    heapq.heapreplace(top_heap, entry)
+
+            schemas = [{
+                'table_schema': schema_name,
+                'table_count': agg['table_count'],
+                'size_mb': agg['size_bytes'] / 1024 / 1024 if agg['size_bytes'] is not None else None,
+                'engines': ','.join(sorted(agg['engines'])) or None,
+                'collations': ','.join(sorted(agg['collations'])) or None
+            } for schema_name, agg in sorted(per_schema.items())]
+            top_tables = [self._table_summary(t, size_bytes)
+                          for _, _, t, size_bytes in sorted(top_heap, key=lambda e: e[:2], reverse=True)]
+            large_table_count = len(large_tables)
+            large_tables = [self._table_summary(t, size_bytes)
+                            for size_bytes, _, t in heapq.nlargest(LARGE_TABLES_REPORTED, large_tables,
+                                                                    key=lambda e: e[:2])]
 
             result = {
                 'name': 'Schema Information',
@@ -144,21 +1277,20 @@ class AuroraUpgradeChecker:
                 'recommendations': [],
                 'details': {
                     'schemas': schemas,
-                    'tables': tables,
+                    'top_tables': top_tables,
+                    'large_tables': large_tables,
                     'summary': {
                         'total_schemas': len(schemas),
-                        'total_tables': len(tables),
-                        'total_size_mb': sum(schema['size_mb'] for schema in schemas if schema['size_mb']),
-                        'engines_used': set(engine 
-                                         for schema in schemas 
-                                         if schema['engines']
-                                         for engine in schema['engines'].split(','))
+                        'total_tables': total_tables,
+                        'large_tables': large_table_count,
+                        'total_rows': total_rows,
+                        'total_size_mb': total_size_bytes / 1024 / 1024,
+                        'engines_used': set().union(*(agg['engines'] for agg in per_schema.values()))
                     }
                 }
             }
 
             # Check for potential issues
-            large_tables = [t for t in tables if t['size_bytes'] and t['size_bytes'] > 10 * 1024 * 1024 * 1024]  # 10GB
             if large_tables:
                 result['status'] = 'AMBER'
                 result['issues'].extend([
@@ -168,31 +1300,41 @@ class AuroraUpgradeChecker:
                 ])
                 result['recommendations'].extend([
                     "Consider partitioning large tables before upgrade",
-                    f"Total large tables (>10GB): {len(large_tables)}",
+                    f"Total large tables (>10GB): {large_table_count}",
                     "Review table statistics and index usage"
                 ])
 
             return result
         except Exception as e:
             raise Exception(f"Schema information check failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_version_compatibility(self, conn):
-        cursor = None
+    @staticmethod
+    def _table_summary(t, size_bytes):
+        return {
+            'table_schema': t['table_schema'],
+            'table_name': t['table_name'],
+            'engine': t['engine'],
+            'table_rows': t['table_rows'],
+            'size_bytes': size_bytes,
+            'table_collation': t['table_collation'],
+            'create_time': t['create_time'],
+            'update_time': t['update_time']
+        }
+
+    def _check_version_compatibility(self, cursor):
         try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT 
-                    @@version as version,
-                    @@version_comment as version_comment,
-                    @@version_compile_os as version_compile_os,
-                    @@version_compile_machine as version_compile_machine,
-                    @@character_set_server as charset_server,
-                    @@collation_server as collation_server
-            """)
-            version_info = cursor.fetchone()
+            server_vars = self._get_server_vars(cursor, [
+                'version', 'version_comment', 'version_compile_os', 'version_compile_machine',
+                'character_set_server', 'collation_server'
+            ])
+            version_info = {
+                'version': server_vars['version'],
+                'version_comment': server_vars['version_comment'],
+                'version_compile_os': server_vars['version_compile_os'],
+                'version_compile_machine': server_vars['version_compile_machine'],
+                'charset_server': server_vars['character_set_server'],
+                'collation_server': server_vars['collation_server']
+            }
 
             result = {
                 'name': 'Version Compatibility',
@@ -220,59 +1362,31 @@ class AuroraUpgradeChecker:
             return result
         except Exception as e:
             raise Exception(f"Version check failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_character_sets(self, conn):
-        cursor = None
+    def _check_character_sets(self, cursor):
         try:
-            cursor = conn.cursor(dictionary=True)
-
             # Get server-level character set configuration
-            cursor.execute("""
-                SELECT
-                    @@character_set_server as character_set_server,
-                    @@collation_server as collation_server,
-                    @@character_set_database as character_set_database,
-                    @@collation_database as collation_database
-            """)
-            server_config = cursor.fetchone()
+            server_config = self._get_server_vars(cursor, [
+                'character_set_server', 'collation_server', 'character_set_database', 'collation_database'
+            ])
 
-            # Get schema character sets
-            cursor.execute("""
-                SELECT
-                    schema_name,
-                    default_character_set_name,
-                    default_collation_name
-                FROM information_schema.schemata
-                WHERE schema_name NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-            """)
-            schema_charsets = cursor.fetchall() or []
+            # Schema character sets, from the cached metadata
+            schema_charsets = self._meta_cache['schemata']
 
-            # Get detailed character set information for tables and columns
+            # Character set information for text columns of base tables, from the cached metadata
             # IMPORTANT: Only include columns that actually have character sets (exclude numeric types)
-            cursor.execute("""
-                SELECT
-                    t.table_schema,
-                    t.table_name,
-                    t.table_collation,
-                    c.column_name,
-                    c.character_set_name,
-                    c.collation_name,
-                    c.column_type,
-                    c.data_type
-                FROM information_schema.tables t
-                JOIN information_schema.columns c
-                    ON t.table_schema = c.table_schema
-                    AND t.table_name = c.table_name
-                WHERE c.character_set_name IS NOT NULL
-                AND c.data_type IN ('char', 'varchar', 'text', 'tinytext', 'mediumtext', 'longtext', 'enum', 'set')
-                AND t.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-                AND t.table_type = 'BASE TABLE'
-                ORDER BY t.table_schema, t.table_name, c.column_name
-            """)
-            all_charset_columns = cursor.fetchall() or []
+            charset_types = {'char', 'varchar', 'text', 'tinytext', 'mediumtext', 'longtext', 'enum', 'set'}
+            tables_by_key = self._meta_cache['tables_by_key']
+            cols = self._meta_cache['columns']
+            col_schemas, col_tables, col_charsets = cols['table_schema'], cols['table_name'], cols['character_set_name']
+            col_types = cols['data_type']
+            selected = []
+            for key, indexes in self._meta_cache['columns_by_table'].items():
+                table = tables_by_key.get(key)
+                if table and table['table_type'] == 'BASE TABLE':
+                    selected.extend(i for i in indexes if col_types[i] in charset_types)
+            selected.sort(key=lambda i: (col_schemas[i], col_tables[i], cols['column_name'][i]))
+            charset_counts = Counter(col_charsets[i] for i in selected)
 
             result = {
                 'name': 'Character Set Check',
@@ -287,44 +1401,42 @@ class AuroraUpgradeChecker:
                     'latin1_columns': [],
                     'other_charset_columns': [],
                     'summary': {
-                        'total_columns_reviewed': len(all_charset_columns),
-                        'utf8mb3_count': 0,
-                        'latin1_count': 0,
-                        'utf8mb4_count': 0,
+                        'total_columns_reviewed': len(selected),
+                        'utf8mb3_count': charset_counts['utf8'] + charset_counts['utf8mb3'],
+                        'latin1_count': charset_counts['latin1'],
+                        'utf8mb4_count': charset_counts['utf8mb4'],
                         'other_count': 0
                     }
                 }
             }
 
-            # Categorize columns by charset
-            utf8mb3_columns = []
-            latin1_columns = []
-            other_charset_columns = []
-
-            for col in all_charset_columns:
-                charset = col.get('character_set_name', '')
-
-                if charset in ['utf8', 'utf8mb3']:
-                    utf8mb3_columns.append(col)
-                    result['details']['summary']['utf8mb3_count'] += 1
-                elif charset == 'latin1':
-                    latin1_columns.append(col)
-                    result['details']['summary']['latin1_count'] += 1
-                elif charset == 'utf8mb4':
-                    result['details']['summary']['utf8mb4_count'] += 1
-                else:
-                    other_charset_columns.append(col)
-                    result['details']['summary']['other_count'] += 1
+            summary = result['details']['summary']
+            summary['other_count'] = (
+                len(selected) - summary['utf8mb3_count'] - summary['latin1_count'] - summary['utf8mb4_count']
+            )
 
-            result['details']['utf8mb3_columns'] = utf8mb3_columns
-            result['details']['latin1_columns'] = latin1_columns
-            result['details']['other_charset_columns'] = other_charset_columns
+            # One pass routes each column to its report list; only the first MAX_REPORTED_COLUMNS
+            # of each are materialized, and the pass ends early once every list is full
+            report_lists = {'utf8mb3_columns': [], 'latin1_columns': [], 'other_charset_columns': []}
+            open_lists = len(report_lists)
+            for i in selected:
+                list_name = REPORTED_CHARSET_LISTS.get(col_charsets[i], 'other_charset_columns')
+                if list_name is None:
+                    continue
+                rows = report_lists[list_name]
+                if len(rows) < MAX_REPORTED_COLUMNS:
+                    rows.append(self._charset_column_row(cols, i, tables_by_key))
+                    if len(rows) == MAX_REPORTED_COLUMNS:
+                        open_lists -= 1
+                        if not open_lists:
+                            break
+            result['details'].update(report_lists)
 
             # Check for utf8/utf8mb3 usage (AMBER - not blocking)
-            if utf8mb3_columns:
+            if summary['utf8mb3_count']:
                 result['status'] = 'AMBER'
                 result['issues'].append(
-                    f"Found {len(utf8mb3_columns)} columns using utf8/utf8mb3 character set"
+                    f"Found {summary['utf8mb3_count']} columns using utf8/utf8mb3 character set"
                 )
                 result['recommendations'].extend([
                     "",
@@ -342,11 +1454,11 @@ class AuroraUpgradeChecker:
                 ])
 
             # Check for latin1 usage (Informational only - not a blocker)
-            if latin1_columns:
+            if summary['latin1_count']:
                 if result['status'] == 'GREEN':
                     result['status'] = 'AMBER'
                 result['issues'].append(
-                    f"Found {len(latin1_columns)} columns using latin1 character set (informational)"
+                    f"Found {summary['latin1_count']} columns using latin1 character set (informational)"
                 )
                 result['recommendations'].extend([
                     "",
@@ -389,27 +1501,29 @@ class AuroraUpgradeChecker:
             return result
         except Exception as e:
             raise Exception(f"Character set check failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_binlog_settings(self, conn):
-        cursor = None
+    @staticmethod
+    def _charset_column_row(cols, i, tables_by_key):
+        return {
+            'table_schema': cols['table_schema'][i],
+            'table_name': cols['table_name'][i],
+            'table_collation': tables_by_key[(cols['table_schema'][i], cols['table_name'][i])]['table_collation'],
+            'column_name': cols['column_name'][i],
+            'character_set_name': cols['character_set_name'][i],
+            'collation_name': cols['collation_name'][i],
+            'column_type': cols['column_type'][i],
+            'data_type': cols['data_type'][i]
+        }
+
+    def _check_binlog_settings(self, cursor):
         try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT 
-                    @@binlog_format as binlog_format,
-                    @@binlog_row_image as binlog_row_image,
-                    @@gtid_mode as gtid_mode,
-                    @@enforce_gtid_consistency as enforce_gtid_consistency,
-                    @@log_bin as log_bin,
-                    @@binlog_rows_query_log_events as binlog_rows_query_log_events,
-                    @@binlog_transaction_dependency_tracking as dependency_tracking,
-                    @@sync_binlog as sync_binlog,
-                    @@innodb_flush_log_at_trx_commit as flush_log_at_trx_commit
-            """)
-            settings = cursor.fetchone()
+            settings = self._get_server_vars(cursor, [
+                'binlog_format', 'binlog_row_image', 'gtid_mode', 'enforce_gtid_consistency', 'log_bin',
+                'binlog_rows_query_log_events', 'binlog_transaction_dependency_tracking',
+                'sync_binlog', 'innodb_flush_log_at_trx_commit'
+            ])
+            settings['dependency_tracking'] = settings.pop('binlog_transaction_dependency_tracking')
+            settings['flush_log_at_trx_commit'] = settings.pop('innodb_flush_log_at_trx_commit')
 
             result = {
                 'name': 'Binary Log Settings',
@@ -501,12 +1615,8 @@ class AuroraUpgradeChecker:
             return result
         except Exception as e:
             raise Exception(f"Binary log check failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_deprecated_features(self, conn):
-        cursor = None
+    def _check_deprecated_features(self, cursor):
         try:
             result = {
                 'name': 'Deprecated Features Check',
@@ -559,17 +1669,18 @@ class AuroraUpgradeChecker:
                 }
             }
 
-            cursor = conn.cursor(dictionary=True)
-
             # 1. Authentication Methods Check
             try:
-                # Check for truly deprecated plugins (RED)
+                # One scan of mysql.user for both plugins, classified below
                 cursor.execute("""
                     SELECT user, host, plugin, authentication_string
                     FROM mysql.user
-                    WHERE plugin IN ('mysql_old_password')
+                    WHERE plugin IN ('mysql_old_password', 'mysql_native_password')
                 """)
-                truly_deprecated_auth = cursor.fetchall()
+                auth_users = cursor.fetchall()
+
+                # Check for truly deprecated plugins (RED)
+                truly_deprecated_auth = [u for u in auth_users if u['plugin'] == 'mysql_old_password']
                 if truly_deprecated_auth:
                     result['details']['authentication']['status'] = 'RED'
                     result['details']['authentication']['affected_users'] = truly_deprecated_auth
@@ -580,13 +1691,8 @@ class AuroraUpgradeChecker:
                     result['details']['summary']['critical_issues'] += 1
 
                 # Check for mysql_native_password (informational only - AMBER)
-                cursor.execute("""
-                    SELECT user, host, plugin, authentication_string
-                    FROM mysql.user
-                    WHERE plugin IN ('mysql_native_password')
-                    AND user NOT IN ('mysql.sys', 'mysql.session', 'mysql.infoschema', 'rdsadmin')
-                """)
-                native_password_users = cursor.fetchall()
+                native_password_users = [u for u in auth_users
+                                         if u['plugin'] == 'mysql_native_password' and u['user'] not in SYSTEM_USERS]
                 if native_password_users:
                     if result['status'] == 'GREEN':
                         result['status'] = 'AMBER'
@@ -599,47 +1705,20 @@ class AuroraUpgradeChecker:
                 result['issues'].append(f"Could not check authentication methods: {str(e)}")
 
             # 2. Deprecated Functions and Syntax
-            deprecated_functions = [
-                ('PASSWORD', 'Use SHA2() instead'),
-                ('OLD_PASSWORD', 'Remove usage'),
-                ('ENCODE', 'Use AES_ENCRYPT()'),
-                ('DECODE', 'Use AES_DECRYPT()'),
-                ('ENCRYPT', 'Use SHA2() or AES_ENCRYPT()'),
-                ('DES_ENCRYPT', 'Use AES_ENCRYPT()'),
-                ('DES_DECRYPT', 'Use AES_DECRYPT()')
-            ]
+            # Routines come from the per-run snapshot, already classified with DEPRECATED_FUNC_RE
+            candidate_routines = [r for r in self._meta_cache['routines'] if r['deprecated_functions']]
 
-            for func, replacement in deprecated_functions:
-                # Build a safe parameterized query. `func` is from an internal whitelist above.
-                func_pattern = rf"{func}\s*\("
-                excluded_schemas = ['mysql', 'sys', 'information_schema', 'performance_schema']
-                placeholders = ','.join(['%s'] * len(excluded_schemas))
-                sql = f"""
-                    SELECT 
-                        ROUTINE_SCHEMA, 
-                        ROUTINE_NAME, 
-                        ROUTINE_TYPE,
-                        CREATED,
-                        LAST_ALTERED
-                    FROM information_schema.routines 
-                    WHERE ROUTINE_DEFINITION REGEXP %s
-                    AND ROUTINE_SCHEMA NOT IN ({placeholders})
-                """
-                params = [func_pattern] + excluded_schemas
-                try:
-                    cursor.execute(sql, params)
-                    deprecated_usage = cursor.fetchall()
-                except Exception as e:
-                    logger.exception("Error querying routines for %s: %s", func, e)
-                    continue
+            for func, replacement in DEPRECATED_FUNCTIONS:
+                deprecated_usage = [routine for routine in candidate_routines
+                                    if func in routine['deprecated_functions']]
                 if deprecated_usage:
                     result['details']['functions_and_syntax']['status'] = 'RED'
                     for routine in deprecated_usage:
-                        schema = routine.get('ROUTINE_SCHEMA') or routine.get('routine_schema')
-                        name = routine.get('ROUTINE_NAME') or routine.get('routine_name')
-                        typ = routine.get('ROUTINE_TYPE') or routine.get('routine_type')
-                        created = routine.get('CREATED') or routine.get('created')
-                        last_altered = routine.get('LAST_ALTERED') or routine.get('last_altered')
+                        schema = routine['routine_schema']
+                        name = routine['routine_name']
+                        typ = routine['routine_type']
+                        created = routine['created']
+                        last_altered = routine['last_altered']
                         result['details']['functions_and_syntax']['affected_objects'].append({
                             'schema': schema,
                             'object_name': name,
@@ -656,35 +1735,13 @@ class AuroraUpgradeChecker:
                     result['details']['summary']['critical_issues'] += len(deprecated_usage)
 
             # 3. System Variables Check
-            deprecated_vars = [
-                ('query_cache_size', 'Remove - query cache is deprecated'),
-                ('query_cache_type', 'Remove - query cache is deprecated'),
-                ('innodb_file_format', 'Remove - only Barracuda format supported'),
-                ('innodb_file_format_check', 'Remove - only Barracuda format supported'),
-                ('innodb_file_format_max', 'Remove - only Barracuda format supported'),
-                ('tx_isolation', 'Use transaction_isolation instead'),
-                ('tx_read_only', 'Use transaction_read_only instead'),
-                ('secure_auth', 'Remove - secure auth is mandatory'),
-                ('multi_range_count', 'Remove - no longer used')
-            ]
-
-            for var, recommendation in deprecated_vars:
-                try:
-                    cursor.execute("SHOW VARIABLES LIKE %s", (var,))
-                    var_value = cursor.fetchone()
-                except Exception as e:
-                    logger.exception("Error checking variable %s: %s", var, e)
-                    continue
-                if var_value:
-                    # support dict or tuple row formats
-                    if hasattr(var_value, 'get'):
-                        current_value = var_value.get('Value') or var_value.get('value')
-                    else:
-                        current_value = var_value[1] if len(var_value) > 1 else None
+            present_vars = self._all_server_vars(cursor)
+            for var, recommendation in DEPRECATED_VARIABLES:
+                if var in present_vars:
                     result['details']['system_variables']['status'] = 'AMBER'
                     result['details']['system_variables']['deprecated_vars'].append({
                         'variable': var,
-                        'current_value': current_value,
+                        'current_value': present_vars[var],
                         'recommendation': recommendation
                     })
                     result['issues'].append(f"Deprecated system variable in use: {var}")
@@ -693,10 +1750,10 @@ class AuroraUpgradeChecker:
                         result['status'] = 'AMBER'
 
             # 4. Query Cache Check
-            cursor.execute("SHOW VARIABLES LIKE 'query_cache%'")
-            query_cache_vars = cursor.fetchall()
-            enabled_cache_vars = [var for var in query_cache_vars 
-                                if var['Value'] != '0' and var['Value'].lower() != 'off']
+            enabled_cache_vars = [{'Variable_name': name, 'Value': str(value)}
+                                  for name, value in sorted(present_vars.items())
+                                  if name.startswith('query_cache')
+                                  and value != 0 and str(value).lower() != 'off']
             if enabled_cache_vars:
                 result['details']['query_cache']['status'] = 'RED'
                 result['details']['query_cache']['settings'] = enabled_cache_vars
@@ -705,20 +1762,47 @@ class AuroraUpgradeChecker:
                 result['details']['summary']['critical_issues'] += 1
 
             # 5. Data Types Check
-            # Check temporal columns
-            cursor.execute("""
-                SELECT 
-                    TABLE_SCHEMA,
-                    TABLE_NAME,
-                    COLUMN_NAME,
-                    COLUMN_TYPE,
-                    DATETIME_PRECISION
-                FROM information_schema.columns
-                WHERE DATA_TYPE IN ('TIMESTAMP', 'DATETIME', 'TIME')
-                AND TABLE_SCHEMA NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-            """)
-            temporal_columns = cursor.fetchall()
-            old_temporal = [col for col in temporal_columns if col['DATETIME_PRECISION'] is None]
+            # Temporal and spatial columns come from one columns scan and are split here
+            data_types = TEMPORAL_DATA_TYPES + SPATIAL_DATA_TYPES
+            user_schemas = self._meta_cache['user_schemas']
+            column_rows = []
+            # The snapshot already knows whether any such column exists; skip the scan if none do
+            has_candidates = any(c['data_type'].upper() in data_types for c in self._meta_cache['typed_columns'])
+            if user_schemas and has_candidates:
+                cursor.execute(f"""
+                    SELECT 
+                        c.TABLE_SCHEMA,
+                        c.TABLE_NAME,
+                        c.COLUMN_NAME,
+                        c.COLUMN_TYPE,
+                        c.DATA_TYPE,
+                        c.DATETIME_PRECISION,
+                        COUNT(s.INDEX_NAME) as has_spatial_index
+                    FROM information_schema.columns c
+                    LEFT JOIN information_schema.statistics s
+                        ON s.TABLE_SCHEMA = c.TABLE_SCHEMA
+                        AND s.TABLE_NAME = c.TABLE_NAME
+                        AND s.COLUMN_NAME = c.COLUMN_NAME
+                        AND s.INDEX_TYPE = 'SPATIAL'
+                    WHERE c.DATA_TYPE IN ({', '.join(['%s'] * len(data_types))})
+                    AND c.TABLE_SCHEMA IN ({', '.join(['%s'] * len(user_schemas))})
+                    GROUP BY c.TABLE_SCHEMA, c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_TYPE,
+                             c.DATA_TYPE, c.DATETIME_PRECISION
+                """, data_types + user_schemas)
+                column_rows = cursor.fetchall()
+            old_temporal = []
+            spatial_columns = []
+            for col in column_rows:
+                data_type = col.pop('DATA_TYPE').upper()
+                has_spatial_index = col.pop('has_spatial_index')
+                if data_type in TEMPORAL_DATA_TYPES:
+                    if col['DATETIME_PRECISION'] is None:
+                        old_temporal.append(col)
+                else:
+                    del col['DATETIME_PRECISION']
+                    col['has_spatial_index'] = has_spatial_index
+                    spatial_columns.append(col)
+
             if old_temporal:
                 result['details']['data_types']['status'] = 'AMBER'
                 result['details']['data_types']['temporal_columns'] = old_temporal
@@ -727,28 +1811,6 @@ class AuroraUpgradeChecker:
                 if result['status'] == 'GREEN':
                     result['status'] = 'AMBER'
 
-            # Check spatial columns
-            cursor.execute("""
-                SELECT 
-                    TABLE_SCHEMA,
-                    TABLE_NAME,
-                    COLUMN_NAME,
-                    COLUMN_TYPE,
-                    (
-                        SELECT COUNT(*)
-                        FROM information_schema.statistics s
-                        WHERE s.table_schema = c.table_schema
-                        AND s.table_name = c.table_name
-                        AND s.column_name = c.column_name
-                        AND s.index_type = 'SPATIAL'
-                    ) as has_spatial_index
-                FROM information_schema.columns c
-                WHERE DATA_TYPE IN ('GEOMETRY', 'POINT', 'LINESTRING', 'POLYGON', 
-                                'MULTIPOINT', 'MULTILINESTRING', 'MULTIPOLYGON', 
-                                'GEOMETRYCOLLECTION')
-                AND TABLE_SCHEMA NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-            """)
-            spatial_columns = cursor.fetchall()
             if spatial_columns:
                 result['details']['data_types']['spatial_columns'] = spatial_columns
                 result['issues'].append(f"Found {len(spatial_columns)} spatial columns - review SRID requirements")
@@ -757,10 +1819,8 @@ class AuroraUpgradeChecker:
                     result['status'] = 'AMBER'
 
             # 6. SQL Modes Check
-            cursor.execute("SELECT @@sql_mode as sql_mode")
-            sql_modes = cursor.fetchone()['sql_mode'].split(',')
-            deprecated_modes = ['NO_AUTO_CREATE_USER', 'NO_ZERO_DATE', 'ERROR_FOR_DIVISION_BY_ZERO']
-            found_deprecated = [mode for mode in sql_modes if mode in deprecated_modes]
+            sql_modes = self._get_server_vars(cursor, ['sql_mode'])['sql_mode'].split(',')
+            found_deprecated = [mode for mode in sql_modes if mode in DEPRECATED_SQL_MODES]
             if found_deprecated:
                 result['details']['sql_modes']['status'] = 'AMBER'
                 result['details']['sql_modes']['deprecated_modes'] = found_deprecated
@@ -832,12 +1892,8 @@ class AuroraUpgradeChecker:
                     "Check if information_schema is accessible"
                 ]
             }
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_parameters(self, conn):
-        cursor = None
+    def _check_parameters(self, cursor):
         try:
             # Check if this is Aurora
             is_aurora = (self.db_info and
@@ -864,25 +1920,10 @@ class AuroraUpgradeChecker:
                 }
             }
 
-            cursor = conn.cursor(dictionary=True)
-
             # 1. Check Parameters Being Removed
-            removed_params = [
-                ('innodb_file_format', 'Removed - Only Barracuda format supported'),
-                ('innodb_file_format_check', 'Removed - Only Barracuda format supported'),
-                ('innodb_file_format_max', 'Removed - Only Barracuda format supported'),
-                ('innodb_large_prefix', 'Removed - Large prefix is always enabled'),
-                ('sync_frm', 'Removed - .frm files no longer used'),
-                ('secure_auth', 'Removed - Secure authentication is mandatory'),
-                ('multi_range_count', 'Removed - No longer used'),
-                ('log_warnings', 'Use log_error_verbosity instead'),
-                ('ignore_builtin_innodb', 'Removed - InnoDB cannot be disabled'),
-                ('innodb_support_xa', 'Removed - XA support is always enabled'),
-                ('query_cache_size', 'Removed - Query cache is removed'),
-                ('query_cache_type', 'Removed - Query cache is removed'),
-                ('innodb_undo_tablespaces', 'Removed in 8.0.4 - See innodb_undo_tablespaces_implicit'),
-                ('max_tmp_tables', 'Removed - No longer used')
-            ]
+            # Removed variables this server doesn't define are simply absent from the snapshot
+            present_params = self._all_server_vars(cursor)
+            found_removed = [(param, note) for param, note in REMOVED_PARAMETERS if param in present_params]
 
             # For Aurora, parameter compatibility is managed automatically
             if is_aurora:
@@ -891,29 +1932,6 @@ class AuroraUpgradeChecker:
                     "you will be required to use a MySQL 8.0-compatible parameter group"
                 )
                 # Still check for informational purposes but don't flag as critical
-                # removed_params is an internal whitelist — validate before formatting into SQL
-                allowed_params = {p for p, _ in removed_params}
-                found_removed = []
-                for param, note in removed_params:
-                    if param not in allowed_params:
-                        logger.warning("Skipping unapproved parameter check: %s", param)
-                        continue
-                    sql = f"SELECT @@{param} as value"
-                    try:
-                        cursor.execute(sql)
-                        row = cursor.fetchone()
-                    except Exception as e:
-                        logger.exception("Error checking parameter %s: %s", param, e)
-                        continue
-                    if row:
-                        # support dict or tuple formats
-                        if hasattr(row, 'get'):
-                            val = row.get('value') or row.get('VALUE') or row.get('Value')
-                        else:
-                            val = row[0] if len(row) > 0 else None
-                        if val is not None:
-                            found_removed.append(param)
-
                 if found_removed:
                     result['recommendations'].append(
                         f"Note: Detected {len(found_removed)} parameters that will be removed in 8.0, "
@@ -921,137 +1939,44 @@ class AuroraUpgradeChecker:
                     )
             else:
                 # For RDS MySQL (non-Aurora), removed parameters are critical
-                # removed_params is an internal whitelist — validate before formatting into SQL
-                allowed_params = {p for p, _ in removed_params}
-                for param, note in removed_params:
-                    if param not in allowed_params:
-                        logger.warning("Skipping unapproved parameter check: %s", param)
-                        continue
-                    sql = f"SELECT @@{param} as value"
-                    try:
-                        cursor.execute(sql)
-                        row = cursor.fetchone()
-                    except Exception as e:
-                        logger.exception("Error checking parameter %s: %s", param, e)
-                        continue
-                    if row:
-                        # support dict or tuple formats
-                        if hasattr(row, 'get'):
-                            val = row.get('value') or row.get('VALUE') or row.get('Value')
-                        else:
-                            val = row[0] if len(row) > 0 else None
-                        if val is not None:
-                            result['details']['removed_parameters'].append({
-                                'parameter': param,
-                                'note': note,
-                                'action_required': 'Remove from configuration'
-                            })
-                            result['issues'].append(f"Parameter will be removed in 8.0: {param}")
-                            result['status'] = 'RED'
-                            result['details']['summary']['critical_issues'] += 1
+                for param, note in found_removed:
+                    result['details']['removed_parameters'].append({
+                        'parameter': param,
+                        'note': note,
+                        'action_required': 'Remove from configuration'
+                    })
+                    result['issues'].append(f"Parameter will be removed in 8.0: {param}")
+                    result['status'] = 'RED'
+                    result['details']['summary']['critical_issues'] += 1
 
-            # 2. Check Default Value Changes
-            default_changes = [
-                {
-                    'param': 'explicit_defaults_for_timestamp',
-                    'old_default': '0',
-                    'new_default': '1',
-                    'query': 'SELECT @@explicit_defaults_for_timestamp as value',
-                    'note': 'Affects timestamp column behavior'
-                },
-                {
-                    'param': 'binlog_expire_logs_seconds',
-                    'old_default': None,
-                    'new_default': '2592000',
-                    'query': 'SELECT @@binlog_expire_logs_seconds as value',
-                    'note': 'Replaces expire_logs_days'
-                },
-                {
-                    'param': 'completion_type',
-                    'old_default': '0',
-                    'new_default': 'NO_CHAIN',
-                    'query': 'SELECT @@completion_type as value',
-                    'note': 'Affects transaction completion behavior'
-                },
-                {
-                    'param': 'transaction_isolation',
-                    'old_default': 'REPEATABLE-READ',
-                    'new_default': 'REPEATABLE-READ',
-                    'query': 'SELECT @@transaction_isolation as value',
-                    'note': 'Replaces tx_isolation'
-                },
-                {
-                    'param': 'innodb_autoinc_lock_mode',
-                    'old_default': '1',
-                    'new_default': '2',
-                    'query': 'SELECT @@innodb_autoinc_lock_mode as value',
-                    'note': 'Affects auto-increment locking behavior'
-                }
-            ]
+            # Variables this version doesn't have (like binlog_expire_logs_seconds on 5.7)
+            # are absent from the snapshot and skipped
+            current_values = self._all_server_vars(cursor)
 
-            for param in default_changes:
-                try:
-                    cursor.execute(param['query'])
-                    row = cursor.fetchone()
-                    current_value = None
-                    if row:
-                        if hasattr(row, 'get'):
-                            current_value = row.get('value') or row.get('VALUE') or row.get('Value')
-                        else:
-                            current_value = row[0] if len(row) > 0 else None
-                    if str(current_value) != str(param['new_default']):
-                        result['details']['new_default_values'].append({
-                            'parameter': param['param'],
-                            'current_value': current_value,
-                            'new_default': param['new_default'],
-                            'note': param['note']
-                        })
-                        result['issues'].append(
-                            f"Parameter {param['param']} default changing to {param['new_default']}"
-                        )
-                        if result['status'] == 'GREEN':
-                            result['status'] = 'AMBER'
-                        result['details']['summary']['warnings'] += 1
-                except Exception as e:
-                    # Skip variables that don't exist in MySQL 5.7 (like binlog_expire_logs_seconds)
-                    if 'Unknown system variable' in str(e):
-                        logger.debug("Skipping %s check (not available in this MySQL version)", param.get('param'))
-                    else:
-                        logger.exception("Error checking default change for %s: %s", param.get('param'), e)
+            # 2. Check Default Value Changes
+            for param in PARAMETER_DEFAULT_CHANGES:
+                if param['param'] not in current_values:
+                    logger.debug("Skipping %s check (not available in this MySQL version)", param['param'])
                     continue
+                current_value = current_values[param['param']]
+                if str(current_value) != str(param['new_default']):
+                    result['details']['new_default_values'].append({
+                        'parameter': param['param'],
+                        'current_value': current_value,
+                        'new_default': param['new_default'],
+                        'note': param['note']
+                    })
+                    result['issues'].append(
+                        f"Parameter {param['param']} default changing to {param['new_default']}"
+                    )
+                    if result['status'] == 'GREEN':
+                        result['status'] = 'AMBER'
+                    result['details']['summary']['warnings'] += 1
 
             # 3. Check Behavioral Changes
-            behavioral_changes = [
-                {
-                    'param': 'sql_mode',
-                    'query': 'SELECT @@sql_mode as value',
-                    'check': lambda x: x is None or 'NO_AUTO_CREATE_USER' not in x.split(','),
-                    'note': 'NO_AUTO_CREATE_USER removed, use CREATE USER statement'
-                },
-                {
-                    'param': 'innodb_flush_method',
-                    'query': 'SELECT @@innodb_flush_method as value',
-                    'check': lambda x: x is None or x != 'ALL_O_DIRECT',
-                    'note': 'ALL_O_DIRECT replaced by O_DIRECT_NO_FSYNC'
-                },
-                {
-                    'param': 'max_length_for_sort_data',
-                    'query': 'SELECT @@max_length_for_sort_data as value',
-                    'check': lambda x: x is None or int(x) <= 4096,
-                    'note': 'Default reduced to 4096 to avoid memory issues'
-                }
-            ]
-
-            for change in behavioral_changes:
+            for change in PARAMETER_BEHAVIOR_CHANGES:
+                current_value = current_values.get(change['param'])
                 try:
-                    cursor.execute(change['query'])
-                    row = cursor.fetchone()
-                    current_value = None
-                    if row:
-                        if hasattr(row, 'get'):
-                            current_value = row.get('value') or row.get('Value') or row.get('VALUE')
-                        else:
-                            current_value = row[0] if len(row) > 0 else None
                     if current_value is not None and not change['check'](current_value):
                         result['details']['behavioral_changes'].append({
                             'parameter': change['param'],
@@ -1069,58 +1994,22 @@ class AuroraUpgradeChecker:
                     continue
 
             # 4. Check Critical Parameters
-            critical_params = [
-                {
-                    'param': 'log_bin_trust_function_creators',
-                    'expected': 1,
-                    'query': 'SELECT @@log_bin_trust_function_creators as value',
-                    'note': 'Required for stored function creation with binary logging'
-                },
-                {
-                    'param': 'enforce_gtid_consistency',
-                    'expected': 'ON',
-                    'query': 'SELECT @@enforce_gtid_consistency as value',
-                    'note': 'Required for GTID-based replication'
-                },
-                {
-                    'param': 'innodb_strict_mode',
-                    'expected': 1,
-                    'query': 'SELECT @@innodb_strict_mode as value',
-                    'note': 'Recommended for data integrity'
-                },
-                {
-                    'param': 'binlog_format',
-                    'expected': 'ROW',
-                    'query': 'SELECT @@binlog_format as value',
-                    'note': 'Required for safe replication'
-                }
-            ]
-
-            for param in critical_params:
-                try:
-                    cursor.execute(param['query'])
-                    row = cursor.fetchone()
-                    current_value = None
-                    if row:
-                        if hasattr(row, 'get'):
-                            current_value = row.get('value') or row.get('Value') or row.get('VALUE')
-                        else:
-                            current_value = row[0] if len(row) > 0 else None
-                    if str(current_value).upper() != str(param['expected']).upper():
-                        result['details']['critical_parameters'].append({
-                            'parameter': param['param'],
-                            'current_value': current_value,
-                            'required_value': param['expected'],
-                            'note': param['note']
-                        })
-                        result['issues'].append(
-                            f"Critical parameter {param['param']} not set to required value {param['expected']}"
-                        )
-                        result['status'] = 'RED'
-                        result['details']['summary']['critical_issues'] += 1
-                except Exception as e:
-                    logger.exception("Error checking critical parameter %s: %s", param.get('param'), e)
+            for param in CRITICAL_PARAMETERS:
+                if param['param'] not in current_values:
                     continue
+                current_value = current_values[param['param']]
+                if str(current_value).upper() != param['expected_upper']:
+                    result['details']['critical_parameters'].append({
+                        'parameter': param['param'],
+                        'current_value': current_value,
+                        'required_value': param['expected'],
+                        'note': param['note']
+                    })
+                    result['issues'].append(
+                        f"Critical parameter {param['param']} not set to required value {param['expected']}"
+                    )
+                    result['status'] = 'RED'
+                    result['details']['summary']['critical_issues'] += 1
 
             # 5. Check for XA Transaction Support
             try:
@@ -1170,15 +2059,10 @@ class AuroraUpgradeChecker:
                 'issues': [f"Error checking parameters: {str(e)}"],
                 'recommendations': ["Verify database permissions"]
             }
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_foreign_keys(self, conn):
-        cursor = None
+    def _check_foreign_keys(self, cursor):
         try:
-            cursor = conn.cursor(dictionary=True)
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT 
                     tc.table_schema,
                     tc.table_name,
@@ -1202,11 +2086,18 @@ class AuroraUpgradeChecker:
                     AND kcu.table_name = s.table_name
                     AND kcu.column_name = s.column_name
                 WHERE tc.constraint_type = 'FOREIGN KEY'
-                AND tc.table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
+                AND tc.table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
                 ORDER BY tc.table_schema, tc.table_name, tc.constraint_name
             """)
             foreign_keys = cursor.fetchall()
 
+            # One pass: group by schema (in query order) and count distinct tables
+            by_schema = defaultdict(list)
+            affected_tables = set()
+            for fk in foreign_keys:
+                by_schema[fk['table_schema']].append(fk)
+                affected_tables.add((fk['table_schema'], fk['table_name']))
+
             result = {
                 'name': 'Foreign Key Check',
                 'description': 'Analyzes foreign key constraints for potential compatibility issues and validates referential integrity',
@@ -1217,69 +2108,38 @@ class AuroraUpgradeChecker:
                     'foreign_keys': foreign_keys,
                     'summary': {
                         'total_foreign_keys': len(foreign_keys),
-                        'affected_schemas': len(set(fk['table_schema'] for fk in foreign_keys)),
-                        'affected_tables': len(set(f"{fk['table_schema']}.{fk['table_name']}" 
-                                                 for fk in foreign_keys))
+                        'affected_schemas': len(by_schema),
+                        'affected_tables': len(affected_tables)
                     }
                 }
             }
 
             if foreign_keys:
                 result['status'] = 'AMBER'
-                # Group by schema for better organization
-                by_schema = {}
-                for fk in foreign_keys:
-                    schema = fk['table_schema']
-                    if schema not in by_schema:
-                        by_schema[schema] = []
-                    by_schema[schema].append(fk)
-
                 # Add detailed issues
                 for schema, schema_fks in by_schema.items():
                     result['issues'].append(f"\nSchema: {schema}")
-                    for fk in schema_fks:
-                        result['issues'].append(
-                            f"  FK: {fk['constraint_name']}\n"
-                            f"    Table: {fk['table_name']}.{fk['column_name']}\n"
-                            f"    References: {fk['referenced_table_schema']}."
-                            f"{fk['referenced_table_name']}.{fk['referenced_column_name']}\n"
-                            f"    Update Rule: {fk['update_rule']}, Delete Rule: {fk['delete_rule']}\n"
-                            f"    Supporting Index: {fk['supporting_index'] or 'None'}"
-                        )
+                    result['issues'].extend(
+                        FOREIGN_KEY_ISSUE_TEMPLATE.format_map({**fk, 'supporting_index': fk['supporting_index'] or 'None'})
+                        for fk in schema_fks
+                    )
 
                 result['recommendations'].extend([
-                    f"\nForeign Key Statistics:",
+                    "\nForeign Key Statistics:",
                     f"- Total foreign keys: {result['details']['summary']['total_foreign_keys']}",
                     f"- Affected schemas: {result['details']['summary']['affected_schemas']}",
                     f"- Affected tables: {result['details']['summary']['affected_tables']}",
-                    "\nRecommended Actions:",
-                    "1. Verify all foreign key constraints before upgrade",
-                    "2. Check for missing indexes on foreign key columns",
-                    "3. Consider temporarily disabling foreign keys during upgrade",
-                    "4. Take backup before modifying any constraints",
-                    "5. Review update and delete rules for each constraint",
-                    "6. Test referential integrity after upgrade",
-                    "\nSQL Commands:",
-                    "-- To disable foreign key checks during upgrade:",
-                    "SET foreign_key_checks = 0;",
-                    "-- Don't forget to re-enable after upgrade:",
-                    "SET foreign_key_checks = 1;"
+                    *FOREIGN_KEY_RECOMMENDATIONS
                 ])
 
             return result
         except Exception as e:
             raise Exception(f"Foreign key check failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
                 
-    def _check_triggers_views(self, conn):
-        cursor = None
+    def _check_triggers_views(self, cursor):
         try:
-            cursor = conn.cursor(dictionary=True)
-            
             # Get detailed trigger information
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT 
                     trigger_schema,
                     trigger_name,
@@ -1294,52 +2154,70 @@ class AuroraUpgradeChecker:
                     collation_connection,
                     database_collation
                 FROM information_schema.triggers
-                WHERE trigger_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-                ORDER BY trigger_schema, trigger_name
-            """)
-            triggers = cursor.fetchall()
-
-            # Get detailed view information
-            cursor.execute("""
-                SELECT 
-                    table_schema,
-                    table_name,
-                    view_definition,
-                    check_option,
-                    is_updatable,
-                    definer,
-                    security_type,
-                    character_set_client,
-                    collation_connection
-                FROM information_schema.views
-                WHERE table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-                ORDER BY table_schema, table_name
+                WHERE trigger_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
             """)
-            views = cursor.fetchall()
+            # Sorted here rather than with ORDER BY, which makes the server filesort information_schema
+            triggers = sorted(cursor.fetchall(), key=itemgetter('trigger_schema', 'trigger_name'))
 
-            # Get view dependencies (checking MySQL version first)
-            cursor.execute("SELECT @@version as version")
-            version_info = cursor.fetchone()
-            
-            if '8.0' in version_info['version']:
-                try:
-                    cursor.execute("""
-                        SELECT 
-                            table_schema,
-                            table_name,
-                            referenced_table_schema,
-                            referenced_table_name
-                        FROM information_schema.view_table_usage
-                        WHERE table_schema NOT IN ('information_schema', 'performance_schema', 'mysql', 'sys')
-                        ORDER BY table_schema, table_name
-                    """)
-                    view_dependencies = cursor.fetchall()
-                except Exception as e:
-                    logger.exception("Error querying view dependencies: %s", e)
-                    view_dependencies = []
+            # Get detailed view information. information_schema.view_table_usage only exists
+            # on 8.0, where each view's dependencies come back in the same query.
+            if self._server_is_80(cursor):
+                view_sql = f"""
+                    SELECT 
+                        v.table_schema,
+                        v.table_name,
+                        v.view_definition,
+                        v.check_option,
+                        v.is_updatable,
+                        v.definer,
+                        v.security_type,
+                        v.character_set_client,
+                        v.collation_connection,
+                        u.referenced_table_schema,
+                        u.referenced_table_name
+                    FROM information_schema.views v
+                    LEFT JOIN information_schema.view_table_usage u
+                        ON u.table_schema = v.table_schema
+                        AND u.table_name = v.table_name
+                    WHERE v.table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+                """
             else:
-                # For MySQL 5.7, skip view dependencies check
-                view_dependencies = []
+                view_sql = f"""
+                    SELECT 
+                        table_schema,
+                        table_name,
+                        view_definition,
+                        check_option,
+                        is_updatable,
+                        definer,
+                        security_type,
+                        character_set_client,
+                        collation_connection
+                    FROM information_schema.views
+                    WHERE table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+                """
+            cursor.execute(view_sql)
+
+            # One view per (schema, name); on 8.0 the joined rows also carry its dependencies
+            views_by_key = {}
+            view_dependencies = []
+            dependencies_by_view = defaultdict(list)
+            for row in cursor.fetchall():
+                referenced_schema = row.pop('referenced_table_schema', None)
+                referenced_table = row.pop('referenced_table_name', None)
+                key = (row['table_schema'], row['table_name'])
+                views_by_key.setdefault(key, row)
+                if referenced_table is not None:
+                    dependency = {
+                        'table_schema': key[0],
+                        'table_name': key[1],
+                        'referenced_table_schema': referenced_schema,
+                        'referenced_table_name': referenced_table
+                    }
+                    view_dependencies.append(dependency)
+                    dependencies_by_view[key].append(dependency)
+            views = [views_by_key[key] for key in sorted(views_by_key)]
+
             result = {
                 'name': 'Triggers and Views Check',
                 'description': 'Examines triggers and views for syntax changes, deprecated features, and complexity issues',
@@ -1353,133 +2231,99 @@ class AuroraUpgradeChecker:
                     'summary': {
                         'trigger_count': len(triggers),
                         'view_count': len(views),
-                        'affected_schemas': len(set(t['trigger_schema'] for t in triggers) | 
-                                          set(v['table_schema'] for v in views))
+                        'affected_schemas': len({*map(itemgetter('trigger_schema'), triggers),
+                                                 *map(itemgetter('table_schema'), views)})
                     }
                 }
             }
 
-            # Check triggers
-            if triggers:
-                result['status'] = 'AMBER'
-                # Group by schema
-                by_schema = {}
-                for trigger in triggers:
-                    schema = trigger['trigger_schema']
-                    if schema not in by_schema:
-                        by_schema[schema] = []
-                    by_schema[schema].append(trigger)
-
-                result['issues'].append("\nTriggers:")
-                for schema, schema_triggers in by_schema.items():
-                    result['issues'].append(f"\nSchema: {schema}")
-                    for t in schema_triggers:
-                        # Check for potential issues in trigger definition
-                        potential_issues = []
-                        action_stmt = t['action_statement'].upper()
-                        
-                        if 'PASSWORD(' in action_stmt:
-                            potential_issues.append("Uses deprecated PASSWORD() function")
-                        if 'OLD_PASSWORD(' in action_stmt:
-                            potential_issues.append("Uses deprecated OLD_PASSWORD() function")
-                        if 'ENCRYPT(' in action_stmt:
-                            potential_issues.append("Uses deprecated ENCRYPT() function")
-                        
-                        result['issues'].append(
-                            f"  Trigger: {t['trigger_name']}\n"
-                            f"    On Table: {t['event_object_table']}\n"
-                            f"    Event: {t['action_timing']} {t['event_manipulation']}\n"
-                            f"    Created: {t['created']}\n"
-                            f"    Definer: {t['definer']}\n"
-                            f"    Character Set: {t['character_set_client']}\n"
-                            + (f"    Potential Issues: {', '.join(potential_issues)}\n" 
-                               if potential_issues else "")
-                        )
-
-            # Check views
-            if views:
+            if triggers or views:
                 result['status'] = 'AMBER'
-                # Group by schema
-                by_schema = {}
-                for view in views:
-                    schema = view['table_schema']
-                    if schema not in by_schema:
-                        by_schema[schema] = []
-                    by_schema[schema].append(view)
-
-                result['issues'].append("\nViews:")
-                for schema, schema_views in by_schema.items():
-                    result['issues'].append(f"\nSchema: {schema}")
-                    for v in schema_views:
-                        # Check for potential issues in view definition
-                        potential_issues = []
-                        view_def = v['view_definition'].upper()
-                        
-                        if 'PASSWORD(' in view_def:
-                            potential_issues.append("Uses deprecated PASSWORD() function")
-                        if 'GROUP BY' in view_def and 'ANY_VALUE(' not in view_def:
-                            potential_issues.append("May need ANY_VALUE() for GROUP BY in 8.0")
-                        
-                        # Get dependencies for this view
-                        deps = [d for d in view_dependencies 
-                               if d['table_schema'] == v['table_schema'] 
-                               and d['table_name'] == v['table_name']]
-                        
-                        # Create the dependencies string separately
-                        dep_str = ""
-                        if deps:
-                            dep_list = []
-                            for dep in deps:
-                                dep_list.append(f"{dep['referenced_table_schema']}.{dep['referenced_table_name']}")
-                            dep_str = f"    Dependencies: {', '.join(dep_list)}\n"
-
-                        result['issues'].append(
-                            f"  View: {v['table_name']}\n"
-                            f"    Updatable: {v['is_updatable']}\n"
-                            f"    Security: {v['security_type']}\n"
-                            f"    Definer: {v['definer']}\n"
-                            f"    Character Set: {v['character_set_client']}\n"
-                            + (f"    Potential Issues: {', '.join(potential_issues)}\n" 
-                               if potential_issues else "")
-                            + dep_str
-                        )
+                result['issues'].extend(self._iter_trigger_view_issues(triggers, views, dependencies_by_view))
 
-            if triggers or views:
+            trigger_count, view_count = len(triggers), len(views)
+            if trigger_count or view_count:
                 result['recommendations'].extend([
-                    f"\nSummary:",
-                    f"- Total objects to review: {len(triggers) + len(views)}",
-                    f"- Triggers: {len(triggers)}",
-                    f"- Views: {len(views)}",
+                    "\nSummary:",
+                    f"- Total objects to review: {trigger_count + view_count}",
+                    f"- Triggers: {trigger_count}",
+                    f"- Views: {view_count}",
                     f"- Affected schemas: {result['details']['summary']['affected_schemas']}",
-                    "\nRecommended Actions:",
-                    "1. Review all triggers and views for 8.0 compatibility",
-                    "2. Test triggers and views in upgrade simulation",
-                    "3. Consider temporarily disabling triggers during upgrade",
-                    "4. Take backup of all view and trigger definitions",
-                    "5. Check for deprecated syntax in view definitions",
-                    "6. Verify trigger privileges and security settings",
-                    "7. Review view dependencies and updatability",
-                    "\nBackup Commands:",
-                    "-- To get trigger definitions:",
-                    "SHOW TRIGGERS;",
-                    "-- To get view definitions:",
-                    "SHOW CREATE VIEW view_name;",
-                    "\nDisabling/Enabling Triggers:",
-                    "-- To disable triggers on a table:",
-                    "ALTER TABLE table_name DISABLE TRIGGERS;",
-                    "-- To enable triggers on a table:",
-                    "ALTER TABLE table_name ENABLE TRIGGERS;"
+                    *TRIGGER_VIEW_RECOMMENDATIONS
                 ])
 
             return result
         except Exception as e:
             raise Exception(f"Triggers and views check failed: {str(e)}")
-        finally:
-            if cursor:
-                cursor.close()
                 
-    def _check_new_features_compatibility(self, conn):
-        cursor = None
+    @classmethod
+    def _iter_trigger_view_issues(cls, triggers, views, dependencies_by_view):
+        """Yield the triggers-and-views issue lines one at a time, grouped by schema."""
+        # Rows are sorted by schema, so consecutive runs are the per-schema groups
+        if triggers:
+            yield "\nTriggers:"
+            for schema, schema_triggers in groupby(triggers, key=itemgetter('trigger_schema')):
+                yield f"\nSchema: {schema}"
+                for t in schema_triggers:
+                    # Check for potential issues in trigger definition
+                    potential_issues = cls._deprecated_function_issues(t['action_statement'])
+                    yield cls._format_trigger(t, potential_issues)
+
+        if views:
+            yield "\nViews:"
+            for schema, schema_views in groupby(views, key=itemgetter('table_schema')):
+                yield f"\nSchema: {schema}"
+                for v in schema_views:
+                    # Check for potential issues in view definition
+                    view_def = v['view_definition']
+                    potential_issues = cls._deprecated_function_issues(view_def)
+                    if GROUP_BY_RE.search(view_def) and not ANY_VALUE_RE.search(view_def):
+                        potential_issues.append("May need ANY_VALUE() for GROUP BY in 8.0")
+                    deps = dependencies_by_view.get((v['table_schema'], v['table_name']), ())
+                    yield cls._format_view(v, potential_issues, deps)
+
+    @staticmethod
+    def _format_trigger(t, potential_issues):
+        """Render one trigger's issue entry, one newline-terminated line per field."""
+        lines = [
+            f"  Trigger: {t['trigger_name']}",
+            f"    On Table: {t['event_object_table']}",
+            f"    Event: {t['action_timing']} {t['event_manipulation']}",
+            f"    Created: {t['created']}",
+            f"    Definer: {t['definer']}",
+            f"    Character Set: {t['character_set_client']}"
+        ]
+        if potential_issues:
+            lines.append(f"    Potential Issues: {', '.join(potential_issues)}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _format_view(v, potential_issues, deps):
+        """Render one view's issue entry, one newline-terminated line per field."""
+        lines = [
+            f"  View: {v['table_name']}",
+            f"    Updatable: {v['is_updatable']}",
+            f"    Security: {v['security_type']}",
+            f"    Definer: {v['definer']}",
+            f"    Character Set: {v['character_set_client']}"
+        ]
+        if potential_issues:
+            lines.append(f"    Potential Issues: {', '.join(potential_issues)}")
+        if deps:
+            lines.append("    Dependencies: " + ', '.join(
+                f"{dep['referenced_table_schema']}.{dep['referenced_table_name']}" for dep in deps))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _deprecated_function_issues(body):
+        """Return one issue per deprecated function called in a trigger or view body."""
+        # Most trigger bodies are plain assignments; no call means nothing to match
+        if '(' not in body:
+            return []
+        found = {name.upper() for name in OBJECT_DEPRECATED_FUNC_RE.findall(body)}
+        return [f"Uses deprecated {name}() function" for name in OBJECT_DEPRECATED_FUNCTIONS if name in found]
+
+    def _check_new_features_compatibility(self, cursor):
         try:
             result = {
                 'name': 'New Features Compatibility',
@@ -1487,227 +2331,48 @@ class AuroraUpgradeChecker:
                 'status': 'GREEN',
                 'issues': [],
                 'recommendations': [],
-                'details': {
-                    'new_features': {
-                        'hash_joins': {
-                            'available': False,
-                            'benefits': [
-                                "Improved performance for large table joins without indexes",
-                                "Better memory utilization for specific join types",
-                                "Automatic optimization for suitable queries"
-                            ],
-                            'usage_examples': [
-                                "SELECT /*+ HASH_JOIN(t1, t2) */ * FROM t1 JOIN t2 ON t1.id = t2.id",
-                                "Optimizer automatically chooses hash joins when beneficial"
-                            ]
-                        },
-                        'invisible_indexes': {
-                            'available': False,
-                            'benefits': [
-                                "Test index impact before removal",
-                                "Maintain indexes while preventing optimizer usage",
-                                "Safe index management in production"
-                            ],
-                            'usage_examples': [
-                                "ALTER TABLE tbl ALTER INDEX idx INVISIBLE;",
-                                "CREATE INDEX idx ON tbl (col) INVISIBLE;"
-                            ]
-                        },
-                        'descending_indexes': {
-                            'available': False,
-                            'benefits': [
-                                "Improved performance for mixed ASC/DESC ordering",
-                                "Better optimization for ORDER BY clauses",
-                                "Reduced need for temporary tables"
-                            ],
-                            'usage_examples': [
-                                "CREATE INDEX idx ON tbl (col1 ASC, col2 DESC);",
-                                "Supports efficient mixed-order range scans"
-                            ]
-                        },
-                        'window_functions': {
-                            'available': False,
-                            'benefits': [
-                                "Advanced analytical queries",
-                                "Row-based calculations within result sets",
-                                "Complex reporting capabilities"
-                            ],
-                            'usage_examples': [
-                                "ROW_NUMBER() OVER (PARTITION BY col ORDER BY col2)",
-                                "LAG(), LEAD(), FIRST_VALUE(), LAST_VALUE()"
-                            ]
-                        },
-                        'instant_ddl': {
-                            'available': False,
-                            'benefits': [
-                                "Add/drop columns instantly",
-                                "Reduced downtime for schema changes",
-                                "No table copy for supported operations"
-                            ],
-                            'usage_examples': [
-                                "ALTER TABLE tbl ADD COLUMN col1 INT DEFAULT 0, ALGORITHM=INSTANT;",
-                                "Supports adding columns with defaults"
-                            ]
-                        },
-                        'check_constraints': {
-                            'available': False,
-                            'benefits': [
-                                "Enhanced data integrity",
-                                "Better constraint management",
-                                "Improved data validation"
-                            ],
-                            'usage_examples': [
-                                "CREATE TABLE t1 (c1 INT CHECK (c1 > 10));",
-                                "ALTER TABLE t1 ADD CONSTRAINT CHECK (c1 < 100);"
-                            ]
-                        },
-                        'roles': {
-                            'available': False,
-                            'benefits': [
-                                "Simplified user privilege management",
-                                "Role-based access control",
-                                "Better security management"
-                            ],
-                            'usage_examples': [
-                                "CREATE ROLE 'app_read', 'app_write';",
-                                "GRANT SELECT ON db.* TO 'app_read';"
-                            ]
-                        }
-                    },
-                    'performance_improvements': [
-                        {
-                            'feature': 'Instant DDL',
-                            'description': "Many ALTER TABLE operations complete instantly",
-                            'benefit': "Reduced downtime for schema changes",
-                            'recommendation': "Use ALGORITHM=INSTANT for supported operations"
-                        },
-                        {
-                            'feature': 'Improved InnoDB deadlock detection',
-                            'description': "Better handling of deadlock scenarios",
-                            'benefit': "Reduced transaction conflicts",
-                            'recommendation': "Monitor deadlock patterns after upgrade"
-                        },
-                        {
-                            'feature': 'Enhanced optimizer hints',
-                            'description': "More control over query execution",
-                            'benefit': "Better query optimization options",
-                            'recommendation': "Review slow queries for hint opportunities"
-                        },
-                        {
-                            'feature': 'Multi-valued indexes',
-                            'description': "Index generation for JSON arrays",
-                            'benefit': "Improved JSON array search performance",
-                            'recommendation': "Consider for JSON array fields"
-                        }
-                    ],
-                    'security_enhancements': [
-                        {
-                            'feature': 'caching_sha2_password',
-                            'description': "New default authentication plugin",
-                            'benefit': "Improved security with good performance",
-                            'recommendation': "Plan user authentication updates"
-                        },
-                        {
-                            'feature': 'SQL Roles',
-                            'description': "Role-based privilege management",
-                            'benefit': "Simplified access control",
-                            'recommendation': "Design role hierarchy for applications"
-                        }
-                    ]
-                }
+                # Static and never mutated, so every result shares the one module-level dict
+                'details': NEW_FEATURES_DETAILS
             }
 
-            cursor = conn.cursor(dictionary=True)
-            
             # Check current version to determine feature availability
-            cursor.execute("SELECT @@version as version")
-            version_info = cursor.fetchone()
-            is_8_0 = '8.0' in version_info['version']
+            is_8_0 = self._server_is_80(cursor)
 
             if not is_8_0:
                 # Check potential benefits based on current database usage
                 
+                # Everything here comes from the metadata snapshot: a table is unindexed when
+                # statistics has no entry for it, which replaces the NOT EXISTS subquery
+                indexed_tables = self._meta_cache['indexed_tables']
+                base_tables = [t for t in self._meta_cache['tables'] if t['table_type'] == 'BASE TABLE']
+
                 # 1. Check for potential hash join benefits
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM information_schema.tables t1
-                    JOIN information_schema.statistics s1
-                    ON t1.table_schema = s1.table_schema 
-                    AND t1.table_name = s1.table_name
-                    WHERE t1.table_schema NOT IN ('mysql', 'information_schema', 'performance_schema')
-                    GROUP BY t1.table_schema, t1.table_name
-                    HAVING count(*) = 0
-                """)
-                unindexed_tables = cursor.fetchall()
-                
-                if unindexed_tables:
+                if any((t['table_schema'], t['table_name']) not in indexed_tables for t in base_tables):
                     result['recommendations'].append(
                         "Consider hash joins for tables without indexes after upgrade"
                     )
 
                 # 2. Check for complex ORDER BY usage
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM information_schema.tables
-                    WHERE table_schema NOT IN ('mysql', 'information_schema', 'performance_schema')
-                    AND table_type = 'BASE TABLE'
-                """)
-                table_count = cursor.fetchone()['count']
-                
-                if table_count > 10:
+                if len(base_tables) > 10:
                     result['recommendations'].append(
                         "Review queries with mixed ORDER BY directions for descending index benefits"
                     )
 
                 # 3. Check for potential window function usage
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM information_schema.tables
-                    WHERE table_schema NOT IN ('mysql', 'information_schema', 'performance_schema')
-                    AND table_type = 'BASE TABLE'
-                    AND (table_rows > 10000 OR table_rows IS NULL)
-                """)
-                large_tables = cursor.fetchone()['count']
-                
-                if large_tables > 0:
+                if any(t['table_rows'] is None or t['table_rows'] > 10000 for t in base_tables):
                     result['recommendations'].append(
                         "Consider window functions for analytical queries on large tables"
                     )
 
                 # 4. Check for JSON usage
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM information_schema.columns
-                    WHERE data_type = 'json'
-                    AND table_schema NOT IN ('mysql', 'information_schema', 'performance_schema')
-                """)
-                json_columns = cursor.fetchone()['count']
-                
+                json_columns = sum(c['data_type'].lower() == 'json' for c in self._meta_cache['typed_columns'])
                 if json_columns > 0:
                     result['recommendations'].append(
                         f"Found {json_columns} JSON columns - review new JSON functions and multi-valued indexes"
                     )
 
                 # Add general recommendations
-                result['recommendations'].extend([
-                    "\nNew Feature Opportunities in 8.0:",
-                    "1. Hash Joins for better join performance",
-                    "2. Invisible Indexes for safe index management",
-                    "3. Descending Indexes for mixed-order queries",
-                    "4. Window Functions for analytical queries",
-                    "5. Instant DDL for faster schema changes",
-                    "6. SQL Roles for better security management",
-                    "7. Check Constraints for data integrity",
-                    "\nPerformance Improvements:",
-                    "- Enhanced optimizer features",
-                    "- Improved deadlock detection",
-                    "- Better temporary table handling",
-                    "- Instant DDL operations",
-                    "\nSecurity Enhancements:",
-                    "- New authentication plugin (caching_sha2_password)",
-                    "- Role-based access control",
-                    "- Enhanced password management"
-                ])
+                result['recommendations'].extend(NEW_FEATURE_RECOMMENDATIONS)
 
             return result
         except Exception as e:
@@ -1718,1297 +2383,1038 @@ class AuroraUpgradeChecker:
                 'issues': [f"Error checking new features compatibility: {str(e)}"],
                 'recommendations': ["Verify database permissions"]
             }
-        finally:
-            if cursor:
-                cursor.close()
 
     # ========================================================================================
     # NEW CHECKS (10-20) - Comprehensive MySQL 8.0 Upgrade Assessment
     # ========================================================================================
 
-    def _check_reserved_keywords(self, conn):
+    @_safe_check('Reserved Keywords Conflicts', 'reserved keywords',
+                 'Identifies table and column names that conflict with new MySQL 8.0 reserved keywords')
+    def _check_reserved_keywords(self, cursor):
         """
         Check 10: Reserved Keywords Conflicts
         Identify database objects that conflict with MySQL 8.0 reserved keywords.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Reserved Keywords Conflicts',
-                'description': 'Identifies table and column names that conflict with new MySQL 8.0 reserved keywords',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'conflicting_tables': [],
-                    'conflicting_columns': [],
-                    'conflicting_routines': []
-                }
+        result = {
+            'name': 'Reserved Keywords Conflicts',
+            'description': 'Identifies table and column names that conflict with new MySQL 8.0 reserved keywords',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'conflicting_tables': [],
+                'conflicting_columns': [],
+                'conflicting_routines': []
             }
+        }
 
-            # New reserved keywords in MySQL 8.0
-            reserved_keywords = [
-                'CUME_DIST', 'DENSE_RANK', 'EMPTY', 'EXCEPT', 'FIRST_VALUE',
-                'GROUPING', 'GROUPS', 'LAG', 'LAST_VALUE', 'LEAD', 'NTH_VALUE',
-                'NTILE', 'OVER', 'PERCENT_RANK', 'RANK', 'RECURSIVE', 'ROW_NUMBER',
-                'SYSTEM', 'WINDOW', 'JSON_TABLE', 'LATERAL', 'MEMBER', 'OF'
-            ]
-            keywords_str = "', '".join(reserved_keywords)
-
-            # Check table names
-            cursor.execute(f"""
-                SELECT table_schema, table_name, 'TABLE' as object_type
-                FROM information_schema.tables
-                WHERE table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND UPPER(table_name) IN ('{keywords_str}')
-                ORDER BY table_schema, table_name
-            """)
-            conflicting_tables = cursor.fetchall()
-
-            # Check column names
-            cursor.execute(f"""
-                SELECT table_schema, table_name, column_name, 'COLUMN' as object_type
-                FROM information_schema.columns
-                WHERE table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND UPPER(column_name) IN ('{keywords_str}')
-                ORDER BY table_schema, table_name, column_name
-            """)
-            conflicting_columns = cursor.fetchall()
+        # Check table names, matched in Python against the cached metadata snapshot
+        conflicting_tables = sorted(
+            ({'table_schema': t['table_schema'], 'table_name': t['table_name'], 'object_type': 'TABLE'}
+             for t in self._meta_cache['tables'] if t['table_name'].upper() in RESERVED_KEYWORD_SET),
+            key=lambda t: (t['table_schema'], t['table_name'])
+        )
 
-            # Check stored procedure/function names
-            cursor.execute(f"""
-                SELECT routine_schema, routine_name, routine_type as object_type
-                FROM information_schema.routines
-                WHERE routine_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND UPPER(routine_name) IN ('{keywords_str}')
-                ORDER BY routine_schema, routine_name
-            """)
-            conflicting_routines = cursor.fetchall()
+        # Check column names (the snapshot only holds character columns, so query them all).
+        # Column names use case-insensitive collations in information_schema,
+        # so a plain IN matches any case without running UPPER() on every row.
+        keyword_placeholders = ', '.join(['%s'] * len(RESERVED_KEYWORDS_80))
+        cursor.execute(f"""
+            SELECT table_schema, table_name, column_name, 'COLUMN' as object_type
+            FROM information_schema.columns
+            WHERE table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            AND column_name IN ({keyword_placeholders})
+        """, RESERVED_KEYWORDS_80)
+        conflicting_columns = sorted(cursor.fetchall(),
+                                     key=itemgetter('table_schema', 'table_name', 'column_name'))
+
+        # Check stored procedure/function names against the snapshot (already in name order)
+        conflicting_routines = [
+            {'routine_schema': r['routine_schema'], 'routine_name': r['routine_name'],
+             'object_type': r['routine_type']}
+            for r in self._meta_cache['routines'] if r['routine_name'].upper() in RESERVED_KEYWORD_SET
+        ]
 
-            # Process results
-            if conflicting_tables:
-                result['status'] = 'RED'
-                result['details']['conflicting_tables'] = conflicting_tables
-                for table in conflicting_tables:
-                    result['issues'].append(
-                        f"Table name '{table['table_schema']}.{table['table_name']}' conflicts with MySQL 8.0 reserved keyword"
-                    )
+        # Process results
+        if conflicting_tables:
+            result['status'] = 'RED'
+            result['details']['conflicting_tables'] = conflicting_tables
+            for table in conflicting_tables:
+                result['issues'].append(
+                    f"Table name '{table['table_schema']}.{table['table_name']}' conflicts with MySQL 8.0 reserved keyword"
+                )
 
-            if conflicting_columns:
-                result['status'] = 'RED'
-                result['details']['conflicting_columns'] = conflicting_columns
-                for col in conflicting_columns:
-                    result['issues'].append(
-                        f"Column name '{col['table_schema']}.{col['table_name']}.{col['column_name']}' conflicts with MySQL 8.0 reserved keyword"
-                    )
+        if conflicting_columns:
+            result['status'] = 'RED'
+            result['details']['conflicting_columns'] = conflicting_columns
+            for col in conflicting_columns:
+                result['issues'].append(
+                    f"Column name '{col['table_schema']}.{col['table_name']}.{col['column_name']}' conflicts with MySQL 8.0 reserved keyword"
+                )
 
-            if conflicting_routines:
-                result['status'] = 'RED'
-                result['details']['conflicting_routines'] = conflicting_routines
-                for routine in conflicting_routines:
-                    result['issues'].append(
-                        f"{routine['object_type']} '{routine['routine_schema']}.{routine['routine_name']}' conflicts with MySQL 8.0 reserved keyword"
-                    )
+        if conflicting_routines:
+            result['status'] = 'RED'
+            result['details']['conflicting_routines'] = conflicting_routines
+            for routine in conflicting_routines:
+                result['issues'].append(
+                    f"{routine['object_type']} '{routine['routine_schema']}.{routine['routine_name']}' conflicts with MySQL 8.0 reserved keyword"
+                )
 
-            # Generate recommendations
-            if result['status'] == 'RED':
-                result['recommendations'].extend([
-                    "CRITICAL: Rename objects that conflict with reserved keywords before upgrading",
-                    "Option 1 - Rename objects:",
-                    "  ALTER TABLE schema.rank RENAME TO schema.rank_data;",
-                    "  ALTER TABLE schema.table ALTER COLUMN rank RENAME TO rank_value;",
-                    "Option 2 - Use backticks in all queries:",
-                    "  SELECT * FROM `rank` WHERE `rank`.`rank` > 10;",
-                    "Note: Backticks are a workaround but renaming is recommended",
-                    "Update application code to handle renamed objects"
-                ])
+        # Generate recommendations
+        if result['status'] == 'RED':
+            result['recommendations'].extend([
+                "CRITICAL: Rename objects that conflict with reserved keywords before upgrading",
+                "Option 1 - Rename objects:",
+                "  ALTER TABLE schema.rank RENAME TO schema.rank_data;",
+                "  ALTER TABLE schema.table ALTER COLUMN rank RENAME TO rank_value;",
+                "Option 2 - Use backticks in all queries:",
+                "  SELECT * FROM `rank` WHERE `rank`.`rank` > 10;",
+                "Note: Backticks are a workaround but renaming is recommended",
+                "Update application code to handle renamed objects"
+            ])
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Reserved Keywords Conflicts',
-                'description': 'Identifies table and column names that conflict with new MySQL 8.0 reserved keywords',
-                'status': 'ERROR',
-                'issues': [f"Error checking reserved keywords: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_partition_compatibility(self, conn):
+    @_safe_check('Partition Compatibility', 'partition compatibility',
+                 'Validates partitioned tables for compatibility with MySQL 8.0 partitioning changes')
+    def _check_partition_compatibility(self, cursor):
         """
         Check 11: Partition Compatibility
         Identify partitioned tables with compatibility issues in MySQL 8.0.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Partition Compatibility',
-                'description': 'Validates partitioned tables for compatibility with MySQL 8.0 partitioning changes',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'partitioned_tables': [],
-                    'high_partition_count': [],
-                    'summary': {
-                        'total_partitioned_tables': 0,
-                        'total_partitions': 0
-                    }
+        result = {
+            'name': 'Partition Compatibility',
+            'description': 'Validates partitioned tables for compatibility with MySQL 8.0 partitioning changes',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'partitioned_tables': [],
+                'high_partition_count': [],
+                'summary': {
+                    'total_partitioned_tables': 0,
+                    'total_partitions': 0
                 }
             }
+        }
 
-            # Get partitioned tables info
-            # Note: Using subquery instead of window function for MySQL 5.7 compatibility
-            cursor.execute("""
-                SELECT
-                    t.table_schema,
-                    t.table_name,
-                    t.partition_name,
-                    t.partition_method,
-                    t.subpartition_method,
-                    t.partition_expression,
-                    t.table_rows,
-                    (SELECT COUNT(*)
-                     FROM information_schema.partitions p
-                     WHERE p.table_schema = t.table_schema
-                     AND p.table_name = t.table_name
-                     AND p.partition_name IS NOT NULL) as partition_count
-                FROM information_schema.partitions t
-                WHERE t.table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND t.partition_name IS NOT NULL
-                ORDER BY t.table_schema, t.table_name, t.partition_ordinal_position
-            """)
-            partitions = cursor.fetchall()
-
-            if not partitions:
-                result['recommendations'].append("No partitioned tables found")
-                return result
-
-            # Analyze partitions
-            tables_seen = set()
-            high_partition_tables = []
-
-            for partition in partitions:
-                table_key = f"{partition['table_schema']}.{partition['table_name']}"
-
-                if table_key not in tables_seen:
-                    tables_seen.add(table_key)
-                    result['details']['partitioned_tables'].append({
-                        'schema': partition['table_schema'],
-                        'table': partition['table_name'],
-                        'method': partition['partition_method'],
-                        'partition_count': partition['partition_count']
-                    })
+        # Partitioned tables and their partition counts come from the per-run snapshot
+        partitioned_tables = self._meta_cache['partitioned_tables']
 
-                    # Check for high partition count
-                    if partition['partition_count'] > 100:
-                        result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                        high_partition_tables.append(table_key)
-                        result['issues'].append(
-                            f"Table {table_key} has {partition['partition_count']} partitions (>100)"
-                        )
+        if not partitioned_tables:
+            result['recommendations'].append("No partitioned tables found")
+            return result
 
-            result['details']['summary']['total_partitioned_tables'] = len(tables_seen)
-            result['details']['summary']['total_partitions'] = len(partitions)
-            result['details']['high_partition_count'] = high_partition_tables
+        # Analyze partitions
+        result['details']['partitioned_tables'] = [
+            {
+                'schema': t['table_schema'],
+                'table': t['table_name'],
+                'method': t['partition_method'],
+                'partition_count': t['partition_count']
+            }
+            for t in partitioned_tables
+        ]
 
-            # Generate recommendations
-            if result['status'] != 'GREEN':
-                result['recommendations'].extend([
-                    "Review partitioning strategy before upgrade:",
-                    "- Test partition pruning effectiveness",
-                    "- Consider partition consolidation for tables with >100 partitions",
-                    "- Verify partition maintenance operations in non-production first",
-                    "- Monitor partition-related performance post-upgrade"
-                ])
-            else:
-                result['recommendations'].append(
-                    f"Found {len(tables_seen)} partitioned tables - verify compatibility during testing"
-                )
+        # Check for high partition count; the "schema.table" text is only built for these
+        high_partitions = [(f"{t['table_schema']}.{t['table_name']}", t['partition_count'])
+                           for t in partitioned_tables if t['partition_count'] > 100]
+        high_partition_tables = [table_key for table_key, _ in high_partitions]
+        if high_partitions:
+            result['status'] = 'AMBER'
+            result['issues'].extend(f"Table {table_key} has {count} partitions (>100)"
+                                    for table_key, count in high_partitions)
+
+        result['details']['summary']['total_partitioned_tables'] = len(partitioned_tables)
+        result['details']['summary']['total_partitions'] = sum(map(itemgetter('partition_count'), partitioned_tables))
+        result['details']['high_partition_count'] = high_partition_tables
+
+        self._cap_reported(result['details'], 'partitioned_tables', 'high_partition_count')
+
+        # Generate recommendations
+        if result['status'] != 'GREEN':
+            result['recommendations'].extend(PARTITION_RECOMMENDATIONS)
+        else:
+            result['recommendations'].append(
+                f"Found {len(partitioned_tables)} partitioned tables - verify compatibility during testing"
+            )
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Partition Compatibility',
-                'description': 'Validates partitioned tables for compatibility with MySQL 8.0 partitioning changes',
-                'status': 'ERROR',
-                'issues': [f"Error checking partition compatibility: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_user_privileges(self, conn):
+    @_safe_check('User Privileges and Security', 'user privileges',
+                 'Reviews user accounts, authentication plugins, and privilege mappings for MySQL 8.0 security model')
+    def _check_user_privileges(self, cursor):
         """
         Check 12: User Privileges and Security
         Analyze user accounts and identify security issues for MySQL 8.0.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'User Privileges and Security',
-                'description': 'Reviews user accounts, authentication plugins, and privilege mappings for MySQL 8.0 security model',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'deprecated_auth_users': [],
-                    'super_privilege_users': [],
-                    'empty_password_users': [],
-                    'total_users': 0
-                }
+        result = {
+            'name': 'User Privileges and Security',
+            'description': 'Reviews user accounts, authentication plugins, and privilege mappings for MySQL 8.0 security model',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'deprecated_auth_users': [],
+                'super_privilege_users': [],
+                'empty_password_users': [],
+                'total_users': 0
             }
+        }
+
+        # Empty passwords are flagged in the same scan when mysql.user has authentication_string;
+        # whether it does is probed once per target and cached like the variable reads
+        probe = self._cached_query(cursor, """
+            SELECT COUNT(*) AS present
+            FROM information_schema.columns
+            WHERE table_schema = 'mysql'
+            AND table_name = 'user'
+            AND column_name = 'authentication_string'
+        """)
+        has_auth_string = bool(probe and probe[0]['present'])
+        empty_password_sql = ("(authentication_string = '' OR authentication_string IS NULL)"
+                              if has_auth_string else "0")
+
+        # Get user information
+        cursor.execute(f"""
+            SELECT user, host, plugin, password_expired, account_locked,
+                   Super_priv, Grant_priv, Create_user_priv,
+                   {empty_password_sql} AS empty_password
+            FROM mysql.user
+            WHERE user NOT IN ('mysql.sys', 'mysql.session', 'mysql.infoschema', 'rdsadmin')
+            ORDER BY user, host
+        """)
+        # Analyze users batch by batch as the cursor hands them out
+        status_rank = 0
+        for user in self._iter_rows(cursor):
+            result['details']['total_users'] += 1
+            user_host = f"'{user['user']}'@'{user['host']}'"
+
+            # Check authentication plugin
+            if user['plugin'] in ['mysql_old_password', 'sha256_password']:
+                status_rank = 2
+                result['details']['deprecated_auth_users'].append(user_host)
+                result['issues'].append(
+                    f"User {user_host} uses deprecated authentication plugin: {user['plugin']}"
+                )
 
-            # Get user information
-            cursor.execute("""
-                SELECT user, host, plugin, password_expired, account_locked,
-                       Super_priv, Grant_priv, Create_user_priv
-                FROM mysql.user
-                WHERE user NOT IN ('mysql.sys', 'mysql.session', 'mysql.infoschema', 'rdsadmin')
-                ORDER BY user, host
-            """)
-            users = cursor.fetchall()
-            result['details']['total_users'] = len(users)
-
-            # Analyze users
-            for user in users:
-                user_host = f"'{user['user']}'@'{user['host']}'"
-
-                # Check authentication plugin
-                if user['plugin'] in ['mysql_old_password', 'sha256_password']:
-                    result['status'] = 'RED'
-                    result['details']['deprecated_auth_users'].append(user_host)
-                    result['issues'].append(
-                        f"User {user_host} uses deprecated authentication plugin: {user['plugin']}"
-                    )
+            # Check for SUPER privilege
+            if user['Super_priv'] == 'Y':
+                status_rank = max(status_rank, 1)
+                result['details']['super_privilege_users'].append(user_host)
+                result['issues'].append(
+                    f"User {user_host} has SUPER privilege (deprecated in 8.0, requires privilege mapping)"
+                )
 
-                # Check for SUPER privilege
-                if user['Super_priv'] == 'Y':
-                    if result['status'] == 'GREEN':
-                        result['status'] = 'AMBER'
-                    result['details']['super_privilege_users'].append(user_host)
-                    result['issues'].append(
-                        f"User {user_host} has SUPER privilege (deprecated in 8.0, requires privilege mapping)"
-                    )
+            # Check for empty passwords; reported after the plugin and SUPER findings
+            if user['empty_password']:
+                status_rank = 2
+                result['details']['empty_password_users'].append(user_host)
 
-            # Check for empty passwords (separate query for safety)
-            try:
-                cursor.execute("""
-                    SELECT user, host
-                    FROM mysql.user
-                    WHERE (authentication_string = '' OR authentication_string IS NULL)
-                    AND user NOT IN ('mysql.sys', 'mysql.session', 'mysql.infoschema', 'rdsadmin')
-                """)
-                empty_pass_users = cursor.fetchall()
+        result['issues'].extend(f"User {user_host} has empty password"
+                                for user_host in result['details']['empty_password_users'])
+        result['status'] = STATUS_LEVELS[status_rank]
 
-                if empty_pass_users:
-                    result['status'] = 'RED'
-                    for user in empty_pass_users:
-                        user_host = f"'{user['user']}'@'{user['host']}'"
-                        result['details']['empty_password_users'].append(user_host)
-                        result['issues'].append(f"User {user_host} has empty password")
-            except Exception:
-                pass  # Column might not exist in some versions
+        self._cap_reported(result['details'], 'deprecated_auth_users', 'super_privilege_users',
+                           'empty_password_users')
 
-            # Generate recommendations
-            if result['details']['deprecated_auth_users']:
-                result['recommendations'].extend([
-                    "Migrate users to caching_sha2_password authentication:",
-                    "  ALTER USER 'user'@'host' IDENTIFIED WITH caching_sha2_password BY 'password';"
-                ])
+        # Generate recommendations
+        if result['details']['deprecated_auth_users']:
+            result['recommendations'].extend(DEPRECATED_AUTH_RECOMMENDATIONS)
 
-            if result['details']['super_privilege_users']:
-                result['recommendations'].extend([
-                    "Map SUPER privilege to dynamic privileges in MySQL 8.0:",
-                    "  Common mappings:",
-                    "  - SUPER -> SYSTEM_VARIABLES_ADMIN (for SET GLOBAL)",
-                    "  - SUPER -> REPLICATION_SLAVE_ADMIN (for replication)",
-                    "  - SUPER -> BINLOG_ADMIN (for binary logs)",
-                    "  Example: GRANT SYSTEM_VARIABLES_ADMIN ON *.* TO 'user'@'host';"
-                ])
+        if result['details']['super_privilege_users']:
+            result['recommendations'].extend(SUPER_PRIVILEGE_RECOMMENDATIONS)
 
-            if result['details']['empty_password_users']:
-                result['recommendations'].append(
-                    "Set passwords for users with empty passwords before upgrade"
-                )
+        if result['details']['empty_password_users']:
+            result['recommendations'].append(
+                "Set passwords for users with empty passwords before upgrade"
+            )
 
-            if result['status'] == 'GREEN':
-                result['recommendations'].append("User authentication and privileges are compatible with MySQL 8.0")
+        if result['status'] == 'GREEN':
+            result['recommendations'].append("User authentication and privileges are compatible with MySQL 8.0")
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'User Privileges and Security',
-                'description': 'Reviews user accounts, authentication plugins, and privilege mappings for MySQL 8.0 security model',
-                'status': 'ERROR',
-                'issues': [f"Error checking user privileges: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_json_usage(self, conn):
+    @_safe_check('JSON Usage and Optimization', 'JSON usage',
+                 'Analyzes JSON column usage and recommends MySQL 8.0 JSON optimization opportunities')
+    def _check_json_usage(self, cursor):
         """
         Check 13: JSON Schema and Functions
         Identify JSON usage and optimization opportunities in MySQL 8.0.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'JSON Usage and Optimization',
-                'description': 'Analyzes JSON column usage and recommends MySQL 8.0 JSON optimization opportunities',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'json_columns': [],
-                    'json_in_routines': [],
-                    'summary': {
-                        'total_json_columns': 0,
-                        'columns_without_indexes': 0,
-                        'routines_with_json': 0
-                    }
+        result = {
+            'name': 'JSON Usage and Optimization',
+            'description': 'Analyzes JSON column usage and recommends MySQL 8.0 JSON optimization opportunities',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'json_columns': [],
+                'json_in_routines': [],
+                'summary': {
+                    'total_json_columns': 0,
+                    'columns_without_indexes': 0,
+                    'routines_with_json': 0
                 }
             }
+        }
 
-            # Find JSON columns
-            cursor.execute("""
-                SELECT
-                    c.table_schema,
-                    c.table_name,
-                    c.column_name,
-                    c.is_nullable,
-                    (
-                        SELECT COUNT(*)
-                        FROM information_schema.statistics s
-                        WHERE s.table_schema = c.table_schema
-                        AND s.table_name = c.table_name
-                        AND s.column_name = c.column_name
-                    ) as has_index
-                FROM information_schema.columns c
-                WHERE c.data_type = 'json'
-                AND c.table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                ORDER BY c.table_schema, c.table_name, c.column_name
-            """)
-            json_columns = cursor.fetchall()
+        # JSON columns and their index counts come from the per-run snapshot
+        index_counts = self._meta_cache['index_counts']
+        json_columns = [c for c in self._meta_cache['typed_columns'] if c['data_type'].lower() == 'json']
 
-            result['details']['summary']['total_json_columns'] = len(json_columns)
+        result['details']['summary']['total_json_columns'] = len(json_columns)
 
-            if json_columns:
-                result['status'] = 'AMBER'
-                for col in json_columns:
-                    result['details']['json_columns'].append({
-                        'schema': col['table_schema'],
-                        'table': col['table_name'],
-                        'column': col['column_name'],
-                        'has_index': col['has_index'] > 0
-                    })
+        if json_columns:
+            result['status'] = 'AMBER'
+            for col in json_columns:
+                has_index = index_counts[(col['table_schema'], col['table_name'], col['column_name'])] > 0
+                result['details']['json_columns'].append({
+                    'schema': col['table_schema'],
+                    'table': col['table_name'],
+                    'column': col['column_name'],
+                    'has_index': has_index
+                })
 
-                    if col['has_index'] == 0:
-                        result['details']['summary']['columns_without_indexes'] += 1
+                if not has_index:
+                    result['details']['summary']['columns_without_indexes'] += 1
 
-                # Check for JSON functions in stored routines
-                cursor.execute("""
-                    SELECT routine_schema, routine_name, routine_type
-                    FROM information_schema.routines
-                    WHERE routine_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                    AND (
-                        routine_definition LIKE '%JSON_%'
-                        OR routine_definition LIKE '%->%'
-                        OR routine_definition LIKE '%->>%'
-                    )
-                """)
-                json_routines = cursor.fetchall()
-                result['details']['json_in_routines'] = json_routines
-                result['details']['summary']['routines_with_json'] = len(json_routines)
+            # Check for JSON functions in stored routines
+            json_routines = [
+                {'routine_schema': r['routine_schema'], 'routine_name': r['routine_name'],
+                 'routine_type': r['routine_type']}
+                for r in self._meta_cache['routines'] if r['uses_json']
+            ]
+            result['details']['json_in_routines'] = json_routines
+            result['details']['summary']['routines_with_json'] = len(json_routines)
 
-                # Generate recommendations
-                result['issues'].append(
-                    f"Found {len(json_columns)} JSON columns ({result['details']['summary']['columns_without_indexes']} without indexes)"
-                )
+            # Generate recommendations
+            result['issues'].append(
+                f"Found {len(json_columns)} JSON columns ({result['details']['summary']['columns_without_indexes']} without indexes)"
+            )
 
-                result['recommendations'].extend([
-                    "JSON Optimization Opportunities in MySQL 8.0:",
-                    f"- Consider multi-valued indexes for JSON array fields:",
-                    "  CREATE INDEX idx ON table ((CAST(json_col->'$.array[*]' AS UNSIGNED ARRAY)));",
-                    "- Use JSON_TABLE() for better query performance:",
-                    "  SELECT * FROM table, JSON_TABLE(json_col, '$.path[*]' COLUMNS(...)) AS jt;",
-                    "- Consider functional indexes for frequently queried JSON paths:",
-                    "  CREATE INDEX idx ON table ((json_col->'$.field'));",
-                    "- Test new JSON functions: JSON_OVERLAPS(), JSON_VALUE(), etc."
-                ])
+            result['recommendations'].extend(JSON_RECOMMENDATIONS)
 
-                if json_routines:
-                    result['recommendations'].append(
-                        f"Review {len(json_routines)} stored routines using JSON functions for compatibility"
-                    )
-            else:
-                result['recommendations'].append("No JSON columns found in database")
+            if json_routines:
+                result['recommendations'].append(
+                    f"Review {len(json_routines)} stored routines using JSON functions for compatibility"
+                )
+        else:
+            result['recommendations'].append("No JSON columns found in database")
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'JSON Usage and Optimization',
-                'description': 'Analyzes JSON column usage and recommends MySQL 8.0 JSON optimization opportunities',
-                'status': 'ERROR',
-                'issues': [f"Error checking JSON usage: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_stored_routine_complexity(self, conn):
+    @_safe_check('Stored Routine Complexity', 'stored routine complexity',
+                 'Evaluates stored procedures and functions for size, complexity, and potential upgrade issues')
+    def _check_stored_routine_complexity(self, cursor):
         """
         Check 14: Stored Routine Complexity
         Analyze stored procedures and functions for complexity and potential issues.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Stored Routine Complexity',
-                'description': 'Evaluates stored procedures and functions for size, complexity, and potential upgrade issues',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'complex_routines': [],
-                    'routines_with_dynamic_sql': [],
-                    'summary': {
-                        'total_routines': 0,
-                        'complex_routines_count': 0,
-                        'dynamic_sql_count': 0
-                    }
+        result = {
+            'name': 'Stored Routine Complexity',
+            'description': 'Evaluates stored procedures and functions for size, complexity, and potential upgrade issues',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'complex_routines': [],
+                'routines_with_dynamic_sql': [],
+                'summary': {
+                    'total_routines': 0,
+                    'complex_routines_count': 0,
+                    'dynamic_sql_count': 0
                 }
             }
+        }
 
-            # Get stored routine complexity metrics
-            cursor.execute("""
-                SELECT
-                    routine_schema,
-                    routine_name,
-                    routine_type,
-                    LENGTH(routine_definition) as definition_length,
-                    created,
-                    last_altered,
-                    definer,
-                    security_type,
-                    sql_data_access,
-                    is_deterministic
-                FROM information_schema.routines
-                WHERE routine_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                ORDER BY definition_length DESC
-            """)
-            routines = cursor.fetchall()
-            result['details']['summary']['total_routines'] = len(routines)
-
-            if not routines:
-                result['recommendations'].append("No stored routines found")
-                return result
-
-            # Analyze routines
-            for routine in routines:
-                # Check for large/complex routines (>10KB)
-                if routine['definition_length'] > 10240:
-                    result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                    result['details']['complex_routines'].append({
-                        'schema': routine['routine_schema'],
-                        'name': routine['routine_name'],
-                        'type': routine['routine_type'],
-                        'size_kb': round(routine['definition_length'] / 1024, 2)
-                    })
-                    result['details']['summary']['complex_routines_count'] += 1
-                    result['issues'].append(
-                        f"{routine['routine_type']} '{routine['routine_schema']}.{routine['routine_name']}' "
-                        f"is {round(routine['definition_length'] / 1024, 2)}KB (large/complex)"
-                    )
+        # Routines come from the per-run snapshot, largest definitions first
+        routines = sorted(self._meta_cache['routines'],
+                          key=lambda r: -1 if r['definition_length'] is None else r['definition_length'],
+                          reverse=True)
+        result['details']['summary']['total_routines'] = len(routines)
 
-            # Check for dynamic SQL usage
-            cursor.execute("""
-                SELECT routine_schema, routine_name, routine_type
-                FROM information_schema.routines
-                WHERE routine_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND routine_definition LIKE '%PREPARE%'
-                AND routine_definition LIKE '%EXECUTE%'
-            """)
-            dynamic_sql_routines = cursor.fetchall()
-            result['details']['routines_with_dynamic_sql'] = dynamic_sql_routines
-            result['details']['summary']['dynamic_sql_count'] = len(dynamic_sql_routines)
+        if not routines:
+            result['recommendations'].append("No stored routines found")
+            return result
 
-            if dynamic_sql_routines:
-                result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                for routine in dynamic_sql_routines:
-                    result['issues'].append(
-                        f"{routine['routine_type']} '{routine['routine_schema']}.{routine['routine_name']}' uses dynamic SQL"
-                    )
+        # Check for large/complex routines (>10KB): largest first, so they lead the list
+        complex_routines = [
+            {
+                'schema': routine['routine_schema'],
+                'name': routine['routine_name'],
+                'type': routine['routine_type'],
+                'size_kb': round(routine['definition_length'] / 1024, 2)
+            }
+            for routine in takewhile(lambda r: r['definition_length'] is not None
+                                     and r['definition_length'] > 10240, routines)
+        ]
+        if complex_routines:
+            result['status'] = 'AMBER'
+            result['details']['complex_routines'] = complex_routines
+            result['details']['summary']['complex_routines_count'] = len(complex_routines)
+            result['issues'].extend(
+                f"{r['type']} '{r['schema']}.{r['name']}' is {r['size_kb']}KB (large/complex)"
+                for r in complex_routines
+            )
 
-            # Generate recommendations
-            if result['status'] != 'GREEN':
-                result['recommendations'].extend([
-                    "Complex Stored Routine Recommendations:",
-                    "- Test all stored procedures/functions thoroughly in MySQL 8.0 environment",
-                    "- Consider refactoring large routines (>10KB) into smaller, manageable units",
-                    "- Review dynamic SQL execution with new 8.0 parser",
-                    "- Document routine dependencies before upgrade",
-                    "- Test error handling and exception scenarios"
-                ])
-            else:
-                result['recommendations'].append(f"Found {len(routines)} stored routines - all appear compatible")
+        # Check for dynamic SQL usage
+        dynamic_sql_routines = [
+            {'routine_schema': r['routine_schema'], 'routine_name': r['routine_name'],
+             'routine_type': r['routine_type']}
+            for r in self._meta_cache['routines'] if r['uses_dynamic_sql']
+        ]
+        result['details']['routines_with_dynamic_sql'] = dynamic_sql_routines
+        result['details']['summary']['dynamic_sql_count'] = len(dynamic_sql_routines)
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Stored Routine Complexity',
-                'description': 'Evaluates stored procedures and functions for size, complexity, and potential upgrade issues',
-                'status': 'ERROR',
-                'issues': [f"Error checking stored routine complexity: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        if dynamic_sql_routines:
+            if result['status'] == 'GREEN':
+                result['status'] = 'AMBER'
+            result['issues'].extend(
+                f"{routine['routine_type']} '{routine['routine_schema']}.{routine['routine_name']}' uses dynamic SQL"
+                for routine in dynamic_sql_routines
+            )
 
-    def _check_spatial_srid(self, conn):
+        self._cap_reported(result['details'], 'complex_routines', 'routines_with_dynamic_sql')
+
+        # Generate recommendations
+        if result['status'] != 'GREEN':
+            result['recommendations'].extend(ROUTINE_COMPLEXITY_RECOMMENDATIONS)
+        else:
+            result['recommendations'].append(f"Found {len(routines)} stored routines - all appear compatible")
+
+        return result
+
+    @_safe_check('Spatial Data SRID Requirements', 'spatial SRID requirements',
+                 'Identifies spatial columns missing explicit SRID declarations required by MySQL 8.0')
+    def _check_spatial_srid(self, cursor):
         """
         Check 15: Spatial Data SRID Requirements
         Identify spatial columns lacking explicit SRID (required in MySQL 8.0).
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Spatial Data SRID Requirements',
-                'description': 'Identifies spatial columns missing explicit SRID declarations required by MySQL 8.0',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'spatial_columns': [],
-                    'summary': {
-                        'total_spatial_columns': 0,
-                        'columns_with_spatial_indexes': 0
-                    }
+        result = {
+            'name': 'Spatial Data SRID Requirements',
+            'description': 'Identifies spatial columns missing explicit SRID declarations required by MySQL 8.0',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'spatial_columns': [],
+                'summary': {
+                    'total_spatial_columns': 0,
+                    'columns_missing_srid': 0,
+                    'columns_with_spatial_indexes': 0
                 }
             }
+        }
 
-            # Find all spatial columns
-            cursor.execute("""
-                SELECT
-                    c.table_schema,
-                    c.table_name,
-                    c.column_name,
-                    c.column_type,
-                    c.data_type,
-                    (
-                        SELECT COUNT(*)
-                        FROM information_schema.statistics s
-                        WHERE s.table_schema = c.table_schema
-                        AND s.table_name = c.table_name
-                        AND s.column_name = c.column_name
-                        AND s.index_type = 'SPATIAL'
-                    ) as has_spatial_index,
-                    t.table_rows
-                FROM information_schema.columns c
-                JOIN information_schema.tables t
-                    ON c.table_schema = t.table_schema
-                    AND c.table_name = t.table_name
-                WHERE c.data_type IN (
-                    'geometry', 'point', 'linestring', 'polygon',
-                    'multipoint', 'multilinestring', 'multipolygon',
-                    'geometrycollection'
-                )
-                AND c.table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                ORDER BY c.table_schema, c.table_name, c.column_name
-            """)
-            spatial_columns = cursor.fetchall()
-
-            result['details']['summary']['total_spatial_columns'] = len(spatial_columns)
+        # Spatial columns and their SPATIAL index counts come from the per-run snapshot
+        spatial_index_counts = self._meta_cache['spatial_index_counts']
+        spatial_columns = [c for c in self._meta_cache['typed_columns']
+                           if c['data_type'].upper() in SPATIAL_DATA_TYPES]
 
-            if not spatial_columns:
-                result['recommendations'].append("No spatial data columns found")
-                return result
+        result['details']['summary']['total_spatial_columns'] = len(spatial_columns)
 
-            # Analyze spatial columns
-            result['status'] = 'RED'  # Spatial columns without explicit SRID will fail in 8.0
+        if not spatial_columns:
+            result['recommendations'].append("No spatial data columns found")
+            return result
 
-            for col in spatial_columns:
-                result['details']['spatial_columns'].append({
-                    'schema': col['table_schema'],
-                    'table': col['table_name'],
-                    'column': col['column_name'],
-                    'type': col['data_type'],
-                    'has_spatial_index': col['has_spatial_index'] > 0
-                })
+        # 5.7 has no SRID column attribute, so every column there still needs one. On 8.0
+        # st_geometry_columns reports the declared SRS_ID, NULL when the column has none.
+        declared_srid = set()
+        if self._server_is_80(cursor):
+            cursor.execute(f"""
+                SELECT table_schema, table_name, column_name
+                FROM information_schema.st_geometry_columns
+                WHERE srs_id IS NOT NULL
+                AND table_schema NOT IN {EXCLUDED_SCHEMAS_SQL}
+            """)
+            declared_srid = {(row['table_schema'], row['table_name'], row['column_name'])
+                             for row in self._iter_rows(cursor)}
+        missing_srid = [c for c in spatial_columns
+                        if (c['table_schema'], c['table_name'], c['column_name']) not in declared_srid]
+        result['details']['summary']['columns_missing_srid'] = len(missing_srid)
+
+        if not missing_srid:
+            result['recommendations'].append(
+                f"All {len(spatial_columns)} spatial columns declare an SRID"
+            )
+            return result
 
-                result['issues'].append(
-                    f"Spatial column '{col['table_schema']}.{col['table_name']}.{col['column_name']}' "
-                    f"({col['data_type']}) requires explicit SRID for MySQL 8.0"
-                )
+        # Analyze spatial columns
+        result['status'] = 'RED'  # Spatial columns without explicit SRID will fail in 8.0
+
+        spatial_details = [
+            {
+                'schema': col['table_schema'],
+                'table': col['table_name'],
+                'column': col['column_name'],
+                'type': col['data_type'],
+                'has_spatial_index': spatial_index_counts[(col['table_schema'], col['table_name'],
+                                                           col['column_name'])] > 0
+            }
+            for col in missing_srid
+        ]
+        result['details']['spatial_columns'] = spatial_details
+        result['details']['summary']['columns_with_spatial_indexes'] = sum(
+            col['has_spatial_index'] for col in spatial_details
+        )
+        result['issues'].extend(
+            f"Spatial column '{col['schema']}.{col['table']}.{col['column']}' "
+            f"({col['type']}) requires explicit SRID for MySQL 8.0"
+            for col in spatial_details
+        )
 
-                if col['has_spatial_index'] > 0:
-                    result['details']['summary']['columns_with_spatial_indexes'] += 1
+        self._cap_reported(result['details'], 'spatial_columns')
 
-            # Generate recommendations
-            result['recommendations'].extend([
-                "CRITICAL: All spatial columns require explicit SRID in MySQL 8.0:",
-                "1. Add SRID to spatial columns:",
-                "   ALTER TABLE schema.table MODIFY COLUMN location POINT SRID 4326;",
-                "   (Common SRIDs: 4326 for WGS84 GPS coordinates, 0 for Cartesian)",
-                "",
-                "2. Rebuild all spatial indexes after adding SRID:",
-                "   ALTER TABLE schema.table DROP INDEX spatial_idx;",
-                "   ALTER TABLE schema.table ADD SPATIAL INDEX spatial_idx(location);",
-                "",
-                "3. Update application code to specify SRID:",
-                "   ST_GeomFromText('POINT(1 1)', 4326)",
-                "   ST_GeomFromWKB(wkb_data, 4326)",
-                "",
-                f"Found {len(spatial_columns)} spatial columns requiring SRID specification"
-            ])
+        # Generate recommendations
+        result['recommendations'].extend(SPATIAL_SRID_RECOMMENDATIONS)
+        result['recommendations'].append(f"Found {len(missing_srid)} spatial columns requiring SRID specification")
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Spatial Data SRID Requirements',
-                'description': 'Identifies spatial columns missing explicit SRID declarations required by MySQL 8.0',
-                'status': 'ERROR',
-                'issues': [f"Error checking spatial SRID requirements: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_functional_index_opportunities(self, conn):
+    @_safe_check('Functional Index Opportunities', 'functional index opportunities',
+                 'Suggests MySQL 8.0 functional indexes for expressions commonly used in WHERE clauses')
+    def _check_functional_index_opportunities(self, cursor):
         """
         Check 16: Functional Index Opportunities
         Identify opportunities for MySQL 8.0 functional indexes.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Functional Index Opportunities',
-                'description': 'Suggests MySQL 8.0 functional indexes for expressions commonly used in WHERE clauses',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'string_columns': [],
-                    'datetime_columns': [],
-                    'json_columns': [],
-                    'summary': {
-                        'total_opportunities': 0
-                    }
+        result = {
+            'name': 'Functional Index Opportunities',
+            'description': 'Suggests MySQL 8.0 functional indexes for expressions commonly used in WHERE clauses',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'string_columns': [],
+                'datetime_columns': [],
+                'json_columns': [],
+                'summary': {
+                    'total_opportunities': 0
                 }
             }
+        }
 
-            # Find columns that could benefit from functional indexes
+        # Find columns that could benefit from functional indexes
 
-            # 1. String columns (for UPPER/LOWER functions)
-            cursor.execute("""
-                SELECT table_schema, table_name, column_name, data_type, column_type
-                FROM information_schema.columns
-                WHERE table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND data_type IN ('varchar', 'char', 'text')
-                AND character_maximum_length IS NOT NULL
-                ORDER BY table_schema, table_name, column_name
-                LIMIT 20
-            """)
-            string_columns = cursor.fetchall()
-            result['details']['string_columns'] = string_columns
-
-            # 2. DateTime columns (for DATE/YEAR functions)
-            cursor.execute("""
-                SELECT table_schema, table_name, column_name, data_type
-                FROM information_schema.columns
-                WHERE table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND data_type IN ('datetime', 'timestamp', 'date')
-                ORDER BY table_schema, table_name, column_name
-                LIMIT 20
-            """)
-            datetime_columns = cursor.fetchall()
-            result['details']['datetime_columns'] = datetime_columns
+        # All three come from the per-run snapshot, in (schema, table, column) order
+        cols = self._meta_cache['columns']
 
-            # 3. JSON columns (for path expressions)
-            cursor.execute("""
-                SELECT table_schema, table_name, column_name
-                FROM information_schema.columns
-                WHERE table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND data_type = 'json'
-                ORDER BY table_schema, table_name, column_name
-            """)
-            json_columns = cursor.fetchall()
-            result['details']['json_columns'] = json_columns
-
-            total_opportunities = len(string_columns) + len(datetime_columns) + len(json_columns)
-            result['details']['summary']['total_opportunities'] = total_opportunities
-
-            if total_opportunities > 0:
-                result['issues'].append(
-                    f"Found {total_opportunities} columns that could benefit from functional indexes"
-                )
+        # 1. String columns (for UPPER/LOWER functions)
+        string_indexes = heapq.nsmallest(
+            FUNCTIONAL_INDEX_COLUMNS_REPORTED,
+            (i for i, data_type in enumerate(cols['data_type'])
+             if data_type.lower() in FUNCTIONAL_INDEX_STRING_TYPES
+             and cols['character_maximum_length'][i] is not None),
+            key=lambda i: (cols['table_schema'][i], cols['table_name'][i], cols['column_name'][i])
+        )
+        string_columns = [{field: cols[field][i] for field in
+                           ('table_schema', 'table_name', 'column_name', 'data_type', 'column_type')}
+                          for i in string_indexes]
+        result['details']['string_columns'] = string_columns
+
+        # 2. DateTime columns (for DATE/YEAR functions) and 3. JSON columns (for path
+        # expressions), routed in one pass over the snapshot's typed columns
+        datetime_columns = []
+        json_columns = []
+        for c in self._meta_cache['typed_columns']:
+            data_type = c['data_type'].lower()
+            if data_type == 'json':
+                json_columns.append({'table_schema': c['table_schema'], 'table_name': c['table_name'],
+                                     'column_name': c['column_name']})
+            elif (data_type in FUNCTIONAL_INDEX_DATETIME_TYPES
+                  and len(datetime_columns) < FUNCTIONAL_INDEX_COLUMNS_REPORTED):
+                datetime_columns.append({'table_schema': c['table_schema'], 'table_name': c['table_name'],
+                                         'column_name': c['column_name'], 'data_type': c['data_type']})
+        result['details']['datetime_columns'] = datetime_columns
+        result['details']['json_columns'] = json_columns
+
+        total_opportunities = len(string_columns) + len(datetime_columns) + len(json_columns)
+        result['details']['summary']['total_opportunities'] = total_opportunities
+
+        if total_opportunities > 0:
+            result['issues'].append(
+                f"Found {total_opportunities} columns that could benefit from functional indexes"
+            )
 
-                result['recommendations'].extend([
-                    "Functional Index Opportunities in MySQL 8.0:",
-                    "",
-                    "1. For case-insensitive string searches:",
-                    "   CREATE INDEX idx_name_lower ON table ((LOWER(name)));",
-                    "   Then use: SELECT * FROM table WHERE LOWER(name) = 'value';",
-                    "",
-                    "2. For date-based queries:",
-                    "   CREATE INDEX idx_created_date ON table ((DATE(created_at)));",
-                    "   CREATE INDEX idx_created_year ON table ((YEAR(created_at)));",
-                    "",
-                    "3. For JSON path expressions:",
-                    "   CREATE INDEX idx_json_field ON table ((json_col->'$.field'));",
-                    "   CREATE INDEX idx_json_array ON table ((CAST(json_col->'$.array[*]' AS UNSIGNED ARRAY)));",
-                    "",
-                    "Note: Test performance before deploying to production",
-                    "Functional indexes work best for frequently executed queries"
-                ])
-            else:
-                result['recommendations'].append("No obvious functional index opportunities identified")
+            result['recommendations'].extend(FUNCTIONAL_INDEX_RECOMMENDATIONS)
+        else:
+            result['recommendations'].append("No obvious functional index opportunities identified")
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Functional Index Opportunities',
-                'description': 'Suggests MySQL 8.0 functional indexes for expressions commonly used in WHERE clauses',
-                'status': 'ERROR',
-                'issues': [f"Error checking functional index opportunities: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_index_statistics(self, conn):
+    @_safe_check('Index Statistics and Duplication', 'index statistics',
+                 'Detects duplicate indexes and low-cardinality indexes that impact performance')
+    def _check_index_statistics(self, cursor):
         """
         Check 17: Index Statistics and Duplication
         Identify duplicate indexes and low-cardinality indexes.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Index Statistics and Duplication',
-                'description': 'Detects duplicate indexes and low-cardinality indexes that impact performance',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'duplicate_indexes': [],
-                    'low_cardinality_indexes': [],
-                    'summary': {
-                        'total_indexes': 0,
-                        'duplicate_count': 0,
-                        'low_cardinality_count': 0
-                    }
+        result = {
+            'name': 'Index Statistics and Duplication',
+            'description': 'Detects duplicate indexes and low-cardinality indexes that impact performance',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'duplicate_indexes': [],
+                'low_cardinality_indexes': [],
+                'summary': {
+                    'total_indexes': 0,
+                    'duplicate_count': 0,
+                    'low_cardinality_count': 0
                 }
             }
+        }
 
-            # Get all indexes with their columns
-            cursor.execute("""
-                SELECT
-                    table_schema,
-                    table_name,
-                    index_name,
-                    GROUP_CONCAT(column_name ORDER BY seq_in_index) as columns,
-                    index_type,
-                    non_unique,
-                    MAX(cardinality) as max_cardinality
-                FROM information_schema.statistics
-                WHERE table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND index_name != 'PRIMARY'
-                GROUP BY table_schema, table_name, index_name, index_type, non_unique
-                ORDER BY table_schema, table_name, index_name
-            """)
-            indexes = cursor.fetchall()
-            result['details']['summary']['total_indexes'] = len(indexes)
-
-            if not indexes:
-                result['recommendations'].append("No secondary indexes found")
-                return result
-
-            # Find duplicate indexes
-            index_map = {}
-            for idx in indexes:
-                key = f"{idx['table_schema']}.{idx['table_name']}"
-                if key not in index_map:
-                    index_map[key] = []
-                index_map[key].append(idx)
-
-            for table_key, table_indexes in index_map.items():
-                # Compare indexes for duplicates
-                for i in range(len(table_indexes)):
-                    for j in range(i + 1, len(table_indexes)):
-                        idx1 = table_indexes[i]
-                        idx2 = table_indexes[j]
-
-                        # Check if same column set
-                        if idx1['columns'] == idx2['columns']:
-                            result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                            result['details']['duplicate_indexes'].append({
-                                'table': table_key,
-                                'index1': idx1['index_name'],
-                                'index2': idx2['index_name'],
-                                'columns': idx1['columns']
-                            })
-                            result['details']['summary']['duplicate_count'] += 1
-                            result['issues'].append(
-                                f"Duplicate indexes on {table_key}: '{idx1['index_name']}' and '{idx2['index_name']}' (both on {idx1['columns']})"
-                            )
+        # Secondary indexes, one entry each with their columns joined in index order,
+        # come from the per-run snapshot
+        indexes = self._meta_cache['secondary_indexes']
+        result['details']['summary']['total_indexes'] = len(indexes)
+
+        if not indexes:
+            result['recommendations'].append("No secondary indexes found")
+            return result
+
+        # One pass: bucket indexes by (schema, table, columns) so only indexes on the same column
+        # list are paired, and check cardinality on the way
+        # The per-index loops write to locals; counts and status are set once afterwards
+        summary = result['details']['summary']
+        low_cardinality_indexes = result['details']['low_cardinality_indexes']
+        duplicate_indexes = result['details']['duplicate_indexes']
+        buckets = {}
+        duplicate_pairs = []
+        for position, idx in enumerate(indexes):
+            bucket = buckets.setdefault((idx['table_schema'], idx['table_name'], idx['columns']), [])
+            duplicate_pairs.extend((earlier_position, position) for earlier_position in bucket)
+            bucket.append(position)
 
             # Check for low cardinality indexes (cardinality < 10)
-            for idx in indexes:
-                if idx['max_cardinality'] is not None and idx['max_cardinality'] < 10 and idx['non_unique'] == 1:
-                    result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                    result['details']['low_cardinality_indexes'].append({
-                        'table': f"{idx['table_schema']}.{idx['table_name']}",
-                        'index': idx['index_name'],
-                        'cardinality': idx['max_cardinality']
-                    })
-                    result['details']['summary']['low_cardinality_count'] += 1
+            max_cardinality = idx['max_cardinality']
+            if max_cardinality is not None and max_cardinality < 10 and idx['non_unique'] == 1:
+                low_cardinality_indexes.append({
+                    'table': f"{idx['table_schema']}.{idx['table_name']}",
+                    'index': idx['index_name'],
+                    'cardinality': max_cardinality
+                })
 
-            # Generate recommendations
-            if result['details']['duplicate_indexes']:
-                result['recommendations'].extend([
-                    "Remove duplicate indexes to improve performance:",
-                    "- Use MySQL 8.0 invisible indexes to test before dropping:",
-                    "  ALTER TABLE schema.table ALTER INDEX index_name INVISIBLE;",
-                    "  -- Monitor performance, then drop if no issues:",
-                    "  DROP INDEX index_name ON schema.table;"
-                ])
+        # Report duplicates in the order a pairwise scan of each table would find them
+        duplicate_pairs.sort()
+        for first, second in duplicate_pairs:
+            idx1 = indexes[first]
+            idx2 = indexes[second]
+            table_key = f"{idx1['table_schema']}.{idx1['table_name']}"
+            duplicate_indexes.append({
+                'table': table_key,
+                'index1': idx1['index_name'],
+                'index2': idx2['index_name'],
+                'columns': idx1['columns']
+            })
+        result['issues'].extend(DUPLICATE_INDEX_ISSUE_TEMPLATE.format_map(d) for d in duplicate_indexes)
+        summary['low_cardinality_count'] = len(low_cardinality_indexes)
+        summary['duplicate_count'] = len(duplicate_indexes)
+        result['status'] = 'AMBER' if low_cardinality_indexes or duplicate_indexes else 'GREEN'
+
+        # Generate recommendations
+        if result['details']['duplicate_indexes']:
+            result['recommendations'].extend([
+                "Remove duplicate indexes to improve performance:",
+                "- Use MySQL 8.0 invisible indexes to test before dropping:",
+                "  ALTER TABLE schema.table ALTER INDEX index_name INVISIBLE;",
+                "  -- Monitor performance, then drop if no issues:",
+                "  DROP INDEX index_name ON schema.table;"
+            ])
 
-            if result['details']['low_cardinality_indexes']:
-                result['recommendations'].append(
-                    f"Review {result['details']['summary']['low_cardinality_count']} low-cardinality indexes for effectiveness"
-                )
+        if result['details']['low_cardinality_indexes']:
+            result['recommendations'].append(
+                f"Review {result['details']['summary']['low_cardinality_count']} low-cardinality indexes for effectiveness"
+            )
 
-            if result['status'] == 'GREEN':
-                result['recommendations'].append(f"Analyzed {len(indexes)} indexes - no obvious issues found")
+        if result['status'] == 'GREEN':
+            result['recommendations'].append(f"Analyzed {len(indexes)} indexes - no obvious issues found")
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Index Statistics and Duplication',
-                'description': 'Detects duplicate indexes and low-cardinality indexes that impact performance',
-                'status': 'ERROR',
-                'issues': [f"Error checking index statistics: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_autoinc_exhaustion(self, conn):
+    @_safe_check('Auto-Increment Exhaustion', 'auto-increment exhaustion',
+                 'Identifies auto-increment columns approaching their maximum values based on data type limits')
+    def _check_autoinc_exhaustion(self, cursor):
         """
         Check 18: Auto-Increment Exhaustion
         Identify tables approaching auto-increment limits.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Auto-Increment Exhaustion',
-                'description': 'Identifies auto-increment columns approaching their maximum values based on data type limits',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'high_usage_tables': [],
-                    'summary': {
-                        'total_autoinc_tables': 0,
-                        'critical_count': 0,
-                        'warning_count': 0
-                    }
+        result = {
+            'name': 'Auto-Increment Exhaustion',
+            'description': 'Identifies auto-increment columns approaching their maximum values based on data type limits',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'high_usage_tables': [],
+                'summary': {
+                    'total_autoinc_tables': 0,
+                    'critical_count': 0,
+                    'warning_count': 0
                 }
             }
-
-            # Get auto-increment information
+        }
+
+        # Join auto-increment columns to their tables' counters within the metadata snapshot,
+        # rather than re-running a tables/columns join against information_schema
+        tables_by_key = self._meta_cache['tables_by_key']
+        high_usage_tables = result['details']['high_usage_tables']
+        issues = result['issues']
+        total_autoinc_tables = 0
+        critical_count = warning_count = 0
+        for column in self._meta_cache['autoinc_columns']:
+            # The table scan runs alongside the column scan, so a table created or dropped
+            # in between may be missing
+            owner = tables_by_key.get((column['table_schema'], column['table_name']))
+            if owner is None or owner['auto_increment'] is None:
+                continue
+            auto_increment = owner['auto_increment']
+            total_autoinc_tables += 1
             # Note: Check for UNSIGNED/SIGNED to use correct max values
-            cursor.execute("""
-                SELECT
-                    t.table_schema,
-                    t.table_name,
-                    t.auto_increment,
-                    c.column_name,
-                    c.data_type,
-                    c.column_type,
-                    CASE
-                        -- UNSIGNED values
-                        WHEN c.column_type LIKE '%unsigned%' AND c.data_type = 'tinyint' THEN 255
-                        WHEN c.column_type LIKE '%unsigned%' AND c.data_type = 'smallint' THEN 65535
-                        WHEN c.column_type LIKE '%unsigned%' AND c.data_type = 'mediumint' THEN 16777215
-                        WHEN c.column_type LIKE '%unsigned%' AND c.data_type = 'int' THEN 4294967295
-                        WHEN c.column_type LIKE '%unsigned%' AND c.data_type = 'bigint' THEN 18446744073709551615
-                        -- SIGNED values (default if unsigned not specified)
-                        WHEN c.data_type = 'tinyint' THEN 127
-                        WHEN c.data_type = 'smallint' THEN 32767
-                        WHEN c.data_type = 'mediumint' THEN 8388607
-                        WHEN c.data_type = 'int' THEN 2147483647
-                        WHEN c.data_type = 'bigint' THEN 9223372036854775807
-                    END as max_value
-                FROM information_schema.tables t
-                JOIN information_schema.columns c
-                    ON t.table_schema = c.table_schema
-                    AND t.table_name = c.table_name
-                WHERE t.table_schema NOT IN ('mysql', 'sys', 'information_schema', 'performance_schema')
-                AND t.auto_increment IS NOT NULL
-                AND c.extra LIKE '%auto_increment%'
-                ORDER BY t.table_schema, t.table_name
-            """)
-            autoinc_tables = cursor.fetchall()
-            result['details']['summary']['total_autoinc_tables'] = len(autoinc_tables)
-
-            if not autoinc_tables:
-                result['recommendations'].append("No auto-increment tables found")
-                return result
-
-            # Analyze auto-increment usage
-            for table in autoinc_tables:
-                if table['max_value'] and table['auto_increment']:
-                    percent_used = (table['auto_increment'] / table['max_value']) * 100
-
-                    table_info = {
-                        'schema': table['table_schema'],
-                        'table': table['table_name'],
-                        'column': table['column_name'],
-                        'column_type': table['column_type'],
-                        'current': table['auto_increment'],
-                        'max': table['max_value'],
-                        'percent_used': round(percent_used, 2)
-                    }
-
-                    # Critical: >90% capacity
-                    if percent_used > 90:
-                        result['status'] = 'RED'
-                        result['details']['summary']['critical_count'] += 1
-                        result['details']['high_usage_tables'].append(table_info)
-                        result['issues'].append(
-                            f"CRITICAL: Table '{table['table_schema']}.{table['table_name']}' "
-                            f"column '{table['column_name']}' ({table['column_type']}) "
-                            f"at {round(percent_used, 1)}% capacity "
-                            f"({table['auto_increment']:,} of {table['max_value']:,})"
-                        )
-
-                    # Warning: >70% capacity
-                    elif percent_used > 70:
-                        if result['status'] == 'GREEN':
-                            result['status'] = 'AMBER'
-                        result['details']['summary']['warning_count'] += 1
-                        result['details']['high_usage_tables'].append(table_info)
-                        result['issues'].append(
-                            f"WARNING: Table '{table['table_schema']}.{table['table_name']}' "
-                            f"column '{table['column_name']}' ({table['column_type']}) "
-                            f"at {round(percent_used, 1)}% capacity "
-                            f"({table['auto_increment']:,} of {table['max_value']:,})"
-                        )
-
-            # Generate recommendations
-            if result['status'] == 'RED':
-                result['recommendations'].extend([
-                    "CRITICAL: Auto-increment exhaustion detected!",
-                    "",
-                    "Immediate Actions:",
-                    "1. Convert auto-increment columns to BIGINT:",
-                    "   ALTER TABLE schema.table MODIFY COLUMN id BIGINT UNSIGNED AUTO_INCREMENT;",
-                    "",
-                    "2. Run ANALYZE TABLE after modification:",
-                    "   ANALYZE TABLE schema.table;",
-                    "",
-                    "3. Consider data archiving to reset auto-increment:",
-                    "   - Move old data to archive table",
-                    "   - Drop and recreate original table",
-                    "",
-                    f"Found {result['details']['summary']['critical_count']} tables requiring immediate attention"
-                ])
-            elif result['status'] == 'AMBER':
-                result['recommendations'].extend([
-                    "Monitor auto-increment usage:",
-                    "- Plan to convert columns to larger data types before 90% capacity",
-                    "- Consider implementing data archiving strategy",
-                    "- Monitor growth rate and project exhaustion timeline",
-                    "",
-                    f"Found {result['details']['summary']['warning_count']} tables approaching capacity limits"
-                ])
+            thresholds = AUTOINC_THRESHOLDS.get((column['data_type'].lower(),
+                                                 'unsigned' in column['column_type'].lower()))
+            if thresholds is None:
+                continue
+            max_value, critical_above, warning_above = thresholds
+
+            # Critical: >90% capacity; Warning: >70% capacity
+            if auto_increment > critical_above:
+                critical_count += 1
+                level = 'CRITICAL'
+            elif auto_increment > warning_above:
+                warning_count += 1
+                level = 'WARNING'
             else:
-                result['recommendations'].append(
-                    f"Analyzed {len(autoinc_tables)} auto-increment tables - all within safe limits"
-                )
+                continue
+            percent_used = (auto_increment / max_value) * 100
+            high_usage_tables.append({
+                'schema': column['table_schema'],
+                'table': column['table_name'],
+                'column': column['column_name'],
+                'column_type': column['column_type'],
+                'current': auto_increment,
+                'max': max_value,
+                'percent_used': round(percent_used, 2)
+            })
+            issues.append(
+                f"{level}: Table '{column['table_schema']}.{column['table_name']}' "
+                f"column '{column['column_name']}' ({column['column_type']}) "
+                f"at {round(percent_used, 1)}% capacity "
+                f"({auto_increment:,} of {max_value:,})"
+            )
 
+        summary = result['details']['summary']
+        summary['critical_count'] = critical_count
+        summary['warning_count'] = warning_count
+        summary['total_autoinc_tables'] = total_autoinc_tables
+        if self._caches_table_stats():
+            # See _prep_session: the snapshot's tables scan may read cached statistics
+            result['details']['note'] = (
+                f"auto_increment values come from information_schema table statistics, which "
+                f"MySQL 8.0 may serve up to {INFORMATION_SCHEMA_STATS_EXPIRY // 3600} hours old")
+        result['status'] = STATUS_LEVELS[2 if critical_count else 1 if warning_count else 0]
+        if not total_autoinc_tables:
+            result['recommendations'].append("No auto-increment tables found")
             return result
-        except Exception as e:
-            return {
-                'name': 'Auto-Increment Exhaustion',
-                'description': 'Identifies auto-increment columns approaching their maximum values based on data type limits',
-                'status': 'ERROR',
-                'issues': [f"Error checking auto-increment exhaustion: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
 
-    def _check_replication_topology(self, conn):
+        # Generate recommendations
+        if result['status'] == 'RED':
+            result['recommendations'].extend([
+                "CRITICAL: Auto-increment exhaustion detected!",
+                "",
+                "Immediate Actions:",
+                "1. Convert auto-increment columns to BIGINT:",
+                "   ALTER TABLE schema.table MODIFY COLUMN id BIGINT UNSIGNED AUTO_INCREMENT;",
+                "",
+                "2. Run ANALYZE TABLE after modification:",
+                "   ANALYZE TABLE schema.table;",
+                "",
+                "3. Consider data archiving to reset auto-increment:",
+                "   - Move old data to archive table",
+                "   - Drop and recreate original table",
+                "",
+                f"Found {result['details']['summary']['critical_count']} tables requiring immediate attention"
+            ])
+        elif result['status'] == 'AMBER':
+            result['recommendations'].extend([
+                "Monitor auto-increment usage:",
+                "- Plan to convert columns to larger data types before 90% capacity",
+                "- Consider implementing data archiving strategy",
+                "- Monitor growth rate and project exhaustion timeline",
+                "",
+                f"Found {result['details']['summary']['warning_count']} tables approaching capacity limits"
+            ])
+        else:
+            result['recommendations'].append(
+                f"Analyzed {total_autoinc_tables} auto-increment tables - all within safe limits"
+            )
+        if 'note' in result['details']:
+            result['recommendations'].append(f"Note: {result['details']['note']}")
+
+        return result
+
+    @_safe_check('Replication Topology', 'replication topology',
+                 'Analyzes replication configuration, lag, and readiness for upgrade with minimal downtime')
+    def _check_replication_topology(self, cursor):
         """
         Check 19: Replication Topology
         Analyze replication configuration and lag (NO GTID recommendations per user requirement).
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Replication Topology',
-                'description': 'Analyzes replication configuration, lag, and readiness for upgrade with minimal downtime',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'replication_status': {},
-                    'long_running_transactions': [],
-                    'summary': {
-                        'is_replica': False,
-                        'replication_lag_seconds': None,
-                        'long_transactions_count': 0
-                    }
+        result = {
+            'name': 'Replication Topology',
+            'description': 'Analyzes replication configuration, lag, and readiness for upgrade with minimal downtime',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'replication_status': {},
+                'long_running_transactions': [],
+                'summary': {
+                    'is_replica': False,
+                    'replication_lag_seconds': None,
+                    'long_transactions_count': 0
                 }
             }
+        }
 
-            # Check replication status
-            try:
-                cursor.execute("SHOW SLAVE STATUS")
-                slave_status = cursor.fetchone()
-
-                if slave_status:
-                    result['details']['summary']['is_replica'] = True
-                    result['details']['replication_status'] = {
-                        'slave_io_running': slave_status.get('Slave_IO_Running'),
-                        'slave_sql_running': slave_status.get('Slave_SQL_Running'),
-                        'seconds_behind_master': slave_status.get('Seconds_Behind_Master'),
-                        'last_error': slave_status.get('Last_Error')
-                    }
+        # Check replication status, with the statement (and column names) the server prefers
+        uses_replica_terms = self._supports_replica_status(cursor)
+        try:
+            cursor.execute("SHOW REPLICA STATUS" if uses_replica_terms else "SHOW SLAVE STATUS")
+            replica_status = cursor.fetchone()
+
+            if replica_status:
+                if uses_replica_terms:
+                    io_running = replica_status.get('Replica_IO_Running')
+                    sql_running = replica_status.get('Replica_SQL_Running')
+                    lag_seconds = replica_status.get('Seconds_Behind_Source')
+                else:
+                    io_running = replica_status.get('Slave_IO_Running')
+                    sql_running = replica_status.get('Slave_SQL_Running')
+                    lag_seconds = replica_status.get('Seconds_Behind_Master')
+                result['details']['summary']['is_replica'] = True
+                result['details']['replication_status'] = {
+                    'slave_io_running': io_running,
+                    'slave_sql_running': sql_running,
+                    'seconds_behind_master': lag_seconds,
+                    'last_error': replica_status.get('Last_Error')
+                }
 
-                    lag_seconds = slave_status.get('Seconds_Behind_Master')
-                    if lag_seconds is not None:
-                        result['details']['summary']['replication_lag_seconds'] = lag_seconds
-
-                        # Critical: lag >60 seconds
-                        if lag_seconds > 60:
-                            result['status'] = 'RED'
-                            result['issues'].append(
-                                f"CRITICAL: Replication lag is {lag_seconds} seconds (>60s threshold)"
-                            )
-                        # Warning: lag >10 seconds
-                        elif lag_seconds > 10:
-                            result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                            result['issues'].append(
-                                f"WARNING: Replication lag is {lag_seconds} seconds"
-                            )
-            except Exception:
-                # Not a replica or permission issue
-                pass
-
-            # Check for long-running transactions that could block replication
-            cursor.execute("""
-                SELECT
-                    id,
-                    user,
-                    host,
-                    db,
-                    command,
-                    time,
-                    state,
-                    LEFT(info, 100) as query_preview
-                FROM information_schema.processlist
-                WHERE command NOT IN ('Sleep', 'Binlog Dump', 'Binlog Dump GTID')
-                AND time > 300
-                ORDER BY time DESC
-            """)
-            long_transactions = cursor.fetchall()
-            result['details']['long_running_transactions'] = long_transactions
-            result['details']['summary']['long_transactions_count'] = len(long_transactions)
+                if lag_seconds is not None:
+                    result['details']['summary']['replication_lag_seconds'] = lag_seconds
 
-            if long_transactions:
-                result['status'] = 'AMBER' if result['status'] == 'GREEN' else result['status']
-                result['issues'].append(
-                    f"Found {len(long_transactions)} long-running transactions (>5 minutes)"
-                )
+                    # Critical: lag >60 seconds
+                    if lag_seconds > 60:
+                        result['status'] = 'RED'
+                        result['issues'].append(
+                            f"CRITICAL: Replication lag is {lag_seconds} seconds (>60s threshold)"
+                        )
+                    # Warning: lag >10 seconds
+                    elif lag_seconds > 10:
+                        if result['status'] == 'GREEN':
+                            result['status'] = 'AMBER'
+                        result['issues'].append(
+                            f"WARNING: Replication lag is {lag_seconds} seconds"
+                        )
+        except Exception:
+            # Not a replica or permission issue
+            pass
+
+        # Check for long-running transactions that could block replication. Only the
+        # longest-running few are reported; the total is counted only when the limit is hit.
+        long_transaction_filter = """
+            FROM information_schema.processlist
+            WHERE command NOT IN ('Sleep', 'Binlog Dump', 'Binlog Dump GTID')
+            AND time > 300
+        """
+        cursor.execute(f"""
+            SELECT
+                id,
+                user,
+                host,
+                db,
+                command,
+                time,
+                state,
+                LEFT(info, 100) as query_preview
+            {long_transaction_filter}
+            ORDER BY time DESC
+            LIMIT {LONG_TRANSACTIONS_REPORTED}
+        """)
+        long_transactions = cursor.fetchall()
+        long_transaction_count = len(long_transactions)
+        if long_transaction_count == LONG_TRANSACTIONS_REPORTED:
+            cursor.execute(f"SELECT COUNT(*) as count {long_transaction_filter}")
+            long_transaction_count = max(cursor.fetchone()['count'], long_transaction_count)
+        result['details']['long_running_transactions'] = long_transactions
+        result['details']['summary']['long_transactions_count'] = long_transaction_count
+        if long_transaction_count > len(long_transactions):
+            result['details'].setdefault('truncated', {})['long_running_transactions'] = (
+                long_transaction_count - len(long_transactions))
+
+        if long_transactions:
+            if result['status'] == 'GREEN':
+                result['status'] = 'AMBER'
+            result['issues'].append(
+                f"Found {long_transaction_count} long-running transactions (>5 minutes)"
+            )
 
-            # Generate recommendations (NO GTID per user requirement)
-            if result['status'] != 'GREEN':
-                result['recommendations'].extend([
-                    "Replication Recommendations:",
-                    "",
-                    "Before Upgrade:",
-                    "- Resolve any replication lag before starting upgrade",
-                    "- Kill or complete long-running transactions",
-                    "- Monitor replication health closely",
-                    "",
-                    "During Upgrade:",
-                    "- For Aurora: Upgrade replicas before primary instance",
-                    "- Monitor replication lag throughout upgrade process",
-                    "- Have rollback plan ready",
-                    "",
-                    "After Upgrade:",
-                    "- Verify replication is functioning correctly",
-                    "- Monitor for any lag or errors",
-                    "- Test failover procedures"
-                ])
+        # Generate recommendations (NO GTID per user requirement)
+        if result['status'] != 'GREEN':
+            result['recommendations'].extend([
+                "Replication Recommendations:",
+                "",
+                "Before Upgrade:",
+                "- Resolve any replication lag before starting upgrade",
+                "- Kill or complete long-running transactions",
+                "- Monitor replication health closely",
+                "",
+                "During Upgrade:",
+                "- For Aurora: Upgrade replicas before primary instance",
+                "- Monitor replication lag throughout upgrade process",
+                "- Have rollback plan ready",
+                "",
+                "After Upgrade:",
+                "- Verify replication is functioning correctly",
+                "- Monitor for any lag or errors",
+                "- Test failover procedures"
+            ])
 
-                if long_transactions:
-                    result['recommendations'].append(
-                        "\nLong-running transactions detected - investigate and resolve before upgrade"
-                    )
+            if long_transactions:
+                result['recommendations'].append(
+                    "\nLong-running transactions detected - investigate and resolve before upgrade"
+                )
+        else:
+            if result['details']['summary']['is_replica']:
+                result['recommendations'].append("Replication is healthy and ready for upgrade")
             else:
-                if result['details']['summary']['is_replica']:
-                    result['recommendations'].append("Replication is healthy and ready for upgrade")
-                else:
-                    result['recommendations'].append("Not configured as a replica - no replication checks needed")
+                result['recommendations'].append("Not configured as a replica - no replication checks needed")
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Replication Topology',
-                'description': 'Analyzes replication configuration, lag, and readiness for upgrade with minimal downtime',
-                'status': 'ERROR',
-                'issues': [f"Error checking replication topology: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
+        return result
 
-    def _check_connection_configuration(self, conn):
+    @_safe_check('Connection Configuration', 'connection configuration',
+                 'Reviews connection limits, thread cache, and connection-related settings for optimal upgrade performance')
+    def _check_connection_configuration(self, cursor):
         """
         Check 20: Connection Configuration
         Analyze connection patterns and session settings.
         """
-        cursor = None
-        try:
-            cursor = conn.cursor(dictionary=True)
-            result = {
-                'name': 'Connection Configuration',
-                'description': 'Reviews connection limits, thread cache, and connection-related settings for optimal upgrade performance',
-                'status': 'GREEN',
-                'issues': [],
-                'recommendations': [],
-                'details': {
-                    'connection_stats': {},
-                    'system_variables': {},
-                    'summary': {
-                        'total_connections': 0,
-                        'sleeping_connections': 0,
-                        'active_connections': 0,
-                        'max_connections': 0,
-                        'usage_percent': 0
-                    }
+        result = {
+            'name': 'Connection Configuration',
+            'description': 'Reviews connection limits, thread cache, and connection-related settings for optimal upgrade performance',
+            'status': 'GREEN',
+            'issues': [],
+            'recommendations': [],
+            'details': {
+                'connection_stats': {},
+                'system_variables': {},
+                'summary': {
+                    'total_connections': 0,
+                    'sleeping_connections': 0,
+                    'active_connections': 0,
+                    'max_connections': 0,
+                    'usage_percent': 0
                 }
             }
+        }
 
-            # Get connection statistics from performance_schema
-            try:
-                cursor.execute("""
-                    SELECT
-                        processlist_user,
-                        processlist_host,
-                        COUNT(*) as connection_count,
-                        SUM(IF(processlist_command = 'Sleep', 1, 0)) as sleeping,
-                        SUM(IF(processlist_time > 30, 1, 0)) as long_running
-                    FROM performance_schema.threads
-                    WHERE processlist_user IS NOT NULL
-                    AND processlist_user NOT IN ('system user', 'rdsadmin')
-                    GROUP BY processlist_user, processlist_host
-                    ORDER BY connection_count DESC
-                    LIMIT 10
-                """)
-                connection_stats = cursor.fetchall()
-                result['details']['connection_stats'] = connection_stats
-
-                # Calculate totals
-                total_conn = sum(c['connection_count'] for c in connection_stats)
-                total_sleeping = sum(c['sleeping'] for c in connection_stats)
-                result['details']['summary']['total_connections'] = total_conn
-                result['details']['summary']['sleeping_connections'] = total_sleeping
-                result['details']['summary']['active_connections'] = total_conn - total_sleeping
-            except Exception:
-                # performance_schema might not be available
-                pass
-
-            # Get system variables
-            cursor.execute("""
+        # Get connection statistics from performance_schema. The assessment's own sessions (this
+        # checker's pool, all connected as USER() from this host) are left out of the totals.
+        try:
+            thread_filter = """
+                FROM performance_schema.threads
+                WHERE processlist_user IS NOT NULL
+                AND processlist_user NOT IN ('system user', 'rdsadmin')
+                AND NOT (processlist_user <=> SUBSTRING_INDEX(USER(), '@', 1)
+                         AND processlist_host <=> SUBSTRING_INDEX(USER(), '@', -1))
+            """
+            cursor.execute(f"""
                 SELECT
-                    @@max_connections as max_connections,
-                    @@max_user_connections as max_user_connections,
-                    @@thread_cache_size as thread_cache_size,
-                    @@connect_timeout as connect_timeout,
-                    @@wait_timeout as wait_timeout,
-                    @@interactive_timeout as interactive_timeout
+                    processlist_user,
+                    processlist_host,
+                    COUNT(*) as connection_count,
+                    SUM(IF(processlist_command = 'Sleep', 1, 0)) as sleeping,
+                    SUM(IF(processlist_time > 30, 1, 0)) as long_running
+                {thread_filter}
+                GROUP BY processlist_user, processlist_host
+                ORDER BY connection_count DESC
+                LIMIT {CONNECTION_GROUPS_REPORTED}
             """)
-            system_vars = cursor.fetchone()
-            result['details']['system_variables'] = system_vars
-
-            if system_vars:
-                result['details']['summary']['max_connections'] = system_vars['max_connections']
+            connection_stats = cursor.fetchall()
+            result['details']['connection_stats'] = connection_stats
 
-                # Check connection usage
-                if result['details']['summary']['total_connections'] > 0:
-                    usage_percent = (result['details']['summary']['total_connections'] / system_vars['max_connections']) * 100
-                    result['details']['summary']['usage_percent'] = round(usage_percent, 2)
-
-                    # Warning: >80% capacity
-                    if usage_percent > 80:
-                        result['status'] = 'AMBER'
-                        result['issues'].append(
-                            f"Connection usage at {round(usage_percent, 1)}% of max_connections ({result['details']['summary']['total_connections']}/{system_vars['max_connections']})"
-                        )
-
-            # Generate recommendations
-            if result['status'] != 'GREEN':
-                result['recommendations'].extend([
-                    "Connection Configuration Recommendations:",
-                    "",
-                    "1. Consider increasing max_connections for MySQL 8.0:",
-                    "   SET GLOBAL max_connections = <higher_value>;",
-                    "   (Or update parameter group for RDS/Aurora)",
-                    "",
-                    "2. Review application connection pooling:",
-                    "   - Ensure proper connection pool sizing",
-                    "   - Implement connection timeout settings",
-                    "   - Monitor for connection leaks",
-                    "",
-                    "3. Optimize thread cache:",
-                    "   SET GLOBAL thread_cache_size = <optimized_value>;",
-                    "   (Recommended: 8 + (max_connections / 100))",
-                    "",
-                    "4. Test with caching_sha2_password plugin:",
-                    "   - MySQL 8.0 default authentication may impact connection setup time",
-                    "   - Test application connection behavior in non-production first"
-                ])
+            # Calculate totals; the listed groups cover every connection unless the limit was hit
+            if len(connection_stats) < CONNECTION_GROUPS_REPORTED:
+                total_conn = sum(map(itemgetter('connection_count'), connection_stats))
+                total_sleeping = sum(map(itemgetter('sleeping'), connection_stats))
             else:
-                result['recommendations'].append(
-                    f"Connection configuration is healthy - {result['details']['summary']['usage_percent']}% utilization"
-                )
+                cursor.execute(f"""
+                    SELECT
+                        COUNT(*) as connection_count,
+                        SUM(IF(processlist_command = 'Sleep', 1, 0)) as sleeping
+                    {thread_filter}
+                """)
+                totals = cursor.fetchone()
+                total_conn = totals['connection_count']
+                total_sleeping = totals['sleeping'] or 0
+            result['details']['summary']['total_connections'] = total_conn
+            result['details']['summary']['sleeping_connections'] = total_sleeping
+            result['details']['summary']['active_connections'] = total_conn - total_sleeping
+        except Exception:
+            # performance_schema might not be available
+            pass
+
+        # Get system variables
+        system_vars = self._get_server_vars(cursor, [
+            'max_connections', 'max_user_connections', 'thread_cache_size',
+            'connect_timeout', 'wait_timeout', 'interactive_timeout'
+        ])
+        result['details']['system_variables'] = system_vars
+
+        if system_vars:
+            result['details']['summary']['max_connections'] = system_vars['max_connections']
+
+            # Check connection usage
+            if result['details']['summary']['total_connections'] > 0:
+                usage_percent = (result['details']['summary']['total_connections'] / system_vars['max_connections']) * 100
+                result['details']['summary']['usage_percent'] = round(usage_percent, 2)
+
+                # Warning: >80% capacity
+                if usage_percent > 80:
+                    result['status'] = 'AMBER'
+                    result['issues'].append(
+                        f"Connection usage at {round(usage_percent, 1)}% of max_connections ({result['details']['summary']['total_connections']}/{system_vars['max_connections']})"
+                    )
 
-            return result
-        except Exception as e:
-            return {
-                'name': 'Connection Configuration',
-                'description': 'Reviews connection limits, thread cache, and connection-related settings for optimal upgrade performance',
-                'status': 'ERROR',
-                'issues': [f"Error checking connection configuration: {str(e)}"],
-                'recommendations': ["Verify database permissions"]
-            }
-        finally:
-            if cursor:
-                cursor.close()
\ No newline at end of file
+        # Generate recommendations
+        if result['status'] != 'GREEN':
+            result['recommendations'].extend([
+                "Connection Configuration Recommendations:",
+                "",
+                "1. Consider increasing max_connections for MySQL 8.0:",
+                "   SET GLOBAL max_connections = <higher_value>;",
+                "   (Or update parameter group for RDS/Aurora)",
+                "",
+                "2. Review application connection pooling:",
+                "   - Ensure proper connection pool sizing",
+                "   - Implement connection timeout settings",
+                "   - Monitor for connection leaks",
+                "",
+                "3. Optimize thread cache:",
+                "   SET GLOBAL thread_cache_size = <optimized_value>;",
+                "   (Recommended: 8 + (max_connections / 100))",
+                "",
+                "4. Test with caching_sha2_password plugin:",
+                "   - MySQL 8.0 default authentication may impact connection setup time",
+                "   - Test application connection behavior in non-production first"
+            ])
+        else:
+            result['recommendations'].append(
+                f"Connection configuration is healthy - {result['details']['summary']['usage_percent']}% utilization"
+            )
+
+        return result
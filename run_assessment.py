@@ -2,45 +2,34 @@
 
 import os
 import sys
-import yaml
 import json
 import argparse
+import functools
+import re
 from datetime import datetime, date
 from decimal import Decimal
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+try:
+    import orjson  # optional: much faster JSON report writing
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO,
-                   format='%(asctime)s - %(levelname)s - %(message)s')
+                   format='%(asctime)s - %(threadName)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from aurora_upgrade_checker import AuroraUpgradeChecker
-from src.utils.aws_utils import AWSUtils
+from aurora_upgrade_checker import AuroraUpgradeChecker, MAX_CHECK_WORKERS, METADATA_CACHE_TTL_SECONDS
 from src.utils.config_loader import ConfigLoader
 
-# Add this class after the imports
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if isinstance(obj, Decimal):
-            return float(obj)
-        if isinstance(obj, set):
-            return list(obj)
-        if isinstance(obj, bytes):
-            return obj.decode('utf-8')
-        try:
-            return super().default(obj)
-        except Exception as e:
-            return str(obj) # Fallback to string representation
-
 def set_to_list(obj):
     """Convert sets to lists recursively in nested structures"""
-    from decimal import Decimal
-    
     if isinstance(obj, set):
         return list(obj)
     elif isinstance(obj, dict):
@@ -51,63 +40,76 @@ def set_to_list(obj):
         return float(obj)
     elif isinstance(obj, (datetime, date)):
         return obj.isoformat()
+    elif isinstance(obj, bytes):
+        return obj.decode('utf-8')
     
     return obj
 
+def json_default(obj):
+    """Fallback for values set_to_list leaves that JSON can't represent"""
+    return str(obj)
+
+def write_json_report(results, path):
+    """Write results (already passed through set_to_list) as indented JSON, via orjson if installed"""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(results, default=json_default,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the json module handles anything
+            data = None
+        if data is not None:
+            with open(path, 'wb') as f:
+                f.write(data)
+            return
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2, default=json_default)
+
+# Features whose recommendations are dropped from every report (GTID and Parallel Query)
+FILTERED_FEATURE_RE = re.compile(r"gtid|parallel[ _]query", re.IGNORECASE)
+
+# &, < and > to entities in one str.translate pass, for report text placed in HTML
+HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# {{key}} placeholders in templates/enterprise_report_template.html
+TEMPLATE_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+def _without_filtered(items):
+    """Return the strings in items that don't mention a filtered feature"""
+    search = FILTERED_FEATURE_RE.search
+    return [item for item in items if not search(item)]
+
+
 def filter_recommendations(assessment_results):
     """Remove specific feature recommendations (GTID and Parallel Query) from assessment results"""
     
-    # Keywords to filter out
-    filter_keywords = ['gtid', 'parallel query', 'parallel_query']
-    
     # Filter detailed summary
     detailed_summary = assessment_results.get('detailed_summary', {})
     
     # Filter common issues
     if 'common_issues' in detailed_summary:
-        detailed_summary['common_issues'] = [
-            issue for issue in detailed_summary['common_issues'] 
-            if not any(keyword in issue.lower() for keyword in filter_keywords)
-        ]
+        detailed_summary['common_issues'] = _without_filtered(detailed_summary['common_issues'])
+    
+    upgrade_path = detailed_summary.get('upgrade_path', {})
     
     # Filter immediate actions
-    if 'upgrade_path' in detailed_summary and 'immediate_actions' in detailed_summary['upgrade_path']:
-        detailed_summary['upgrade_path']['immediate_actions'] = [
-            action for action in detailed_summary['upgrade_path']['immediate_actions'] 
-            if not any(keyword in action.lower() for keyword in filter_keywords)
-        ]
+    if 'immediate_actions' in upgrade_path:
+        upgrade_path['immediate_actions'] = _without_filtered(upgrade_path['immediate_actions'])
     
     # Filter parameter changes
-    if 'upgrade_path' in detailed_summary and 'parameter_changes' in detailed_summary['upgrade_path']:
-        for engine_type in ['aurora', 'rds']:
-            if engine_type in detailed_summary['upgrade_path']['parameter_changes']:
-                params = detailed_summary['upgrade_path']['parameter_changes'][engine_type]
-                # Remove filtered parameters
-                keys_to_remove = [key for key in params.keys() 
-                                if any(keyword in key.lower() for keyword in filter_keywords)]
-                for key in keys_to_remove:
-                    del params[key]
-    
-    # Filter pre-upgrade recommendations
-    if 'recommendations' in detailed_summary and 'pre_upgrade' in detailed_summary['recommendations']:
-        detailed_summary['recommendations']['pre_upgrade'] = [
-            rec for rec in detailed_summary['recommendations']['pre_upgrade'] 
-            if not any(keyword in rec.lower() for keyword in filter_keywords)
-        ]
+    parameter_changes = upgrade_path.get('parameter_changes', {})
+    for engine_type in ['aurora', 'rds']:
+        if engine_type in parameter_changes:
+            # Remove filtered parameters
+            parameter_changes[engine_type] = {key: value for key, value in parameter_changes[engine_type].items()
+                                              if not FILTERED_FEATURE_RE.search(key)}
     
-    # Filter during-upgrade recommendations
-    if 'recommendations' in detailed_summary and 'during_upgrade' in detailed_summary['recommendations']:
-        detailed_summary['recommendations']['during_upgrade'] = [
-            rec for rec in detailed_summary['recommendations']['during_upgrade'] 
-            if not any(keyword in rec.lower() for keyword in filter_keywords)
-        ]
-    
-    # Filter post-upgrade recommendations
-    if 'recommendations' in detailed_summary and 'post_upgrade' in detailed_summary['recommendations']:
-        detailed_summary['recommendations']['post_upgrade'] = [
-            rec for rec in detailed_summary['recommendations']['post_upgrade'] 
-            if not any(keyword in rec.lower() for keyword in filter_keywords)
-        ]
+    # Filter pre-, during- and post-upgrade recommendations
+    recommendations = detailed_summary.get('recommendations', {})
+    for phase in ('pre_upgrade', 'during_upgrade', 'post_upgrade'):
+        if phase in recommendations:
+            recommendations[phase] = _without_filtered(recommendations[phase])
     
     # Filter database-specific checks
     for db_id, db_info in assessment_results.get('databases', {}).items():
@@ -115,25 +117,19 @@ def filter_recommendations(assessment_results):
         
         for check in db_info.get('checks', []):
             # Skip checks that are entirely about filtered features
-            if any(keyword in check.get('name', '').lower() for keyword in filter_keywords):
+            if FILTERED_FEATURE_RE.search(check.get('name', '')):
                 continue
                 
             # Filter issues
             if 'issues' in check:
-                check['issues'] = [
-                    issue for issue in check['issues'] 
-                    if not any(keyword in issue.lower() for keyword in filter_keywords)
-                ]
+                check['issues'] = _without_filtered(check['issues'])
             
             # Filter recommendations
             if 'recommendations' in check:
-                check['recommendations'] = [
-                    rec for rec in check['recommendations'] 
-                    if not any(keyword in rec.lower() for keyword in filter_keywords)
-                ]
+                check['recommendations'] = _without_filtered(check['recommendations'])
             
             # Update status if no issues left
-            if not check.get('issues') and check['status'] != 'GREEN':
+            if not check.get('issues') and check['status'] in ('RED', 'AMBER'):
                 check['status'] = 'GREEN'
                 
             filtered_checks.append(check)
@@ -142,7 +138,6 @@ def filter_recommendations(assessment_results):
     
     return assessment_results
 
-
 def generate_summary_report(assessment_results):
     """Generate a comprehensive summary with recommendations"""
     summary = {
@@ -255,15 +250,23 @@ def generate_summary_report(assessment_results):
         for instance in rds_instances
     ]
 
-    # Add immediate actions based on common issues - organized by check
+    # Add immediate actions based on common issues - organized by check, and collect
+    # common issues from the same pass over every check
     immediate_actions = []
-    critical_checks = []
+    common_issues = set()
 
     for db_id, db_info in assessment_results.get('databases', {}).items():
-        for check in db_info.get('checks', []):
-            if check['status'] == 'RED':
+        for check in db_info.get('checks', ()):
+            status = check['status']
+            if status not in ('RED', 'AMBER'):
+                continue
+            issues = check.get('issues', ())
+            common_issues.update(issues)
+
+            # Only the first 10 actions are kept, but every check still feeds common issues
+            if status == 'RED' and len(immediate_actions) < 10:
                 check_name = check.get('name', 'Unknown Check')
-                issues_count = len(check.get('issues', []))
+                issues_count = len(issues)
 
                 # Get the first 1-2 key recommendations (not all)
                 recommendations = check.get('recommendations', [])
@@ -278,19 +281,17 @@ def generate_summary_report(assessment_results):
                     immediate_actions.append(action_text)
 
     summary['upgrade_path']['immediate_actions'] = immediate_actions[:10]  # Limit to top 10
-
-    # Collect common issues
-    common_issues = set()
-    for db_id, db_info in assessment_results.get('databases', {}).items():
-        for check in db_info.get('checks', []):
-            if check['status'] in ['RED', 'AMBER']:
-                for issue in check.get('issues', []):
-                    common_issues.add(issue)
     
     summary['common_issues'] = list(common_issues)
 
     return summary
 
+@functools.lru_cache(maxsize=1)
+def _load_template(path):
+    """Return the template file's text, read once per process"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 def generate_html_report(assessment_results, cluster_id=None, customer_name=None):
     """Generate HTML report using the template with 2 tabs"""
     try:
@@ -314,65 +315,6 @@ def generate_html_report(assessment_results, cluster_id=None, customer_name=None
         else:
             filtered_databases = databases
             
-        # Calculate readiness score
-        total_checks = 0
-        passed_checks = 0
-        red_count = 0
-        amber_count = 0
-        green_count = 0
-        
-        for db_id, db_info in filtered_databases.items():
-            for check in db_info.get('checks', []):
-                total_checks += 1
-                if check.get('status') == 'GREEN':
-                    passed_checks += 1
-                    green_count += 1
-                elif check.get('status') == 'AMBER':
-                    amber_count += 1
-                elif check.get('status') == 'RED':
-                    red_count += 1
-        
-        readiness_score = int((passed_checks / total_checks * 100) if total_checks > 0 else 100)
-        
-        # Calculate percentages for chart
-        # Add these lines before the if total_count > 0: block
-        red_percentage = 0
-        amber_percentage = 0
-        green_percentage = 0
-
-        total_count = red_count + amber_count + green_count
-        if total_count > 0:
-            red_percentage = int((red_count / total_count * 100))
-            amber_percentage = int((amber_count / total_count * 100))
-            green_percentage = int((green_count / total_count * 100))
-    
-            # Ensure at least one segment has width if it has items
-            if red_count > 0 and red_percentage == 0:
-                red_percentage = 1
-            if amber_count > 0 and amber_percentage == 0:
-                amber_percentage = 1
-            if green_count > 0 and green_percentage == 0:
-                green_percentage = 1
-        
-            chart_html = f"""<div class="chart-bar">
-            <div class="bar-segment red" style="width: {red_percentage}%">{red_count}</div>
-            <div class="bar-segment amber" style="width: {amber_percentage}%">{amber_count}</div>
-            <div class="bar-segment green" style="width: {green_percentage}%">{green_count}</div>
-        </div>"""
-        else:
-            chart_html = """<div class="empty-chart-message">No issues found - all checks passed!</div>"""
-        
-        # Estimate effort based on issue counts
-        if red_count > 5 or total_count > 15:
-            effort_level = "high"
-            effort_hours = f"{red_count * 8 + amber_count * 4 + green_count}"
-        elif red_count > 0 or amber_count > 5:
-            effort_level = "medium"
-            effort_hours = f"{red_count * 6 + amber_count * 3 + green_count}"
-        else:
-            effort_level = "low"
-            effort_hours = f"{amber_count * 2 + green_count}"
-            
         # Count database objects with issues
         tables_count = 0
         tables_with_issues = 0
@@ -383,47 +325,54 @@ def generate_html_report(assessment_results, cluster_id=None, customer_name=None
         triggers_count = 0
         triggers_with_issues = 0
         
+        # Generate findings content in new enterprise format, collected as parts and joined once
+        findings_parts = []
+
+        # Map status to icons
+        status_icons = {
+            'red': '🔴',
+            'amber': '🟡',
+            'green': '🟢',
+            'skipped': '⚪'
+        }
+
+        # One pass over the checks: status counts, object counts and the findings HTML
+        status_counts = Counter()
         for db_id, db_info in filtered_databases.items():
-            # Extract schema info from check results
-            for check in db_info.get('checks', []):
-                if check.get('name') == 'Schema Information':
+            # Show ALL checks, not just ones with issues
+            for check in db_info.get('checks', ()):
+                status = check.get('status')
+                name = check.get('name')
+                issues = check.get('issues') or ()
+                recommendations = check.get('recommendations') or ()
+                status_counts[status] += 1
+
+                # Extract schema info from check results
+                if name == 'Schema Information':
                     tables_count = check.get('details', {}).get('summary', {}).get('total_tables', 0)
                     # Estimate tables with issues based on issues list
-                    tables_with_issues = len([i for i in check.get('issues', []) if 'table' in i.lower()])
-                elif check.get('name') == 'Triggers and Views Check':
+                    tables_with_issues = sum(1 for i in issues if 'table' in i.lower())
+                elif name == 'Triggers and Views Check':
                     triggers_count = check.get('details', {}).get('summary', {}).get('trigger_count', 0)
                     views_count = check.get('details', {}).get('summary', {}).get('view_count', 0)
                     # Estimate issues based on status
-                    if check.get('status') != 'GREEN':
+                    if status != 'GREEN':
                         triggers_with_issues = triggers_count // 2  # Rough estimate
                         views_with_issues = views_count // 2  # Rough estimate
-                elif check.get('name') == 'Deprecated Features Check':
+                elif name == 'Deprecated Features Check':
                     # Try to extract stored procedure count
                     procedures_count = len(check.get('details', {}).get('functions_and_syntax', {}).get('affected_objects', []))
                     procedures_with_issues = procedures_count  # All are affected if listed
-        
-        # Generate findings content in new enterprise format
-        findings_content = ""
 
-        # Map status to icons
-        status_icons = {
-            'red': '🔴',
-            'amber': '🟡',
-            'green': '🟢'
-        }
-
-        for db_id, db_info in filtered_databases.items():
-            # Show ALL checks, not just ones with issues
-            for check in db_info.get('checks', []):
                 check_status = check.get('status', 'UNKNOWN').lower()
                 check_description = check.get('description', '')
                 check_name = check.get('name', 'Unknown Check')
 
                 # HTML escape all text content to prevent special characters from breaking HTML
-                escaped_name = check_name.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                escaped_desc = check_description.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                escaped_name = check_name.translate(HTML_ESCAPE_TABLE)
+                escaped_desc = check_description.translate(HTML_ESCAPE_TABLE)
 
-                findings_content += f"""<div class="check-item {check_status}">
+                findings_parts.append(f"""<div class="check-item {check_status}">
     <div class="check-header" onclick="toggleCheck(this)">
         <div class="check-icon {check_status}">
             {status_icons.get(check_status, '●')}
@@ -436,44 +385,103 @@ def generate_html_report(assessment_results, cluster_id=None, customer_name=None
         <div class="expand-icon">▼</div>
     </div>
     <div class="check-content">
-"""
+""")
                 # Show issues if any
-                if check.get('issues'):
-                    findings_content += """        <div class="issues-section">
+                if issues:
+                    findings_parts.append("""        <div class="issues-section">
             <div class="issues-title">⚠️ Issues Detected</div>
             <ul class="issues-list">
-"""
-                    for issue in check.get('issues', []):
+""")
+                    for issue in issues:
                         # HTML escape to prevent <schema>, <table>, etc. from being interpreted as tags
-                        escaped_issue = issue.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        findings_content += f"                <li>{escaped_issue}</li>\n"
-                    findings_content += """            </ul>
+                        escaped_issue = issue.translate(HTML_ESCAPE_TABLE)
+                        findings_parts.append(f"                <li>{escaped_issue}</li>\n")
+                    findings_parts.append("""            </ul>
         </div>
-"""
+""")
+                elif check_status == 'skipped':
+                    # Version-gated check that didn't run - say so rather than report a pass
+                    reason = str(check.get('details', {}).get('reason', 'Not applicable to this version'))
+                    findings_parts.append(f"""        <div class="skipped-message">
+            <span>–</span>
+            <span>Not applicable - {reason.translate(HTML_ESCAPE_TABLE)}; this check was not run</span>
+        </div>
+""")
                 else:
                     # No issues - show success message
-                    findings_content += """        <div class="success-message">
+                    findings_parts.append("""        <div class="success-message">
             <span>✓</span>
             <span>No issues found - this check passed successfully</span>
         </div>
-"""
+""")
 
                 # Show recommendations if any
-                if check.get('recommendations'):
-                    findings_content += """        <div class="recommendations-section">
+                if recommendations:
+                    findings_parts.append("""        <div class="recommendations-section">
             <div class="recommendations-title">💡 Recommendations</div>
             <ul class="recommendations-list">
-"""
-                    for rec in check.get('recommendations', []):
+""")
+                    for rec in recommendations:
                         # HTML escape to prevent <schema>, <table>, etc. from being interpreted as tags
-                        escaped_rec = rec.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        findings_content += f"                <li>{escaped_rec}</li>\n"
-                    findings_content += """            </ul>
+                        escaped_rec = rec.translate(HTML_ESCAPE_TABLE)
+                        findings_parts.append(f"                <li>{escaped_rec}</li>\n")
+                    findings_parts.append("""            </ul>
         </div>
-"""
-                findings_content += """    </div>
+""")
+                findings_parts.append("""    </div>
 </div>
-"""
+""")
+
+        findings_content = "".join(findings_parts)
+
+        # Calculate readiness score; checks that do not apply to this server version
+        # (SKIPPED) don't count toward readiness
+        red_count = status_counts['RED']
+        amber_count = status_counts['AMBER']
+        green_count = status_counts['GREEN']
+        total_checks = sum(status_counts.values()) - status_counts['SKIPPED']
+        passed_checks = green_count
+        
+        readiness_score = int((passed_checks / total_checks * 100) if total_checks > 0 else 100)
+        
+        # Calculate percentages for chart
+        # Add these lines before the if total_count > 0: block
+        red_percentage = 0
+        amber_percentage = 0
+        green_percentage = 0
+
+        total_count = red_count + amber_count + green_count
+        if total_count > 0:
+            red_percentage = int((red_count / total_count * 100))
+            amber_percentage = int((amber_count / total_count * 100))
+            green_percentage = int((green_count / total_count * 100))
+    
+            # Ensure at least one segment has width if it has items
+            if red_count > 0 and red_percentage == 0:
+                red_percentage = 1
+            if amber_count > 0 and amber_percentage == 0:
+                amber_percentage = 1
+            if green_count > 0 and green_percentage == 0:
+                green_percentage = 1
+        
+            chart_html = f"""<div class="chart-bar">
+            <div class="bar-segment red" style="width: {red_percentage}%">{red_count}</div>
+            <div class="bar-segment amber" style="width: {amber_percentage}%">{amber_count}</div>
+            <div class="bar-segment green" style="width: {green_percentage}%">{green_count}</div>
+        </div>"""
+        else:
+            chart_html = """<div class="empty-chart-message">No issues found - all checks passed!</div>"""
+        
+        # Estimate effort based on issue counts
+        if red_count > 5 or total_count > 15:
+            effort_level = "high"
+            effort_hours = f"{red_count * 8 + amber_count * 4 + green_count}"
+        elif red_count > 0 or amber_count > 5:
+            effort_level = "medium"
+            effort_hours = f"{red_count * 6 + amber_count * 3 + green_count}"
+        else:
+            effort_level = "low"
+            effort_hours = f"{amber_count * 2 + green_count}"
 
         # No immediate actions section - users will click Critical metric card instead
         immediate_actions_html = ""
@@ -497,14 +505,12 @@ def generate_html_report(assessment_results, cluster_id=None, customer_name=None
             cluster_id_display = cluster_id
             version_display = databases[cluster_id].get('version', 'Unknown')
         elif filtered_databases:
-            first_db = list(filtered_databases.values())[0]
-            cluster_id_display = list(filtered_databases.keys())[0]
+            cluster_id_display, first_db = next(iter(filtered_databases.items()))
             version_display = first_db.get('version', 'Unknown')
 
         # Read the HTML template from file
         template_path = os.path.join('templates', 'enterprise_report_template.html')
-        with open(template_path, 'r') as f:
-            html_template = f.read()
+        html_template = _load_template(template_path)
         
         # Prepare customer banner HTML if customer name provided
         customer_banner_html = ''
@@ -534,12 +540,14 @@ def generate_html_report(assessment_results, cluster_id=None, customer_name=None
             'score_dashoffset': score_dashoffset,
             'red_count': red_count,
             'amber_count': amber_count,
-            'green_count': green_count
+            'green_count': green_count,
+            'skipped_count': status_counts['SKIPPED']
         }
 
-        # Replace placeholders in template
-        for key, value in report_data.items():
-            html_template = html_template.replace(f'{{{{{key}}}}}', str(value))
+        # Replace placeholders in template in one pass; unknown placeholders are left as they are
+        html_template = TEMPLATE_PLACEHOLDER_RE.sub(
+            lambda m: str(report_data[m.group(1)]) if m.group(1) in report_data else m.group(0),
+            html_template)
         
         # Save the report
         html_path = os.path.join(reports_dir, 'upgrade_assessment.html')
@@ -586,33 +594,28 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Immediate Actions Required
 """
+    md_parts = [md]
     
-    for action in summary['upgrade_path']['immediate_actions']:
-        md += f"- {action}\n"
+    md_parts.extend(f"- {action}\n" for action in summary['upgrade_path']['immediate_actions'])
     
-    md += "\n## Upgrade Order\n"
-    for step in summary['upgrade_path']['upgrade_order']:
-        md += f"- {step}\n"
+    md_parts.append("\n## Upgrade Order\n")
+    md_parts.extend(f"- {step}\n" for step in summary['upgrade_path']['upgrade_order'])
     
-    md += "\n## Common Issues Found\n"
-    for issue in summary['common_issues']:
-        md += f"- {issue}\n"
+    md_parts.append("\n## Common Issues Found\n")
+    md_parts.extend(f"- {issue}\n" for issue in summary['common_issues'])
     
-    md += "\n## Recommendations\n"
+    md_parts.append("\n## Recommendations\n")
     
-    md += "\n### Pre-Upgrade Tasks\n"
-    for rec in summary['recommendations']['pre_upgrade']:
-        md += f"- {rec}\n"
+    md_parts.append("\n### Pre-Upgrade Tasks\n")
+    md_parts.extend(f"- {rec}\n" for rec in summary['recommendations']['pre_upgrade'])
     
-    md += "\n### During Upgrade\n"
-    for rec in summary['recommendations']['during_upgrade']:
-        md += f"- {rec}\n"
+    md_parts.append("\n### During Upgrade\n")
+    md_parts.extend(f"- {rec}\n" for rec in summary['recommendations']['during_upgrade'])
     
-    md += "\n### Post-Upgrade Tasks\n"
-    for rec in summary['recommendations']['post_upgrade']:
-        md += f"- {rec}\n"
+    md_parts.append("\n### Post-Upgrade Tasks\n")
+    md_parts.extend(f"- {rec}\n" for rec in summary['recommendations']['post_upgrade'])
     
-    return md
+    return "".join(md_parts)
 
 def get_credentials(aws_utils, config_loader, cluster_identifier, endpoint, port=3306):
     """
@@ -692,6 +695,35 @@ def get_credentials(aws_utils, config_loader, cluster_identifier, endpoint, port
         logger.error(f"Failed to get credentials for {cluster_identifier}: {str(e)}")
         raise
 
+def assess_database(db, aws_utils, config_loader, pool_size, metadata_cache_ttl):
+    """
+    Run every check against one database and return its results.
+
+    Runs on an assessment worker thread. A checker holds per-run state and a connection
+    pool for one target, so each database gets its own and closes it when done.
+    """
+    logger.info(f"\n{'='*60}")
+    logger.info(f"Assessing {db['type']}: {db['identifier']}")
+    logger.info(f"Endpoint: {db['endpoint']}")
+    logger.info(f"Version: {db['version']}")
+    logger.info(f"{'='*60}")
+
+    # Get credentials for this database
+    credentials = get_credentials(
+        aws_utils,
+        config_loader,
+        db['identifier'],
+        db['endpoint'],
+        db.get('port', 3306)
+    )
+
+    # Run the assessment
+    checker = AuroraUpgradeChecker(pool_size=pool_size, metadata_cache_ttl=metadata_cache_ttl)
+    try:
+        return checker.run_checks(db, credentials)
+    finally:
+        checker.close()
+
 def main():
     try:
         # Parse command line arguments
@@ -701,6 +733,12 @@ def main():
         parser.add_argument('--region', type=str, help='AWS region (overrides config)')
         parser.add_argument('--profile', type=str, help='AWS CLI profile (overrides config)')
         parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+        parser.add_argument('--pool-size', type=int, default=MAX_CHECK_WORKERS,
+                            help=f'Database connections (and concurrent checks) per assessment when '
+                                 f'assessment.parallel_checks is on (default: {MAX_CHECK_WORKERS})')
+        parser.add_argument('--metadata-cache-ttl', type=int, default=METADATA_CACHE_TTL_SECONDS,
+                            help=f'Seconds to reuse a database\'s schema metadata between assessments in one '
+                                 f'process; 0 disables (default: {METADATA_CACHE_TTL_SECONDS})')
         args = parser.parse_args()
 
         # Set logging level
@@ -721,16 +759,23 @@ def main():
         region = args.region or config_loader.get_region()
         profile = args.profile or config_loader.get_profile()
 
-        # Initialize utilities
+        # Initialize utilities; boto3 is only imported once arguments and config have parsed,
+        # so --help and config errors return without paying for it
+        from src.utils.aws_utils import AWSUtils
         logger.info(f"Initializing AWS utilities (region: {region}, profile: {profile or 'default'})")
-        aws_utils = AWSUtils(region=region, profile=profile)
-        checker = AuroraUpgradeChecker()
+        aws_utils = AWSUtils(region=region, profile=profile,
+                             max_workers=config_loader.get_max_workers())
 
         logger.info("Discovering MySQL 5.7 databases...")
 
+        # Clusters and instances are separate API walks, so list them at the same time
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix='discover') as executor:
+            clusters_future = executor.submit(aws_utils.get_aurora_clusters)
+            instances_future = executor.submit(aws_utils.get_rds_instances)
+
         # Get clusters (Aurora)
         try:
-            all_clusters = aws_utils.get_aurora_clusters()
+            all_clusters = clusters_future.result()
             logger.info(f"Found {len(all_clusters)} Aurora MySQL 5.7.x clusters")
         except Exception as e:
             logger.error(f"Failed to discover Aurora clusters: {str(e)}")
@@ -738,16 +783,16 @@ def main():
 
         # Get RDS instances
         try:
-            all_instances = aws_utils.get_rds_instances()
+            all_instances = instances_future.result()
             logger.info(f"Found {len(all_instances)} RDS MySQL 5.7.x instances")
         except Exception as e:
             logger.error(f"Failed to discover RDS instances: {str(e)}")
             all_instances = []
 
         # Combine all databases
-        databases = all_clusters + all_instances
+        all_databases = all_clusters + all_instances
 
-        if not databases:
+        if not all_databases:
             logger.error("No MySQL 5.7.x databases found in the specified region.")
             logger.error("Please check:")
             logger.error("  1. AWS credentials are configured correctly")
@@ -759,11 +804,13 @@ def main():
         # If cluster ID is provided, filter databases
         if args.cluster:
             logger.info(f"Filtering to assess only: {args.cluster}")
-            databases = [db for db in databases if db['identifier'] == args.cluster]
+            databases = [db for db in all_databases if db['identifier'] == args.cluster]
             if not databases:
                 logger.error(f"Cluster/instance '{args.cluster}' not found.")
-                logger.error(f"Available databases: {[db['identifier'] for db in (all_clusters + all_instances)]}")
+                logger.error(f"Available databases: {[db['identifier'] for db in all_databases]}")
                 sys.exit(1)
+        else:
+            databases = all_databases
 
         logger.info(f"Will assess {len(databases)} database(s)")
 
@@ -779,44 +826,38 @@ def main():
             'generated_at': datetime.now().isoformat()
         }
 
-        for db in databases:
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Assessing {db['type']}: {db['identifier']}")
-            logger.info(f"Endpoint: {db['endpoint']}")
-            logger.info(f"Version: {db['version']}")
-            logger.info(f"{'='*60}")
-
-            try:
-                # Get credentials for this database
-                credentials = get_credentials(
-                    aws_utils,
-                    config_loader,
-                    db['identifier'],
-                    db['endpoint'],
-                    db.get('port', 3306)
-                )
-
-                # Run the assessment
-                results = checker.run_checks(db, credentials)
-                assessment_results['databases'][db['identifier']] = results
-                
-                # Update summary
-                if results.get('summary', {}).get('status') == 'GREEN':
-                    assessment_results['summary']['green_databases'] += 1
-                elif results.get('summary', {}).get('status') == 'AMBER':
-                    assessment_results['summary']['amber_databases'] += 1
-                elif results.get('summary', {}).get('status') == 'RED':
-                    assessment_results['summary']['red_databases'] += 1
-                else:
-                    assessment_results['summary']['error_databases'] += 1
-                    
-            except Exception as e:
-                logger.error(f"Error assessing {db['identifier']}: {str(e)}")
-                assessment_results['databases'][db['identifier']] = {
-                    'status': 'ERROR',
-                    'message': str(e)
-                }
-                assessment_results['summary']['error_databases'] += 1
+        # Databases are independent, so assess several at once; each gets its own checker
+        # (and connection pool), and results are recorded in discovery order
+        max_workers = max(1, min(config_loader.get_max_workers(), len(databases)))
+        # With parallel_checks off, each database's checks run one at a time on one connection
+        pool_size = args.pool_size if config_loader.get_parallel_checks() else 1
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='assess') as executor:
+            futures = [
+                executor.submit(assess_database, db, aws_utils, config_loader,
+                                pool_size, args.metadata_cache_ttl)
+                for db in databases
+            ]
+            for db, future in zip(databases, futures):
+                try:
+                    assessment_results['databases'][db['identifier']] = future.result()
+                except Exception as e:
+                    logger.error(f"Error assessing {db['identifier']}: {str(e)}")
+                    assessment_results['databases'][db['identifier']] = {
+                        'status': 'ERROR',
+                        'message': str(e)
+                    }
+
+        # Update summary; failed assessments and any other status count as errors
+        status_counts = Counter(
+            results.get('summary', {}).get('status')
+            for results in assessment_results['databases'].values()
+        )
+        summary = assessment_results['summary']
+        summary['green_databases'] = status_counts['GREEN']
+        summary['amber_databases'] = status_counts['AMBER']
+        summary['red_databases'] = status_counts['RED']
+        summary['error_databases'] = (len(assessment_results['databases'])
+                                      - status_counts['GREEN'] - status_counts['AMBER'] - status_counts['RED'])
 
         # Generate comprehensive summary
         assessment_results['detailed_summary'] = generate_summary_report(assessment_results)
@@ -832,8 +873,7 @@ def main():
 
         # Save JSON report
         json_path = os.path.join('reports', 'upgrade_assessment.json')
-        with open(json_path, 'w') as f:
-            json.dump(serializable_results, f, indent=2, cls=CustomJSONEncoder)
+        write_json_report(serializable_results, json_path)
 
         # Generate HTML report
         try:
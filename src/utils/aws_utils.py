@@ -11,9 +11,32 @@ This module provides functionality to:
 import boto3
 import json
 import socket
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Any
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, EndpointConnectionError
 
+# RDS Describe* filters accept at most this many values each
+RDS_FILTER_MAX_VALUES = 100
+
+# Engines discovered as upgrade candidates; passed to RDS as an engine filter too
+CLUSTER_ENGINES = frozenset({'aurora-mysql', 'mysql'})
+INSTANCE_ENGINES = frozenset({'mysql'})
+
+# Concurrent list_tags_for_resource calls when filtering discovery by tags
+TAG_LOOKUP_WORKERS = 10
+
+# Adaptive retry backs off client-side when discovery runs into API throttling;
+# keep-alive lets pooled HTTPS connections be reused across calls
+BOTO_CLIENT_CONFIG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'}, tcp_keepalive=True)
+
+
+def _chunks(items: List[str], size: int) -> Iterator[List[str]]:
+    """Yield consecutive slices of items holding at most size entries each."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
 
 class AWSUtilsError(Exception):
     """Base exception for AWS Utils."""
@@ -45,25 +68,34 @@ class AWSUtils:
     3. Direct configuration (config file)
     """
 
-    def __init__(self, region: str = 'us-east-1', profile: Optional[str] = None):
+    def __init__(self, region: str = 'us-east-1', profile: Optional[str] = None,
+                 max_workers: int = 5):
         """
         Initialize AWS utilities.
 
         Args:
             region: AWS region (default: us-east-1)
             profile: AWS CLI profile name (optional)
+            max_workers: Number of databases assessed at once, used to size the
+                HTTP connection pools of the shared clients (default: 5)
         """
         self.region = region
         self.profile = profile
+        # Resource tags keyed by ARN, shared by every discovery call on this instance
+        self._tag_cache: Dict[str, Dict[str, str]] = {}
+        self._tag_cache_lock = threading.Lock()
 
         try:
             session_kwargs = {'region_name': region}
             if profile:
                 session_kwargs['profile_name'] = profile
 
+            client_config = BOTO_CLIENT_CONFIG.merge(
+                Config(max_pool_connections=max(TAG_LOOKUP_WORKERS, max_workers * 2))
+            )
             self.session = boto3.Session(**session_kwargs)
-            self.rds_client = self.session.client('rds')
-            self.secrets_client = self.session.client('secretsmanager')
+            self.rds_client = self.session.client('rds', config=client_config)
+            self.secrets_client = self.session.client('secretsmanager', config=client_config)
 
         except NoCredentialsError as e:
             raise AuthenticationError(
@@ -87,46 +119,23 @@ class AWSUtils:
         Raises:
             ClusterDiscoveryError: If cluster discovery fails
         """
-        clusters = []
-
         try:
-            # Describe DB clusters
-            if cluster_ids:
-                # Get specific clusters
-                for cluster_id in cluster_ids:
-                    try:
-                        response = self.rds_client.describe_db_clusters(
-                            DBClusterIdentifier=cluster_id
-                        )
-                        clusters.extend(response.get('DBClusters', []))
-                    except ClientError as e:
-                        if e.response['Error']['Code'] != 'DBClusterNotFoundFault':
-                            raise
-            else:
-                # Get all clusters with pagination
-                paginator = self.rds_client.get_paginator('describe_db_clusters')
-                for page in paginator.paginate():
-                    clusters.extend(page.get('DBClusters', []))
-
-            # Filter for Aurora MySQL 5.7.x clusters
-            aurora_mysql_clusters = []
-            for cluster in clusters:
-                engine = cluster.get('Engine', '')
-                version = cluster.get('EngineVersion', '')
-
-                # Only include Aurora MySQL and MySQL 5.7.x
-                if ('aurora-mysql' in engine or engine == 'mysql') and version.startswith('5.7'):
-                    cluster_info = self._extract_cluster_info(cluster, 'AURORA' if 'aurora' in engine else 'RDS')
-
-                    # Apply tag filtering if specified
-                    if tags:
-                        cluster_tags = self._get_cluster_tags(cluster['DBClusterArn'])
-                        if all(cluster_tags.get(k) == v for k, v in tags.items()):
-                            aurora_mysql_clusters.append(cluster_info)
-                    else:
-                        aurora_mysql_clusters.append(cluster_info)
-
-            return aurora_mysql_clusters
+            # Filter for Aurora MySQL and MySQL 5.7.x clusters as pages arrive
+            candidates = [
+                cluster for cluster in self._describe('describe_db_clusters', 'DBClusters',
+                                                      'db-cluster-id', cluster_ids, CLUSTER_ENGINES)
+                if cluster.get('Engine', '') in CLUSTER_ENGINES
+                and cluster.get('EngineVersion', '').startswith('5.7')
+            ]
+
+            # Apply tag filtering if specified
+            if tags:
+                candidates = self._filter_by_tags(candidates, 'DBClusterArn', tags)
+
+            return [
+                self._extract_cluster_info(c, 'AURORA' if 'aurora' in c.get('Engine', '') else 'RDS')
+                for c in candidates
+            ]
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -152,46 +161,20 @@ class AWSUtils:
         Raises:
             ClusterDiscoveryError: If instance discovery fails
         """
-        instances = []
-
         try:
-            # Describe DB instances
-            if instance_ids:
-                # Get specific instances
-                for instance_id in instance_ids:
-                    try:
-                        response = self.rds_client.describe_db_instances(
-                            DBInstanceIdentifier=instance_id
-                        )
-                        instances.extend(response.get('DBInstances', []))
-                    except ClientError as e:
-                        if e.response['Error']['Code'] != 'DBInstanceNotFound':
-                            raise
-            else:
-                # Get all instances with pagination
-                paginator = self.rds_client.get_paginator('describe_db_instances')
-                for page in paginator.paginate():
-                    instances.extend(page.get('DBInstances', []))
-
-            # Filter for MySQL 5.7.x instances (non-Aurora)
-            mysql_instances = []
-            for instance in instances:
-                engine = instance.get('Engine', '')
-                version = instance.get('EngineVersion', '')
-
-                # Only include MySQL 5.7.x (not Aurora)
-                if engine == 'mysql' and version.startswith('5.7'):
-                    instance_info = self._extract_instance_info(instance)
-
-                    # Apply tag filtering if specified
-                    if tags:
-                        instance_tags = self._get_instance_tags(instance['DBInstanceArn'])
-                        if all(instance_tags.get(k) == v for k, v in tags.items()):
-                            mysql_instances.append(instance_info)
-                    else:
-                        mysql_instances.append(instance_info)
-
-            return mysql_instances
+            # Filter for MySQL 5.7.x instances (not Aurora) as pages arrive
+            candidates = [
+                instance for instance in self._describe('describe_db_instances', 'DBInstances',
+                                                        'db-instance-id', instance_ids, INSTANCE_ENGINES)
+                if instance.get('Engine', '') in INSTANCE_ENGINES
+                and instance.get('EngineVersion', '').startswith('5.7')
+            ]
+
+            # Apply tag filtering if specified
+            if tags:
+                candidates = self._filter_by_tags(candidates, 'DBInstanceArn', tags)
+
+            return [self._extract_instance_info(i) for i in candidates]
 
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -304,6 +287,26 @@ class AWSUtils:
         except Exception as e:
             raise ConnectivityError(f"Connectivity test failed: {str(e)}")
 
+    def _describe(self, operation: str, result_key: str, id_filter: str,
+                  ids: Optional[List[str]], engines: frozenset) -> Iterator[Dict[str, Any]]:
+        """
+        Yield resources from a paginated RDS Describe* call, restricted to the given engines.
+
+        Specific IDs are requested up to RDS_FILTER_MAX_VALUES per call; IDs that
+        don't exist are simply absent from the response.
+        """
+        paginator = self.rds_client.get_paginator(operation)
+        engine_filter = {'Name': 'engine', 'Values': sorted(engines)}
+        if ids:
+            filter_sets = [[{'Name': id_filter, 'Values': chunk}, engine_filter]
+                           for chunk in _chunks(list(ids), RDS_FILTER_MAX_VALUES)]
+        else:
+            filter_sets = [[engine_filter]]
+
+        for filters in filter_sets:
+            for page in paginator.paginate(Filters=filters):
+                yield from page.get(result_key, [])
+
     def _extract_cluster_info(self, cluster: Dict[str, Any], cluster_type: str) -> Dict[str, Any]:
         """Extract relevant information from cluster description."""
         return {
@@ -343,16 +346,40 @@ class AWSUtils:
             'arn': instance.get('DBInstanceArn')
         }
 
+    def _filter_by_tags(self, resources: List[Dict[str, Any]], arn_key: str,
+                        tags: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Keep the resources whose tags include every key/value pair in tags."""
+        resource_tags = self._get_resource_tags([r[arn_key] for r in resources])
+        tag_items = tuple(tags.items())
+        return [
+            r for r in resources
+            if all(resource_tags[r[arn_key]].get(k) == v for k, v in tag_items)
+        ]
+
+    def _get_resource_tags(self, arns: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get tags for several resources, fetching uncached ARNs concurrently."""
+        with self._tag_cache_lock:
+            missing = [arn for arn in dict.fromkeys(arns) if arn not in self._tag_cache]
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(TAG_LOOKUP_WORKERS, len(missing))) as executor:
+                fetched = dict(zip(missing, executor.map(self._list_tags, missing)))
+            with self._tag_cache_lock:
+                self._tag_cache.update(fetched)
+
+        with self._tag_cache_lock:
+            return {arn: self._tag_cache[arn] for arn in arns}
+
     def _get_cluster_tags(self, arn: str) -> Dict[str, str]:
         """Get tags for a cluster."""
-        try:
-            response = self.rds_client.list_tags_for_resource(ResourceName=arn)
-            return {tag['Key']: tag['Value'] for tag in response.get('TagList', [])}
-        except Exception:
-            return {}
+        return self._get_resource_tags([arn])[arn]
 
     def _get_instance_tags(self, arn: str) -> Dict[str, str]:
         """Get tags for an instance."""
+        return self._get_resource_tags([arn])[arn]
+
+    def _list_tags(self, arn: str) -> Dict[str, str]:
+        """Fetch tags for a resource from the RDS API."""
         try:
             response = self.rds_client.list_tags_for_resource(ResourceName=arn)
             return {tag['Key']: tag['Value'] for tag in response.get('TagList', [])}
@@ -4,7 +4,6 @@ Configuration loader for Aurora Upgrade Checker.
 Handles loading, validation, and access to configuration settings from YAML files.
 """
 
-import yaml
 import os
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -54,9 +53,13 @@ class ConfigLoader:
         if not self.config_path.exists():
             raise ConfigError(f"Configuration file not found: {self.config_path}")
 
+        # Imported here so CLI paths that never load a config (--help) skip it
+        import yaml
+
         try:
             with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                # libyaml's C loader parses several times faster; fall back where PyYAML was built without it
+                config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
             if config is None:
                 raise ConfigError("Configuration file is empty")